@@ -0,0 +1,17 @@
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from database import init_schema
+from celery_app import celery_app as _celery_app  # type: ignore # noqa: F401 — set configured app as current
+from ports.api.routes import main_router
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    init_schema()
+    yield
+
+
+app = FastAPI(title="Multilayer Perceptron API", lifespan=lifespan)
+app.include_router(main_router)
@@ -99,6 +99,25 @@ def finite_input_vector_validator(max_elements: int) -> AfterValidator:
         return v
 
     return AfterValidator(_validate)
+
+
+def finite_input_matrix_validator(max_rows: int, max_row_len: int) -> AfterValidator:
+    """Like :func:`finite_input_vector_validator` for a list of rows; rows must have equal length."""
+
+    def _validate(m: List[List[float]]) -> List[List[float]]:
+        if len(m) > max_rows:
+            raise ValueError(f"input_matrix must have at most {max_rows} rows")
+        for r, row in enumerate(m):
+            if len(row) > max_row_len:
+                raise ValueError(f"row {r} must have at most {max_row_len} elements")
+            if len(row) != len(m[0]):
+                raise ValueError(f"row {r} has {len(row)} elements, row 0 has {len(m[0])}")
+            for i, x in enumerate(row):
+                if not math.isfinite(float(x)):
+                    raise ValueError(f"non-finite value at row {r}, index {i}")
+        return m
+
+    return AfterValidator(_validate)
  
 
 
@@ -121,6 +140,12 @@ class Config:
     CELERY_QUEUE_KEY = "celery"
     POLL_INTERVAL_SECONDS = 1.0
 
+    # Compiled models for get_answer, per process (LRU by total array size)
+    MODEL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+    # Parsed CSV datasets kept per process (API and Celery workers), LRU by array size
+    CSV_COLUMNS_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
 
 
 
@@ -152,6 +177,12 @@ class Config:
             max_value=1_000.0,
         )
 
+        # k in "update only neurons within k * sigma of the winner"; omitted = whole map.
+        KOHONEN_LEARN_NEIGHBOURHOOD_CUTOFF_RANGE = FloatConstraint(
+            min_value=0.5,
+            max_value=10.0,
+        )
+
         KOHONEN_GET_ANSWER_INPUT_VECTOR_MAX_LEN = KOHONEN_INPUT_FEATURES_MAX
 
         # --- Perceptron (architecture size / train loop cost) ---
@@ -170,9 +201,75 @@ class Config:
             max_value=1.0,
         )
 
+        PERCEPTRON_LEARN_BATCH_SIZE_RANGE = NumConstraint(
+            min_value=1,
+            max_value=4096,
+        )
+
+        PERCEPTRON_LEARN_LOSS_EVALUATION_INTERVAL_RANGE = NumConstraint(
+            min_value=1,
+            max_value=100_000,
+        )
+
+        PERCEPTRON_LEARN_LOSS_EVALUATION_SUBSAMPLE_RANGE = NumConstraint(
+            min_value=1,
+            max_value=1_000_000,
+        )
+
+        # 0 disables plateau stopping (``target_loss`` still applies).
+        PERCEPTRON_LEARN_EARLY_STOPPING_PATIENCE_RANGE = NumConstraint(
+            min_value=0,
+            max_value=100_000,
+        )
+
+        PERCEPTRON_LEARN_EARLY_STOPPING_MIN_DELTA_RANGE = FloatConstraint(
+            min_value=0.0,
+            max_value=1_000.0,
+        )
+
+        PERCEPTRON_LEARN_TARGET_LOSS_RANGE = FloatConstraint(
+            min_value=0.0,
+            max_value=1_000.0,
+        )
+
+        PERCEPTRON_LEARN_LR_DECAY_RANGE = FloatConstraint(
+            min_value=1e-8,
+            max_value=1.0,
+        )
+
+        PERCEPTRON_LEARN_LR_STEP_SIZE_RANGE = NumConstraint(
+            min_value=1,
+            max_value=100_000,
+        )
+
+        PERCEPTRON_LEARN_LR_MIN_RANGE = FloatConstraint(
+            min_value=0.0,
+            max_value=1.0,
+        )
+
+        PERCEPTRON_LEARN_LR_WARMUP_EPOCHS_RANGE = NumConstraint(
+            min_value=0,
+            max_value=100_000,
+        )
+
+        # Upper bound only; the service also caps the process count by ``os.cpu_count()``.
+        PERCEPTRON_LEARN_WORKERS_RANGE = NumConstraint(
+            min_value=1,
+            max_value=64,
+        )
+
+        # Number of training runs one sweep may enqueue (GRID size / RANDOM sample size).
+        PERCEPTRON_SWEEP_MAX_RUNS_RANGE = NumConstraint(
+            min_value=1,
+            max_value=256,
+        )
+
         # Raise if your CSV feature count can exceed this (caps ``get_answer`` payload size).
         PERCEPTRON_GET_ANSWER_INPUT_VECTOR_MAX_LEN = 512
 
+        # Rows scored by one ``get_answers`` call (inline ``input_matrix``).
+        PERCEPTRON_GET_ANSWERS_MAX_ROWS = 100_000
+
 
 
 
@@ -3,9 +3,12 @@ from service.auth_service import AuthService
 from service.csv_service import CsvService
 from service.nn_service import NNService
 from service.kohonen_service import KohonenNetworkService
+from service.sweep_service import SweepService
 
 from exceptions.not_found import NotFoundException 
 
+from lib.utils.sized_lru_cache import SizedLRUCache
+
 from repository.image_disk_repository import ImageRepository
 from repository.weights_disk_repository import WeightsDiskRepository
 from repository.projects_postgres_repository import ProjectsRepository
@@ -26,9 +29,12 @@ _user_repository = UserRepository(session_factory=SessionLocal)
 _csv_disk_repo = CsvDiskRepository(directory=config.CSV_DIRECTORY)
 _csv_relative_repo = CSVRelativeRepository(session_factory=SessionLocal)
 
+_model_cache = SizedLRUCache(max_bytes=config.MODEL_CACHE_MAX_BYTES)
+
 project_service = ProjectsService(image_repository=_image_repository,
                                   weights_disk_repository=_weights_disk_repository,
-                                  projects_repository=_weights_relational_repository)
+                                  projects_repository=_weights_relational_repository,
+                                  model_cache=_model_cache)
 
 if(config.JWT_SEKRET is None):
     logger.error("The variable config.JWT_SEKRET is not found!! Has value None")
@@ -36,6 +42,8 @@ if(config.JWT_SEKRET is None):
 auth_service = AuthService(user_repository=_user_repository,
                            jwt_secret=config.JWT_SEKRET,
                            jwt_expires_seconds=config.JWT_EXPIRES_AT)
-csv_service = CsvService(disk_repo=_csv_disk_repo, relative_repo=_csv_relative_repo)
+csv_service = CsvService(disk_repo=_csv_disk_repo, relative_repo=_csv_relative_repo,
+                         columns_cache=SizedLRUCache(max_bytes=config.CSV_COLUMNS_CACHE_MAX_BYTES))
 nn_service = NNService()
 kohonen_network_service = KohonenNetworkService()
+sweep_service = SweepService()
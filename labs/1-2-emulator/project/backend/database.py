@@ -1,8 +1,17 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from config import config
 from base import Base # type: ignore[unused-variable]
+import models.db_models # type: ignore # noqa: F401 — регистрация таблиц в Base.metadata
 
 engine = create_engine(config.DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def init_schema() -> None:
+    """Создание таблиц и добавление новых колонок в уже существующие; вызывается при старте API."""
+    Base.metadata.create_all(bind=engine)
+    # create_all не добавляет колонки в уже существующие таблицы
+    with engine.begin() as connection:
+        connection.execute(text("ALTER TABLE csv_files ADD COLUMN IF NOT EXISTS stats JSON"))
@@ -1,3 +1,4 @@
 from lib.kohonen.decreasing.linear import decreasing_linear_rate, decreasing_linear_sigma
+from lib.kohonen.decreasing.schedule import DecreasingSchedule
 
-__all__ = ["decreasing_linear_rate", "decreasing_linear_sigma"]
+__all__ = ["decreasing_linear_rate", "decreasing_linear_sigma", "DecreasingSchedule"]
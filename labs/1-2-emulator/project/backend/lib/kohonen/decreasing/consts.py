@@ -0,0 +1,18 @@
+from typing import Callable, Dict
+
+import numpy as np
+import numpy.typing as npt
+
+from lib.kohonen.models.enums import DecayType
+from lib.kohonen.decreasing.linear import linear_decay
+from lib.kohonen.decreasing.exponential import exponential_decay
+from lib.kohonen.decreasing.inverse_time import inverse_time_decay
+
+
+DecayFunction = Callable[[npt.NDArray[np.float64], float, float], npt.NDArray[np.float64]]
+
+DECAY_FUNCTIONS: Dict[str, DecayFunction] = {
+    DecayType.LINEAR.value: linear_decay,
+    DecayType.EXPONENTIAL.value: exponential_decay,
+    DecayType.INVERSE_TIME.value: inverse_time_decay,
+}
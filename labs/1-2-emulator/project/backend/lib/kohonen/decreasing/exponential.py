@@ -0,0 +1,13 @@
+"""Экспоненциальное убывание для SOM: за равные доли пути значение уменьшается в одно и то же число раз."""
+
+import numpy as np
+import numpy.typing as npt
+
+
+def exponential_decay(
+    progress: npt.NDArray[np.float64],
+    value_start: float,
+    value_end: float,
+) -> npt.NDArray[np.float64]:
+    """``value_start * (value_end / value_start) ** progress``; ``progress`` = k / (K-1) из [0, 1]."""
+    return value_start * (value_end / value_start) ** progress
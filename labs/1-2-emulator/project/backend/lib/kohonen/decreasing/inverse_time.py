@@ -0,0 +1,13 @@
+"""Убывание обратно пропорционально времени для SOM: быстро в начале, медленно к концу."""
+
+import numpy as np
+import numpy.typing as npt
+
+
+def inverse_time_decay(
+    progress: npt.NDArray[np.float64],
+    value_start: float,
+    value_end: float,
+) -> npt.NDArray[np.float64]:
+    """``value_start / (1 + (value_start / value_end - 1) * progress)``; ``progress`` = k / (K-1) из [0, 1]."""
+    return value_start / (1.0 + (value_start / value_end - 1.0) * progress)
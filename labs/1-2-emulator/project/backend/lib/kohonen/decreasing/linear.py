@@ -1,5 +1,8 @@
 """Линейные убывающие расписания для SOM (скорость обучения и ширина соседства)."""
 
+import numpy as np
+import numpy.typing as npt
+
 from exceptions import ArgumentException
 from log import logger
 
@@ -17,22 +20,23 @@ def _linear_schedule(
     return float(value_start + (value_end - value_start) * t)
 
 
-def decreasing_linear_rate(
-    step_index: int,
-    total_steps: int,
-    rate_start: float,
-    rate_end: float,
-) -> float:
-    """
-    Линейная интерполяция скорости обучения по индексу шага (см. readme.md в этом пакете).
+def linear_decay(
+    progress: npt.NDArray[np.float64],
+    value_start: float,
+    value_end: float,
+) -> npt.NDArray[np.float64]:
+    """Значения на долях пути ``progress`` = k / (K-1) из [0, 1]."""
+    return value_start + (value_end - value_start) * progress
 
-    При ``total_steps >= 2`` и ``rate_start > rate_end`` получается линейно убывающая
-    скорость от ``rate_start`` к ``rate_end``.
-    """
+
+def check_total_steps(total_steps: int) -> None:
     if total_steps < 1:
         e_str = f"total_steps must be >= 1, got {total_steps}"
         logger.error(e_str)
         raise ArgumentException(e_str)
+
+
+def check_rate_bounds(rate_start: float, rate_end: float) -> None:
     if not (0.0 < rate_start <= 1.0 and 0.0 < rate_end <= 1.0):
         e_str = "rate_start and rate_end must satisfy 0 < rate <= 1"
         logger.error(e_str)
@@ -44,6 +48,32 @@ def decreasing_linear_rate(
         logger.error(e_str)
         raise ArgumentException(e_str)
 
+
+def check_sigma_bounds(sigma_start: float, sigma_end: float) -> None:
+    if sigma_end <= 0.0 or sigma_start <= sigma_end:
+        e_str = (
+            f"sigma_start and sigma_end must satisfy 0 < sigma_end < sigma_start, "
+            f"got sigma_start={sigma_start}, sigma_end={sigma_end}"
+        )
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+
+
+def decreasing_linear_rate(
+    step_index: int,
+    total_steps: int,
+    rate_start: float,
+    rate_end: float,
+) -> float:
+    """
+    Линейная интерполяция скорости обучения по индексу шага (см. readme.md в этом пакете).
+
+    При ``total_steps >= 2`` и ``rate_start > rate_end`` получается линейно убывающая
+    скорость от ``rate_start`` к ``rate_end``.
+    """
+    check_total_steps(total_steps)
+    check_rate_bounds(rate_start, rate_end)
+
     return _linear_schedule(step_index, total_steps, rate_start, rate_end)
 
 
@@ -57,16 +87,7 @@ def decreasing_linear_sigma(
     Линейно убывающее расписание ``sigma`` для функции соседства (та же сетка шагов,
     что и у :func:`decreasing_linear_rate`).
     """
-    if total_steps < 1:
-        e_str = f"total_steps must be >= 1, got {total_steps}"
-        logger.error(e_str)
-        raise ArgumentException(e_str)
-    if sigma_end <= 0.0 or sigma_start <= sigma_end:
-        e_str = (
-            f"sigma_start and sigma_end must satisfy 0 < sigma_end < sigma_start, "
-            f"got sigma_start={sigma_start}, sigma_end={sigma_end}"
-        )
-        logger.error(e_str)
-        raise ArgumentException(e_str)
+    check_total_steps(total_steps)
+    check_sigma_bounds(sigma_start, sigma_end)
 
     return _linear_schedule(step_index, total_steps, sigma_start, sigma_end)
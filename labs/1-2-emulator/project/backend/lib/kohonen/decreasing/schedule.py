@@ -0,0 +1,53 @@
+"""Убывающие расписания SOM, посчитанные массивами для целого отрезка шагов."""
+
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from lib.kohonen.models.enums import DecayType
+from lib.kohonen.decreasing.consts import DECAY_FUNCTIONS
+from lib.kohonen.decreasing.linear import check_rate_bounds, check_sigma_bounds, check_total_steps
+
+
+class DecreasingSchedule:
+    """
+    Значения от ``value_start`` до ``value_end`` на шагах k = 0 … K-1 (формулы — в readme.md этого пакета).
+
+    Параметры проверяются один раз в конструкторе (:meth:`learning_rate` / :meth:`sigma`),
+    а :meth:`values` отдаёт значения сразу для отрезка шагов — например, для эпохи, —
+    вместо вызова :func:`decreasing_linear_rate` на каждом шаге.
+    """
+
+    def __init__(self, decay_type: DecayType, total_steps: int, value_start: float, value_end: float):
+        check_total_steps(total_steps)
+        self.decay = DECAY_FUNCTIONS[DecayType(decay_type).value]
+        self.total_steps = total_steps
+        self.value_start = float(value_start)
+        self.value_end = float(value_end)
+
+    @classmethod
+    def learning_rate(
+        cls, decay_type: DecayType, total_steps: int, rate_start: float, rate_end: float,
+    ) -> "DecreasingSchedule":
+        """Скорость обучения: 0 < rate_end < rate_start <= 1 (как у :func:`decreasing_linear_rate`)."""
+        check_rate_bounds(rate_start, rate_end)
+        return cls(decay_type, total_steps, rate_start, rate_end)
+
+    @classmethod
+    def sigma(
+        cls, decay_type: DecayType, total_steps: int, sigma_start: float, sigma_end: float,
+    ) -> "DecreasingSchedule":
+        """Ширина соседства: 0 < sigma_end < sigma_start (как у :func:`decreasing_linear_sigma`)."""
+        check_sigma_bounds(sigma_start, sigma_end)
+        return cls(decay_type, total_steps, sigma_start, sigma_end)
+
+    def values(self, first_step: int = 0, count: Optional[int] = None) -> npt.NDArray[np.float64]:
+        """Значения на шагах ``first_step … first_step + count - 1`` (по умолчанию — до конца)."""
+        if count is None:
+            count = self.total_steps - first_step
+        steps = np.arange(first_step, first_step + count, dtype=np.float64)
+        if self.total_steps == 1:
+            return np.full(count, self.value_start, dtype=np.float64)
+        progress = np.clip(steps, 0, self.total_steps - 1) / (self.total_steps - 1)
+        return self.decay(progress, self.value_start, self.value_end)
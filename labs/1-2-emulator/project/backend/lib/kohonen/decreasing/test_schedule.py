@@ -0,0 +1,55 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.kohonen.decreasing import DecreasingSchedule, decreasing_linear_rate, decreasing_linear_sigma
+from lib.kohonen.models.enums import DecayType
+
+from exceptions import ArgumentException
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 1e-9
+
+
+def test_decreasing_schedules():
+    """
+    Массивы расписаний на 5 шагов, совпадение LINEAR со скалярными функциями
+    и отказ на невалидных границах.
+    """
+    t = DecayType
+    cases = [
+        (t.LINEAR, [0.5, 0.4, 0.3, 0.2, 0.1]),
+        (t.EXPONENTIAL, [0.5, 0.3343701525, 0.2236067977, 0.1495348781, 0.1]),
+        (t.INVERSE_TIME, [0.5, 0.25, 0.1666666667, 0.125, 0.1]),
+    ]
+
+    errors: List[Any] = list()
+    for decay_type, expected in cases:
+        received = DecreasingSchedule.learning_rate(decay_type, 5, 0.5, 0.1).values()
+        if not np.allclose(received, expected, atol=TOLERANCE):
+            logger.error(f" Test error. decreasing schedule {decay_type}")
+            errors.append({"decay_type": decay_type, "expected": expected, "received": received.tolist()})
+
+    total_steps = 7
+    rates = DecreasingSchedule.learning_rate(t.LINEAR, total_steps, 0.9, 0.05)
+    sigmas = DecreasingSchedule.sigma(t.LINEAR, total_steps, 3.0, 0.5)
+    expected_rates = [decreasing_linear_rate(k, total_steps, 0.9, 0.05) for k in range(2, 5)]
+    expected_sigmas = [decreasing_linear_sigma(k, total_steps, 3.0, 0.5) for k in range(2, 5)]
+    if rates.values(2, 3).tolist() != expected_rates or sigmas.values(2, 3).tolist() != expected_sigmas:
+        logger.error(" Test error. LINEAR schedule differs from decreasing_linear_*")
+        errors.append({"linear": True, "expected": [expected_rates, expected_sigmas],
+                       "received": [rates.values(2, 3).tolist(), sigmas.values(2, 3).tolist()]})
+
+    for build, bounds in ((DecreasingSchedule.learning_rate, (0.1, 0.5)), (DecreasingSchedule.sigma, (1.0, 0.0))):
+        try:
+            build(t.EXPONENTIAL, 5, *bounds)
+            errors.append({"bounds": bounds, "expected": "ArgumentException"})
+        except ArgumentException:
+            pass
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_decreasing_schedules complete!")
@@ -0,0 +1,108 @@
+import io
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from exceptions import ArgumentException
+from log import logger
+
+
+class CompiledKohonen:
+    """
+    Готовая к инференсу карта Кохонена, принимающая ненормализованные признаки.
+
+    Нормализация y = scale ⊙ x + shift (нули для признаков с max == min, как в
+    :func:`min_max_normalize`) аффинна, поэтому квадрат расстояния до нейрона i раскладывается как
+
+    ::
+
+        ||w_i - y||² = offset_i + projection_i · x + ||y||²,
+        offset_i     = ||w_i||² - 2 · w_i · shift,
+        projection_i = -2 · w_i ⊙ scale.
+
+    Слагаемое ||y||² одинаково для всех нейронов, поэтому победитель — argmin(offset + projection · x)
+    без нормализации входа и без разности (neurons, input_size).
+    """
+
+    weights: npt.NDArray[np.float64]
+    scale: npt.NDArray[np.float64]
+    shift: npt.NDArray[np.float64]
+    projection: npt.NDArray[np.float64]
+    offset: npt.NDArray[np.float64]
+
+    def __init__(
+        self,
+        weights: npt.NDArray[np.float64],
+        scale: npt.NDArray[np.float64],
+        shift: npt.NDArray[np.float64],
+    ):
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.shift = np.asarray(shift, dtype=np.float64)
+        self.projection = -2.0 * self.weights * self.scale
+        self.offset = np.einsum("ij,ij->i", self.weights, self.weights) - 2.0 * (self.weights @ self.shift)
+
+    @classmethod
+    def compile(
+        cls,
+        weights: Sequence[Sequence[float]],
+        mins: Sequence[float],
+        maxs: Sequence[float],
+    ) -> "CompiledKohonen":
+        """Из матрицы весов карты (neurons, input_size) и границ нормализации признаков."""
+        lo = np.asarray(mins, dtype=np.float64)
+        ranges = np.asarray(maxs, dtype=np.float64) - lo
+        scale = np.divide(1.0, ranges, out=np.zeros_like(ranges), where=ranges != 0.0)
+        return cls(np.asarray(weights, dtype=np.float64), scale, -lo * scale)
+
+    @property
+    def input_size(self) -> int:
+        return self.weights.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return (self.weights.nbytes + self.scale.nbytes + self.shift.nbytes
+                + self.projection.nbytes + self.offset.nbytes)
+
+    def _check(self, x: npt.NDArray[np.float64]) -> None:
+        if x.shape[-1] != self.input_size:
+            e_str = f"input has {x.shape[-1]} features, the map expects {self.input_size}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+    def normalize(self, x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        self._check(x)
+        return x * self.scale + self.shift
+
+    def winners(self, x: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+        """Номер нейрона-победителя для вектора (input_size,) или для каждой строки (batch, input_size)."""
+        self._check(x)
+        return np.argmin(x @ self.projection.T + self.offset, axis=-1)
+
+    def squared_distances(self, x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        ||w_i - y||² до каждого нейрона; форма (neurons,) или (batch, neurons).
+
+        Разложенная форма теряет точность при y ≈ w_i и может дать небольшое отрицательное
+        значение — такие расстояния приводятся к нулю.
+        """
+        y = self.normalize(x)
+        distances = x @ self.projection.T + self.offset
+        distances += np.sum(y * y, axis=-1, keepdims=y.ndim > 1)
+        np.maximum(distances, 0.0, out=distances)
+        return distances
+
+    def to_npz(self) -> bytes:
+        """Артефакт .npz: ``weights``, ``scale``, ``shift``, ``projection``, ``offset``."""
+        buffer = io.BytesIO()
+        np.savez(
+            buffer, weights=self.weights, scale=self.scale, shift=self.shift,
+            projection=self.projection, offset=self.offset,
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_npz(cls, content: bytes) -> "CompiledKohonen":
+        with np.load(io.BytesIO(content), allow_pickle=False) as data:
+            return cls(data["weights"], data["scale"], data["shift"])
@@ -13,3 +13,18 @@ class TopologyDistanceType(str, Enum):
 
     EUCLIDEAN = "EUCLIDEAN"
     MANHATTAN = "MANHATTAN"
+
+
+class SomTrainingMode(str, Enum):
+    """Алгоритм обучения карты: ONLINE — по одному примеру, BATCH — вся выборка за эпоху."""
+
+    ONLINE = "ONLINE"
+    BATCH = "BATCH"
+
+
+class DecayType(str, Enum):
+    """Вид убывания скорости обучения и ``sigma`` SOM по шагам (см. lib/kohonen/decreasing/readme.md)."""
+
+    LINEAR = "LINEAR"
+    EXPONENTIAL = "EXPONENTIAL"
+    INVERSE_TIME = "INVERSE_TIME"
@@ -0,0 +1,82 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.kohonen.models.compiled_kohonen import CompiledKohonen
+from lib.kohonen.normalization.weights_normalization import min_max_normalize
+from lib.kohonen.vector_distance_calculation.euclidean import EuclideanVectorDistanceCalculator
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 1e-9
+
+
+def test_compiled_kohonen_matches_normalized_distances():
+    """
+    Свёрнутая в ``offset + projection · x`` карта даёт те же квадраты расстояний и победителей,
+    что :func:`min_max_normalize` + :class:`EuclideanVectorDistanceCalculator`, в том числе
+    с постоянным признаком (max == min) и для входа вне [min, max].
+    """
+    rng = np.random.default_rng(3)
+    weights = rng.random((12, 4))
+    mins = np.array([-2.0, 0.0, 5.0, 1.0])
+    maxs = np.array([3.0, 10.0, 5.0, 1.5])  # третий признак постоянный
+    samples = rng.uniform(mins - 1.0, maxs + 1.0, size=(30, 4))
+
+    model = CompiledKohonen.compile(weights.tolist(), mins.tolist(), maxs.tolist())
+    calculator = EuclideanVectorDistanceCalculator()
+
+    errors: List[Any] = list()
+    expected_winners = []
+    for i, x in enumerate(samples):
+        expected = calculator.perform(weights, min_max_normalize(x, mins, maxs))
+        expected_winners.append(int(np.argmin(expected)))
+
+        received = model.squared_distances(x)
+        if not np.allclose(received, expected, atol=TOLERANCE):
+            logger.error(f" Test error. squared distances, sample {i}")
+            errors.append({"sample": i, "distances": (received.tolist(), expected.tolist())})
+        if int(model.winners(x)) != expected_winners[-1]:
+            errors.append({"sample": i, "winner": (int(model.winners(x)), expected_winners[-1])})
+
+    if model.winners(samples).tolist() != expected_winners:
+        errors.append({"batch winners": model.winners(samples).tolist()})
+    if not np.allclose(model.squared_distances(samples), [model.squared_distances(x) for x in samples], atol=TOLERANCE):
+        errors.append({"batch distances": True})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_compiled_kohonen_matches_normalized_distances complete!")
+
+
+def test_compiled_kohonen_exact_match():
+    """
+    Вход, который нормализуется ровно в веса нейрона: расстояние до него не отрицательное
+    и почти ноль (разложенная форма без приведения к нулю давала ≈ -1e-16), победитель — этот нейрон.
+    """
+    rng = np.random.default_rng(3)
+    mins = np.array([-2.0, 0.0, 5.0, 1.0])
+    maxs = np.array([3.0, 10.0, 5.0, 1.5])
+
+    errors: List[Any] = list()
+    for trial in range(50):
+        weights = rng.random((12, 4))
+        weights[:, 2] = 0.0  # постоянный признак нормализуется в 0
+        model = CompiledKohonen.compile(weights.tolist(), mins.tolist(), maxs.tolist())
+        neuron = trial % 12
+        x = mins + weights[neuron] * (maxs - mins)
+
+        for distances in (model.squared_distances(x), model.squared_distances(x[None, :])[0]):
+            if np.any(distances < 0.0) or distances[neuron] > TOLERANCE:
+                logger.error(f" Test error. exact match, trial {trial}")
+                errors.append({"trial": trial, "distance": float(distances[neuron]), "min": float(distances.min())})
+        if int(model.winners(x)) != neuron:
+            errors.append({"trial": trial, "winner": int(model.winners(x))})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_compiled_kohonen_exact_match complete!")
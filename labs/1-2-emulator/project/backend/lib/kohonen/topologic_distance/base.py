@@ -1,17 +1,41 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from functools import lru_cache
+from typing import Tuple, Type
 
 import numpy.typing as npt
 import numpy as np
 
 
+@lru_cache(maxsize=32)
+def _distance_table(
+    calculator: Type["ITopologicCalculator"], cols: int, neurons_count: int
+) -> npt.NDArray[np.float64]:
+    # общая для всех задач процесса: сетка и метрика не меняются за время обучения
+    calc = calculator(cols)
+    r, c = calc._grid_coords(neurons_count)
+    table = calc.distances_from_offsets(r[:, None] - r[None, :], c[:, None] - c[None, :])
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=16)
+def _window_table(
+    calculator: Type["ITopologicCalculator"], half: int
+) -> npt.NDArray[np.float64]:
+    offsets = np.arange(-half, half + 1, dtype=np.int64)
+    table = calculator(1).distances_from_offsets(offsets[:, None], offsets[None, :])
+    table.setflags(write=False)
+    return table
+
 
 class ITopologicCalculator(ABC):
     """Топологическое расстояние на 2D-решётке m×n.
 
     Нейроны индексируются линейно: ``idx = row * cols + col``.
     Метод :meth:`perform` возвращает 1D-массив длины ``neurons_count``
-    (= ``rows * cols``) с расстояниями от нейрона-победителя до всех остальных.
+    (= ``rows * cols``) с расстояниями от нейрона-победителя до всех остальных —
+    строку таблицы :meth:`distance_table`, общей для всех калькуляторов
+    с той же метрикой и сеткой (только для чтения).
     """
 
     def __init__(self, cols: int) -> None:
@@ -30,10 +54,28 @@ class ITopologicCalculator(ABC):
         idx = np.arange(neurons_count, dtype=np.int64)
         return idx // self.cols, idx % self.cols
 
-    @abstractmethod
+    def distance_table(self, neurons_count: int) -> npt.NDArray[np.float64]:
+        """Расстояния между всеми парами нейронов ``(neurons_count, neurons_count)``."""
+        return _distance_table(type(self), self.cols, neurons_count)
+
+    def window_distances(self, half: int) -> npt.NDArray[np.float64]:
+        """
+        Расстояния от центра квадрата ``(2*half + 1, 2*half + 1)`` до каждой его клетки —
+        окно сетки вокруг победителя, не зависящее от размера карты (только для чтения).
+        Вызывающий ограничивает ``half`` размером карты: таблица растёт как half².
+        """
+        return _window_table(type(self), half)
+
     def perform(
         self, winner_idx: int, neurons_count: int
-    ) -> npt.NDArray[np.float64]: ...
+    ) -> npt.NDArray[np.float64]:
+        return self.distance_table(neurons_count)[winner_idx]
+
+    @abstractmethod
+    def distances_from_offsets(
+        self, dr: npt.NDArray[np.int64], dc: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.float64]:
+        """Поэлементно: расстояние между нейронами, разнесёнными на ``dr`` строк и ``dc`` столбцов."""
 
     @abstractmethod
     def get_type(self)-> str: pass
@@ -13,11 +13,9 @@ class EuclideanTopologicDistance(ITopologicCalculator):
     в квадрат: квадрат уже сидит внутри гауссовой функции соседства.
     """
 
-    def perform(
-        self, winner_idx: int, neurons_count: int
+    def distances_from_offsets(
+        self, dr: npt.NDArray[np.int64], dc: npt.NDArray[np.int64]
     ) -> npt.NDArray[np.float64]:
-        wr, wc = divmod(winner_idx, self.cols)
-        r, c = self._grid_coords(neurons_count)
-        return np.sqrt((r - wr) ** 2 + (c - wc) ** 2).astype(np.float64)
+        return np.sqrt(dr ** 2 + dc ** 2).astype(np.float64)
 
     def get_type(self)-> str: return TopologyDistanceType.EUCLIDEAN
@@ -7,11 +7,9 @@ from lib.kohonen.models.enums import TopologyDistanceType
 class ManhattanTopologicDistance(ITopologicCalculator):
     """Манхэттенское топологическое расстояние на 2D-решётке m*n."""
 
-    def perform(
-        self, winner_idx: int, neurons_count: int
+    def distances_from_offsets(
+        self, dr: npt.NDArray[np.int64], dc: npt.NDArray[np.int64]
     ) -> npt.NDArray[np.float64]:
-        wr, wc = divmod(winner_idx, self.cols)
-        r, c = self._grid_coords(neurons_count)
-        return (np.abs(r - wr) + np.abs(c - wc)).astype(np.float64)
+        return (np.abs(dr) + np.abs(dc)).astype(np.float64)
 
     def get_type(self)-> str: return TopologyDistanceType.MANHATTAN
\ No newline at end of file
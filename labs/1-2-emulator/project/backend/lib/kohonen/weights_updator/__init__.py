@@ -1,9 +1,6 @@
 import numpy.typing as npt
 import numpy as np
 
-from exceptions import ArgumentException
-from log import logger
-
 from lib.kohonen.topologic_distance import ITopologicCalculator
 from lib.kohonen.neighbour_function import INeighbourFunction
 
@@ -15,24 +12,68 @@ class WeightApdator():
         self.tdc = topologic_distance_calculator
         self.nf = neighbour_function
         self.lr = learn_rate
+        self._delta: npt.NDArray[np.float64] = np.empty((0, 0), dtype=np.float64)
+        self._scale: npt.NDArray[np.float64] = np.empty((0, 1), dtype=np.float64)
+
+
+    def update_weights_by_winner(self, weights: npt.NDArray[np.float64], learn_rate: float,
+                                 winner_index: int, input_vector: npt.NDArray[np.float64], sigma: float):
+        """
+        ``w += learn_rate * h(winner) * (x - w)`` для всех нейронов сразу, in-place через
+        буферы, выделенные один раз на форму ``weights``. ``learn_rate`` не проверяется —
+        для цикла обучения его диапазон гарантирует расписание.
+        """
+        num_clusters, input_size = weights.shape
+        self._ensure_buffers(num_clusters, input_size)
 
+        t_dists = self.tdc.perform(winner_index, neurons_count=num_clusters)
+        np.multiply(self.nf.perform(t_dists, sigma)[:, None], learn_rate, out=self._scale)
+        np.subtract(input_vector, weights, out=self._delta)
+        np.multiply(self._delta, self._scale, out=self._delta)
+        np.add(weights, self._delta, out=weights)
+        return weights
+
+    def update_weights_in_window(self, weights: npt.NDArray[np.float64], learn_rate: float,
+                                 winner_index: int, input_vector: npt.NDArray[np.float64], sigma: float,
+                                 radius: float):
+        """
+        Как :meth:`update_weights_by_winner`, но только для нейронов не дальше ``radius`` от
+        победителя, для остальных соседство считается нулём. Такие нейроны лежат в квадрате
+        ±floor(radius) строк и столбцов сетки вокруг победителя — он обновляется как под-блок
+        ``weights`` (view ``(rows, cols, input_size)``), а расстояния берутся из заранее посчитанного
+        окна :meth:`ITopologicCalculator.window_distances`, так что шаг стоит O(окна), а не O(карты).
+        """
+        num_clusters, input_size = weights.shape
+        self._ensure_buffers(num_clusters, input_size)
+        cols = self.tdc.cols
+        rows = num_clusters // cols
+        grid = weights.view()
+        grid.shape = (rows, cols, input_size)  # без копии, иначе обновление потерялось бы
 
-    def update_weights(self, weights: npt.NDArray[np.float64], learn_rate: float,
-                       output_vector: npt.NDArray[np.float64], input_vector: npt.NDArray[np.float64], sigma: float):
-        
-        num_clusters, _ = weights.shape 
+        wr, wc = divmod(winner_index, cols)
+        # дальше края карты окно не нужно: при большом sigma иначе росла бы таблица (2*half + 1)²
+        half = min(int(radius), max(rows, cols) - 1)
+        r0, r1 = max(wr - half, 0), min(wr + half + 1, rows)
+        c0, c1 = max(wc - half, 0), min(wc + half + 1, cols)
+        block = grid[r0:r1, c0:c1]
+        window = (r1 - r0, c1 - c0)
 
-        if learn_rate > 1 or learn_rate <= 0:
-            e_str = f"learn_rate must be in the range 0 < learn_rate <= 1. learn rate: {learn_rate}"
-            logger.error(e_str)
-            raise ArgumentException(e_str) 
+        # та же часть заранее посчитанного окна ±half вокруг победителя, обрезанного краями карты
+        t_dists = self.tdc.window_distances(half)[
+            r0 - wr + half:r1 - wr + half, c0 - wc + half:c1 - wc + half
+        ]
+        h = self.nf.perform(t_dists, sigma)
+        h[t_dists > radius] = 0.0
 
-        winner_index = int(np.argmax(output_vector))
-        t_dists = self.tdc.perform(winner_index, neurons_count=len(output_vector))
-        n_res = self.nf.perform(t_dists, sigma)
-        
-        for i in range(num_clusters):
-            weights[i] += learn_rate * n_res[i] * (input_vector - weights[i])
-        
+        scale = self._scale[:window[0] * window[1]].reshape(window + (1,))
+        delta = self._delta[:window[0] * window[1]].reshape(window + (input_size,))
+        np.multiply(h[..., None], learn_rate, out=scale)
+        np.subtract(input_vector, block, out=delta)
+        np.multiply(delta, scale, out=delta)
+        np.add(block, delta, out=block)
         return weights
-        
\ No newline at end of file
+
+    def _ensure_buffers(self, num_clusters: int, input_size: int):
+        if self._delta.shape != (num_clusters, input_size):
+            self._delta = np.empty((num_clusters, input_size), dtype=np.float64)
+            self._scale = np.empty((num_clusters, 1), dtype=np.float64)
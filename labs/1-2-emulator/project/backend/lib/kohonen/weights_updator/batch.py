@@ -0,0 +1,61 @@
+from typing import Optional
+
+import numpy.typing as npt
+import numpy as np
+
+from exceptions import ArgumentException
+from log import logger
+
+from lib.kohonen.topologic_distance import ITopologicCalculator
+from lib.kohonen.neighbour_function import INeighbourFunction
+
+
+class BatchWeightApdator():
+    """Шаг batch SOM: вся выборка за раз, без скорости обучения (см. readme.md в этом пакете)."""
+
+    def __init__(self, topologic_distance_calculator: ITopologicCalculator,
+                 neighbour_function: INeighbourFunction):
+        self.tdc = topologic_distance_calculator
+        self.nf = neighbour_function
+
+    def winners(self, weights: npt.NDArray[np.float64],
+                samples: npt.NDArray[np.float64]) -> npt.NDArray[np.int64]:
+        """Номер нейрона-победителя для каждой строки ``samples``: ||x||² одинаков у всех нейронов и опущен."""
+        scores = samples @ weights.T
+        scores *= -2.0
+        scores += np.einsum("ij,ij->i", weights, weights)
+        return np.argmin(scores, axis=1)
+
+    def update_weights(self, weights: npt.NDArray[np.float64],
+                       samples: npt.NDArray[np.float64], sigma: float,
+                       radius: Optional[float] = None):
+        """
+        ``w_i = Σ_j h_ij · S_j / Σ_j h_ij · n_j``, где ``S_j`` и ``n_j`` — сумма и число примеров,
+        у которых победил нейрон ``j``. Нейрон без примеров в окрестности сохраняет свои веса.
+        ``radius`` — соседство нейронов дальше него считается нулём (как в online-режиме).
+        """
+        num_clusters, input_size = weights.shape
+        if samples.ndim != 2 or samples.shape[1] != input_size:
+            e_str = (
+                f"samples must be 2D with {input_size} columns, got shape {samples.shape}"
+            )
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        bmu = self.winners(weights, samples)
+        counts = np.bincount(bmu, minlength=num_clusters).astype(np.float64)
+        sums = np.empty_like(weights)
+        for k in range(input_size):
+            sums[:, k] = np.bincount(bmu, weights=samples[:, k], minlength=num_clusters)
+
+        # neighbourhood[i, j] = h(d(j, i)); функции соседства симметричны по d
+        topo_dists = self.tdc.distance_table(num_clusters)
+        neighbourhood = self.nf.perform(topo_dists, sigma)
+        if radius is not None:
+            neighbourhood[topo_dists > radius] = 0.0
+        numerators = neighbourhood @ sums
+        denominators = neighbourhood @ counts
+
+        covered = denominators > 0
+        weights[covered] = numerators[covered] / denominators[covered, None]
+        return weights
@@ -0,0 +1,113 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.kohonen.weights_updator import WeightApdator
+from lib.kohonen.weights_updator.batch import BatchWeightApdator
+from lib.kohonen.neighbour_function import GaussianNEighborhood, MexicanHatNeighborhood
+from lib.kohonen.topologic_distance import EuclideanTopologicDistance, ManhattanTopologicDistance
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 1e-12
+
+
+def test_update_weights_in_window():
+    """
+    Обновление окна совпадает с :meth:`update_weights_by_winner`, у которого соседство нейронов
+    дальше ``radius`` обнулено вручную; при радиусе больше карты — с полным обновлением.
+    Радиус 1e7 проверяет, что окно обрезано размером карты: таблица (2e7 + 1)² не выделилась бы.
+    """
+    rows, cols, input_size = 4, 5, 3
+    rng = np.random.default_rng(0)
+    weights = rng.random((rows * cols, input_size))
+    x = rng.random(input_size)
+
+    errors: List[Any] = list()
+    for topo_cls in (EuclideanTopologicDistance, ManhattanTopologicDistance):
+        for nf in (GaussianNEighborhood(), MexicanHatNeighborhood()):
+            topo = topo_cls(cols=cols)
+            for winner in (0, 7, rows * cols - 1):
+                for radius in (0.5, 1.5, 2.0, 1e7):
+                    received = WeightApdator(topo, nf, 0.3).update_weights_in_window(
+                        weights.copy(), 0.3, winner, x, 1.7, radius,
+                    )
+
+                    t_dists = topo.perform(winner, neurons_count=rows * cols)
+                    h = nf.perform(t_dists, 1.7)
+                    h[t_dists > radius] = 0.0
+                    expected = weights + 0.3 * h[:, None] * (x - weights)
+
+                    if not np.allclose(received, expected, atol=TOLERANCE):
+                        logger.error(f" Test error. window update {topo_cls.__name__} {winner} {radius}")
+                        errors.append({"topology": topo_cls.__name__, "winner": winner, "radius": radius})
+
+            full = WeightApdator(topo, nf, 0.3).update_weights_by_winner(weights.copy(), 0.3, 7, x, 1.7)
+            window = WeightApdator(topo, nf, 0.3).update_weights_in_window(weights.copy(), 0.3, 7, x, 1.7, 1e7)
+            if not np.allclose(full, window, atol=TOLERANCE):
+                logger.error(f" Test error. window update with huge radius {topo_cls.__name__}")
+                errors.append({"topology": topo_cls.__name__, "huge_radius": True})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_update_weights_in_window complete!")
+
+
+def _batch_brute_force(topo, nf, weights, samples, sigma, radius):
+    """``w_i = Σ_x h(d(bmu(x), i)) · x / Σ_x h(d(bmu(x), i))`` по каждому примеру отдельно."""
+    n = weights.shape[0]
+    numerators = np.zeros_like(weights)
+    denominators = np.zeros(n)
+    for x in samples:
+        bmu = int(np.argmin(np.sum((weights - x) ** 2, axis=1)))
+        t_dists = topo.perform(bmu, neurons_count=n)
+        h = nf.perform(t_dists, sigma)
+        if radius is not None:
+            h[t_dists > radius] = 0.0
+        numerators += h[:, None] * x
+        denominators += h
+
+    expected = weights.copy()
+    for i in range(n):
+        if denominators[i] > 0:
+            expected[i] = numerators[i] / denominators[i]
+    return expected
+
+
+def test_batch_update_weights():
+    """
+    Batch-шаг совпадает с поштучной суммой по примерам; на карте 1×6, где все примеры
+    достаются нейрону 0, нейроны дальше ``radius`` от него сохраняют свои веса.
+    """
+    rng = np.random.default_rng(1)
+    errors: List[Any] = list()
+
+    for topo_cls in (EuclideanTopologicDistance, ManhattanTopologicDistance):
+        topo, nf = topo_cls(cols=4), GaussianNEighborhood()
+        weights = rng.random((12, 3))
+        samples = rng.random((40, 3))
+        for radius in (None, 1.5):
+            received = BatchWeightApdator(topo, nf).update_weights(weights.copy(), samples, 1.3, radius)
+            expected = _batch_brute_force(topo, nf, weights, samples, 1.3, radius)
+            if not np.allclose(received, expected, atol=TOLERANCE):
+                logger.error(f" Test error. batch update {topo_cls.__name__} {radius}")
+                errors.append({"topology": topo_cls.__name__, "radius": radius})
+
+        line = topo_cls(cols=6)
+        weights = np.vstack([np.full((1, 3), 0.5), np.full((5, 3), 10.0) + np.arange(5)[:, None]])
+        samples = 0.5 + 0.1 * rng.standard_normal((20, 3))
+        received = BatchWeightApdator(line, nf).update_weights(weights.copy(), samples, 1.0, 1.5)
+        expected = _batch_brute_force(line, nf, weights, samples, 1.0, 1.5)
+        if not np.allclose(received, expected, atol=TOLERANCE) or not np.array_equal(received[2:], weights[2:]):
+            logger.error(f" Test error. batch update uncovered neurons {topo_cls.__name__}")
+            errors.append({"topology": topo_cls.__name__, "uncovered": received[2:].tolist()})
+        if not np.allclose(received[:2], samples.mean(axis=0), atol=TOLERANCE):
+            errors.append({"topology": topo_cls.__name__, "covered": received[:2].tolist()})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_batch_update_weights complete!")
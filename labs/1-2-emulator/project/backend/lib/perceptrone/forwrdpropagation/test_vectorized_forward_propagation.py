@@ -0,0 +1,78 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.forwrdpropagation.forward_propagation import forward_propagation
+from lib.perceptrone.forwrdpropagation.vectorized_forward_propagation import (
+    vectorized_forward_propagation,
+)
+from lib.perceptrone.mathh.models import Perceptron
+from lib.perceptrone.mathh.np_mv import to_layer_arrays
+from lib.perceptrone.training.activation.activation import Rellu, Sigmoid, SoftMax
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 0.0001
+
+INPUTS = [
+    [0.5, 0.3],
+    [0.1, 0.9],
+    [1.0, 0.0],
+]
+LAYERS_COUNT = 3
+WEIGHTS = \
+[
+    [
+        [0.1, 0.4],
+        [0.8, -0.3],
+        [0.2, 0.9],
+    ], [
+        [-0.2, 0.6, 0.5],
+        [0.7, -0.1, 0.3],
+    ]
+]
+
+
+def _compare_with_scalar(hidden_activation: Any, output_activation: Any) -> List[Any]:
+    p = Perceptron(
+        weights=WEIGHTS, activations=[hidden_activation, output_activation], layers_count=LAYERS_COUNT,
+    )
+    batch_outputs, batch_sums = vectorized_forward_propagation(
+        np.asarray(INPUTS), to_layer_arrays(WEIGHTS), p.activations,
+    )
+
+    errors: List[Any] = list()
+    for n, x in enumerate(INPUTS):
+        expected_outputs, expected_sums = forward_propagation(x, p)
+        single_outputs, _ = vectorized_forward_propagation(
+            np.asarray(x), to_layer_arrays(WEIGHTS), p.activations,
+        )
+
+        for j in range(len(expected_outputs)):
+            for received in (single_outputs[j], batch_outputs[n][j]):
+                if abs(expected_outputs[j] - received) > TOLERANCE:
+                    logger.error(f" Test error. sample {n} output {j}")
+                    errors.append({"sample": n, "output": j,
+                                   "expected": expected_outputs[j], "received": float(received)})
+
+        for q in range(len(expected_sums)):
+            for j in range(len(expected_sums[q])):
+                if abs(expected_sums[q][j] - batch_sums[q][n][j]) > TOLERANCE:
+                    logger.error(f" Test error. sample {n} layer {q} sum {j}")
+                    errors.append({"sample": n, "layer": q, "sum": j,
+                                   "expected": expected_sums[q][j], "received": float(batch_sums[q][n][j])})
+    return errors
+
+
+def test_vectorized_forward_matches_scalar():
+    errors: List[Any] = list()
+    errors += _compare_with_scalar(Rellu(), Rellu())
+    errors += _compare_with_scalar(Sigmoid(), Sigmoid())
+    errors += _compare_with_scalar(Rellu(), SoftMax())
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_vectorized_forward_matches_scalar complete!")
@@ -0,0 +1,98 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from exceptions.argument_exception import ArgumentException
+from log import logger
+from lib.perceptrone.models.activation import IActivation
+from lib.perceptrone.training.training_workspace import TrainingWorkspace
+
+
+def forward_layers(
+    inputs: npt.NDArray[np.float64],
+    weights: Sequence[npt.NDArray[np.float64]],
+    activations: Sequence[IActivation],
+    output_activation: bool = True,
+) -> Tuple[List[npt.NDArray[np.float64]], List[npt.NDArray[np.float64]]]:
+    """
+    Прямое распространение с сохранением выходов каждого слоя.
+
+    Args:
+        inputs: входной вектор (d,) или пакет входов (batch, d)
+        weights: матрицы весов слоёв, weights[q] формы (n_q, n_{q-1})
+        activations: функции активации слоёв (по одной на каждую матрицу весов)
+        output_activation: при False активация выходного слоя не применяется
+            и layer_outputs[-1] — его взвешенные суммы (как в :func:`forward_layers_into`)
+
+    Returns:
+        (layer_outputs, weighted_sums_output)
+        layer_outputs[q] — y^q, выходы слоя q после активации
+        weighted_sums_output[q] — s^q, взвешенные суммы слоя q до активации
+    """
+    x = np.asarray(inputs, dtype=np.float64)
+
+    if x.shape[-1] != weights[0].shape[1]:
+        e_str = (
+            f"incorrect size of inputs: expected {weights[0].shape[1]}, got {x.shape[-1]}"
+        )
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+
+    layer_outputs: List[npt.NDArray[np.float64]] = []
+    weighted_sums_output: List[npt.NDArray[np.float64]] = []
+
+    current = x
+    last = len(weights) - 1
+    for q in range(len(weights)):
+        # s^q = W^q · y^(q-1); для пакета строки — примеры, поэтому Y · W^T
+        layer_sums = current @ weights[q].T
+        if q == last and not output_activation:
+            current = layer_sums
+        else:
+            current = activations[q].perform_vector(layer_sums)
+
+        weighted_sums_output.append(layer_sums)
+        layer_outputs.append(current)
+
+    return layer_outputs, weighted_sums_output
+
+
+def forward_layers_into(
+    workspace: TrainingWorkspace,
+    weights: Sequence[npt.NDArray[np.float64]],
+    activations: Sequence[IActivation],
+    batch_len: int,
+    output_activation: bool = True,
+) -> npt.NDArray[np.float64]:
+    """
+    То же, что :func:`forward_layers`, но результаты пишутся в буферы ``workspace``
+    (первые ``batch_len`` строк) без выделения памяти. Возвращает выходы последнего слоя.
+
+    При ``output_activation=False`` активация выходного слоя не применяется и возвращаются
+    его взвешенные суммы (логиты) — так делает обучение с soft-max + cross-entropy,
+    где ошибка считается сразу по логитам.
+    """
+    current = workspace.inputs[:batch_len]
+    last = len(weights) - 1
+    for q in range(len(weights)):
+        layer_sums = np.matmul(current, weights[q].T, out=workspace.weighted_sums[q][:batch_len])
+        if q == last and not output_activation:
+            return layer_sums
+        current = activations[q].perform_vector(layer_sums, out=workspace.layer_outputs[q][:batch_len])
+
+    return current
+
+
+def vectorized_forward_propagation(
+    inputs: npt.NDArray[np.float64],
+    weights: Sequence[npt.NDArray[np.float64]],
+    activations: Sequence[IActivation],
+) -> Tuple[npt.NDArray[np.float64], List[npt.NDArray[np.float64]]]:
+    """
+    Матричный аналог :func:`forward_propagation`: одно произведение матрицы на вектор на слой.
+
+    Возвращает тот же контракт (outputs, weighted_sums_output), но в виде ndarray.
+    """
+    layer_outputs, weighted_sums_output = forward_layers(inputs, weights, activations)
+    return layer_outputs[-1], weighted_sums_output
@@ -0,0 +1,3 @@
+from lib.perceptrone.learning_rate.schedules import ReduceOnPlateau, build_learning_rate_schedule
+
+__all__ = ["ReduceOnPlateau", "build_learning_rate_schedule"]
@@ -0,0 +1,119 @@
+"""Расписания скорости обучения перцептрона: массив η(e) на все эпохи, посчитанный заранее."""
+
+import numpy as np
+import numpy.typing as npt
+
+from exceptions import ArgumentException
+from lib.perceptrone.models.learning_rate import LearningRateScheduleType
+from log import logger
+
+
+def build_learning_rate_schedule(
+    schedule_type: LearningRateScheduleType,
+    learning_rate: float,
+    epochs: int,
+    decay: float = 0.5,
+    step_size: int = 10,
+    min_learning_rate: float = 0.0,
+    warmup_epochs: int = 0,
+) -> npt.NDArray[np.float64]:
+    """
+    Скорость обучения для каждой эпохи e = 0 … epochs-1 (формулы — в readme.md этого пакета).
+
+    Args:
+        schedule_type: вид расписания
+        learning_rate: начальная скорость η0
+        epochs: число эпох E
+        decay: γ для STEP и EXPONENTIAL (для REDUCE_ON_PLATEAU — множитель :class:`ReduceOnPlateau`)
+        step_size: через сколько эпох STEP умножает скорость на γ
+        min_learning_rate: нижняя граница для COSINE
+        warmup_epochs: первые W эпох скорость линейно растёт от η(0)/W до η(W-1)
+
+    Returns:
+        ndarray формы (epochs,)
+    """
+    if epochs < 1:
+        e_str = f"epochs must be >= 1, got {epochs}"
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+    if learning_rate <= 0.0 or not 0.0 < decay <= 1.0 or step_size < 1:
+        e_str = (
+            f"expected learning_rate > 0, 0 < decay <= 1, step_size >= 1, "
+            f"got {learning_rate}, {decay}, {step_size}"
+        )
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+    if min_learning_rate < 0.0 or warmup_epochs < 0:
+        e_str = (
+            f"expected min_learning_rate >= 0 and warmup_epochs >= 0, "
+            f"got {min_learning_rate}, {warmup_epochs}"
+        )
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+    # нижняя граница есть только у COSINE, остальные расписания её не читают
+    if schedule_type == LearningRateScheduleType.COSINE and min_learning_rate > learning_rate:
+        e_str = f"expected min_learning_rate <= learning_rate for COSINE, got {min_learning_rate} > {learning_rate}"
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+
+    e = np.arange(epochs, dtype=np.float64)
+
+    if schedule_type == LearningRateScheduleType.STEP:
+        rates = learning_rate * decay ** np.floor(e / step_size)
+    elif schedule_type == LearningRateScheduleType.EXPONENTIAL:
+        rates = learning_rate * decay ** e
+    elif schedule_type == LearningRateScheduleType.COSINE:
+        progress = e / (epochs - 1) if epochs > 1 else np.zeros(1)
+        rates = min_learning_rate + 0.5 * (learning_rate - min_learning_rate) * (1.0 + np.cos(np.pi * progress))
+    else:
+        # CONSTANT и REDUCE_ON_PLATEAU: снижение на плато зависит от loss и делается по ходу обучения
+        rates = np.full(epochs, learning_rate, dtype=np.float64)
+
+    warmup = min(warmup_epochs, epochs)
+    if warmup:
+        rates[:warmup] *= np.arange(1, warmup + 1, dtype=np.float64) / warmup
+
+    return rates
+
+
+class ReduceOnPlateau:
+    """
+    Множитель скорости обучения, который уменьшается в ``factor`` раз, если loss
+    ``patience`` оценок подряд не улучшался больше чем на ``min_delta``.
+    """
+
+    factor: float
+    patience: int
+    min_delta: float
+    scale: float
+    best_loss: float
+    evaluations_without_improvement: int
+
+    def __init__(self, factor: float = 0.5, patience: int = 10, min_delta: float = 0.0):
+        if not 0.0 < factor <= 1.0 or patience < 1 or min_delta < 0:
+            e_str = (
+                f"expected 0 < factor <= 1, patience >= 1, min_delta >= 0, "
+                f"got {factor}, {patience}, {min_delta}"
+            )
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        self.factor = factor
+        self.patience = patience
+        self.min_delta = min_delta
+        self.scale = 1.0
+        self.best_loss = float("inf")
+        self.evaluations_without_improvement = 0
+
+    def update(self, loss: float) -> float:
+        """Учитывает loss эпохи и возвращает текущий множитель скорости."""
+        if loss < self.best_loss - self.min_delta:
+            self.best_loss = loss
+            self.evaluations_without_improvement = 0
+            return self.scale
+
+        self.evaluations_without_improvement += 1
+        if self.evaluations_without_improvement >= self.patience:
+            self.scale *= self.factor
+            self.evaluations_without_improvement = 0
+        return self.scale
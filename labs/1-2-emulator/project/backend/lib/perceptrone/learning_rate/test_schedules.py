@@ -0,0 +1,54 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.learning_rate import ReduceOnPlateau, build_learning_rate_schedule
+from lib.perceptrone.models.learning_rate import LearningRateScheduleType
+
+from log import logger
+from exceptions import ArgumentException
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 1e-9
+
+
+def test_learning_rate_schedules():
+    """
+    Массивы расписаний на 5 эпох и снижение скорости на плато.
+    """
+    t = LearningRateScheduleType
+    cases = [
+        ({"schedule_type": t.CONSTANT}, [0.1, 0.1, 0.1, 0.1, 0.1]),
+        ({"schedule_type": t.STEP, "step_size": 2}, [0.1, 0.1, 0.05, 0.05, 0.025]),
+        ({"schedule_type": t.EXPONENTIAL, "decay": 0.9}, [0.1, 0.09, 0.081, 0.0729, 0.06561]),
+        ({"schedule_type": t.COSINE, "min_learning_rate": 0.02}, [0.1, 0.0882842712, 0.06, 0.0317157288, 0.02]),
+        ({"schedule_type": t.CONSTANT, "warmup_epochs": 2}, [0.05, 0.1, 0.1, 0.1, 0.1]),
+        # min_learning_rate читает только COSINE
+        ({"schedule_type": t.STEP, "step_size": 2, "min_learning_rate": 0.5}, [0.1, 0.1, 0.05, 0.05, 0.025]),
+    ]
+
+    errors: List[Any] = list()
+    for kwargs, expected in cases:
+        received = build_learning_rate_schedule(learning_rate=0.1, epochs=5, **kwargs)  # type: ignore[arg-type]
+        if not np.allclose(received, expected, atol=TOLERANCE):
+            logger.error(f" Test error. learning rate schedule {kwargs}")
+            errors.append({"params": kwargs, "expected": expected, "received": received.tolist()})
+
+    try:
+        build_learning_rate_schedule(t.COSINE, learning_rate=0.1, epochs=5, min_learning_rate=0.5)
+        errors.append({"params": "COSINE with min_learning_rate > learning_rate", "received": "no exception"})
+    except ArgumentException:
+        pass
+
+    plateau = ReduceOnPlateau(factor=0.5, patience=2)
+    scales = [plateau.update(loss) for loss in [1.0, 0.9, 0.95, 0.91, 0.92, 0.8, 0.85, 0.85]]
+    expected_scales = [1.0, 1.0, 1.0, 0.5, 0.5, 0.5, 0.5, 0.25]
+    if scales != expected_scales:
+        logger.error(" Test error. ReduceOnPlateau scales")
+        errors.append({"plateau": True, "expected": expected_scales, "received": scales})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_learning_rate_schedules complete!")
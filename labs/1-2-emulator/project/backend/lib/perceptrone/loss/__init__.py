@@ -1 +1,2 @@
-from lib.perceptrone.loss.loss import * # type: ignore[unused-variable]
\ No newline at end of file
+from lib.perceptrone.loss.loss import * # type: ignore[unused-variable]
+from lib.perceptrone.loss.softmax_cross_entropy import * # type: ignore[unused-variable]
\ No newline at end of file
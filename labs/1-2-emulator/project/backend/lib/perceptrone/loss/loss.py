@@ -1,6 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import math
 
+import numpy as np
+import numpy.typing as npt
+
 from exceptions import ArgumentException
 from log import logger
 
@@ -20,6 +23,10 @@ class MSE(ILoss):
             raise ArgumentException(e_str)
         
         return sum([(expected[i] - outputs[i])**2 for i in range(len(outputs))])
+
+    def perform_batch(self, expected: npt.NDArray[np.float64], outputs: npt.NDArray[np.float64],
+                      out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        return np.sum(np.square(expected - outputs), axis=-1, out=out)
     
     def get_type(self) -> LossType:
         return LossType.MSE
@@ -48,6 +55,11 @@ class CrossEntropy(ILoss):
             expected[i] * math.log(max(outputs[i], self._EPS)) #type: ignore
             for i in range(len(outputs))
         )
+
+    def perform_batch(self, expected: npt.NDArray[np.float64], outputs: npt.NDArray[np.float64],
+                      out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        out = np.sum(expected * np.log(np.maximum(outputs, self._EPS)), axis=-1, out=out)
+        return np.negative(out, out=out)
     
     def get_type(self) -> LossType:
         return LossType.CROSS_ENTROPY
@@ -0,0 +1,67 @@
+"""
+Soft-max + Cross-Entropy, посчитанные вместе прямо по взвешенным суммам (логитам) z выходного слоя.
+
+    L = -sum_j d_j · log(softmax(z)_j) = logsumexp(z) - sum_j d_j · z_j        (при sum_j d_j = 1)
+    dL/dz_j = softmax(z)_j - d_j = y_j - d_j
+
+logsumexp(z) = max(z) + log(sum_j e^(z_j - max(z))) — ни одна экспонента не переполняется,
+а log(0) не возникает, поэтому клип, как в :class:`CrossEntropy`, не нужен.
+Все функции принимают один пример (k,) или пакет (batch, k).
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+
+def _log_sum_exp(logits: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    z_max = np.max(logits, axis=-1, keepdims=True)
+    return (z_max + np.log(np.sum(np.exp(logits - z_max), axis=-1, keepdims=True)))[..., 0]
+
+
+def softmax_cross_entropy_loss(
+    logits: npt.NDArray[np.float64],
+    expected: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Loss для каждого примера (скаляр для одного примера, (batch,) для пакета)."""
+    return _log_sum_exp(logits) - np.sum(expected * logits, axis=-1)
+
+
+def softmax_cross_entropy_gradient(
+    logits: npt.NDArray[np.float64],
+    expected: npt.NDArray[np.float64],
+    out: Optional[npt.NDArray[np.float64]] = None,
+) -> npt.NDArray[np.float64]:
+    """Градиент по логитам y - d; при переданном ``out`` считается на месте."""
+    out = np.subtract(logits, np.max(logits, axis=-1, keepdims=True), out=out)
+    np.exp(out, out=out)
+    out /= np.sum(out, axis=-1, keepdims=True)
+    out -= expected
+    return out
+
+
+def softmax_cross_entropy(
+    logits: npt.NDArray[np.float64],
+    expected: npt.NDArray[np.float64],
+    gradient_out: Optional[npt.NDArray[np.float64]] = None,
+    losses_out: Optional[npt.NDArray[np.float64]] = None,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Loss и градиент за один проход по логитам. ``gradient_out`` / ``losses_out`` — буферы для результатов.
+
+    Returns:
+        (losses, gradient) — loss каждого примера и dL/dz той же формы, что ``logits``
+    """
+    d_dot_z = np.sum(expected * logits, axis=-1)
+    z_max = np.max(logits, axis=-1, keepdims=True)
+
+    gradient = np.subtract(logits, z_max, out=gradient_out)
+    np.exp(gradient, out=gradient)
+    exp_sum = np.sum(gradient, axis=-1, keepdims=True)
+    gradient /= exp_sum
+    gradient -= expected
+
+    np.log(exp_sum, out=exp_sum)
+    exp_sum += z_max
+    losses = np.subtract(exp_sum[..., 0], d_dot_z, out=losses_out)
+    return losses, gradient
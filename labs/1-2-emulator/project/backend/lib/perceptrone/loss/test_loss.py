@@ -0,0 +1,47 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.loss import MSE, CrossEntropy
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 0.0001
+
+EXPECTED = [
+    [0.0, 0.0, 1.0],
+    [1.0, 0.0, 0.0],
+]
+OUTPUTS = [
+    [0.2, 0.1, 0.7],
+    [0.0, 0.6, 0.4],
+]
+
+
+def test_loss_perform_batch_matches_scalar():
+    """
+    perform_batch по пакету совпадает с perform для каждой строки
+    (для cross-entropy — включая клип нулевой вероятности).
+    """
+    errors: List[Any] = list()
+
+    for loss in (MSE(), CrossEntropy()):
+        out = np.empty(len(OUTPUTS))
+        batch = loss.perform_batch(np.asarray(EXPECTED), np.asarray(OUTPUTS), out=out)
+
+        for n in range(len(OUTPUTS)):
+            expected = loss.perform(EXPECTED[n], OUTPUTS[n])
+            if abs(batch[n] - expected) > TOLERANCE:
+                logger.error(f" Test error. {loss.get_type()} perform_batch | sample {n}")
+                errors.append({"loss": loss.get_type(), "sample": n,
+                               "expected": expected, "received": float(batch[n])})
+
+        if batch is not out:
+            errors.append({"loss": loss.get_type(), "out": "result was not written into the passed buffer"})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_loss_perform_batch_matches_scalar complete!")
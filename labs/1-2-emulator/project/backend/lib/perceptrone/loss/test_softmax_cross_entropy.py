@@ -0,0 +1,73 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.loss import CrossEntropy
+from lib.perceptrone.loss.softmax_cross_entropy import (
+    softmax_cross_entropy,
+    softmax_cross_entropy_gradient,
+    softmax_cross_entropy_loss,
+)
+from lib.perceptrone.training.activation.activation import SoftMax
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 0.0001
+
+LOGITS = [
+    [0.2, -1.3, 2.1],
+    [3.0, 3.0, -0.5],
+    [1000.0, 999.0, 0.0],
+]
+EXPECTED = [
+    [0.0, 0.0, 1.0],
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+]
+
+
+def test_softmax_cross_entropy_matches_separate():
+    """
+    Loss и градиент по логитам совпадают с SoftMax + CrossEntropy, посчитанными по отдельности,
+    а для логитов ~1000 остаются конечными.
+    """
+    logits = np.asarray(LOGITS)
+    expected = np.asarray(EXPECTED)
+
+    gradient_out = np.empty_like(logits)
+    losses, gradient = softmax_cross_entropy(logits, expected, gradient_out=gradient_out)
+    losses_only = softmax_cross_entropy_loss(logits, expected)
+    gradient_only = softmax_cross_entropy_gradient(logits[0], expected[0])
+
+    errors: List[Any] = list()
+    for n in range(len(LOGITS)):
+        softmax = SoftMax()
+        softmax.set_layer_outputs(LOGITS[n])
+        probabilities = [softmax.perform(s) for s in LOGITS[n]]
+        expected_loss = CrossEntropy().perform(EXPECTED[n], probabilities)
+
+        for received in (losses[n], losses_only[n]):
+            if not np.isfinite(received) or abs(received - expected_loss) > TOLERANCE:
+                logger.error(f" Test error. incorrect loss | sample {n}")
+                errors.append({"sample": n, "expected": expected_loss, "received": float(received)})
+
+        for j in range(len(LOGITS[n])):
+            expected_gradient = probabilities[j] - EXPECTED[n][j]
+            if abs(gradient[n][j] - expected_gradient) > TOLERANCE:
+                logger.error(f" Test error. incorrect gradient | sample {n} | class {j}")
+                errors.append({"position": (n, j), "expected": expected_gradient,
+                               "received": float(gradient[n][j])})
+            if n == 0 and abs(gradient_only[j] - expected_gradient) > TOLERANCE:
+                logger.error(f" Test error. incorrect single-sample gradient | class {j}")
+                errors.append({"position": (n, j), "expected": expected_gradient,
+                               "received": float(gradient_only[j])})
+
+    if gradient is not gradient_out:
+        errors.append({"gradient_out": "result was not written into the passed buffer"})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_softmax_cross_entropy_matches_separate complete!")
@@ -1,2 +1,4 @@
 from lib.perceptrone.mathh.models.perceptrone import Perceptron # type: ignore
-from lib.perceptrone.mathh.models.sample import Sample # type: ignore
\ No newline at end of file
+from lib.perceptrone.mathh.models.sample import Sample # type: ignore
+from lib.perceptrone.mathh.models.compact_perceptron import CompactPerceptron # type: ignore
+from lib.perceptrone.mathh.models.compiled_perceptron import CompiledPerceptron # type: ignore
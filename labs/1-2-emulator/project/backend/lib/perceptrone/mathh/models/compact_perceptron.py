@@ -0,0 +1,105 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from exceptions.argument_exception import ArgumentException
+from lib.perceptrone.mathh.np_mv import flat_layer_views
+from log import logger
+
+
+class CompactPerceptron:
+    """
+    Веса перцептрона в одном непрерывном float64-буфере.
+
+    ``layers[q]`` — view формы (n_q, n_{q-1}) на свой участок ``buffer``, поэтому
+    изменения через ``layers`` (например, ``+=`` в обучении) сразу видны в ``buffer``.
+    Копия сети — одно копирование буфера, а не обход вложенных списков.
+    Для API/JSON веса по-прежнему выдаются списками через :meth:`to_lists`.
+    """
+
+    shapes: List[Tuple[int, int]]
+    buffer: npt.NDArray[np.float64]
+    layers: List[npt.NDArray[np.float64]]
+
+    def __init__(self, shapes: Sequence[Tuple[int, int]], buffer: Optional[npt.NDArray[np.float64]] = None):
+        """
+        Args:
+            shapes: формы матриц слоёв (n_q, n_{q-1})
+            buffer: готовый плоский float64-буфер нужной длины (например, в общей памяти процессов);
+                если не передан — выделяется новый. Значения весов не инициализируются.
+        """
+        if not shapes:
+            e_str = "Weights list cannot be empty"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        for q in range(1, len(shapes)):
+            if shapes[q][1] != shapes[q - 1][0]:
+                e_str = (
+                    f"layer {q} expects {shapes[q][1]} inputs, "
+                    f"but layer {q - 1} has {shapes[q - 1][0]} neurons"
+                )
+                logger.error(e_str)
+                raise ArgumentException(e_str)
+
+        self.shapes = [(int(n_out), int(n_in)) for n_out, n_in in shapes]
+        size = sum(n_out * n_in for n_out, n_in in self.shapes)
+        if buffer is None:
+            buffer = np.empty(size, dtype=np.float64)
+        elif buffer.shape != (size,) or buffer.dtype != np.float64:
+            e_str = f"buffer must be a flat float64 array of length {size}, got {buffer.dtype} {buffer.shape}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        self.buffer = buffer
+        self.layers = flat_layer_views(self.buffer, self.shapes)
+
+    @classmethod
+    def from_lists(cls, weights: Sequence[Sequence[Sequence[float]]]) -> "CompactPerceptron":
+        """Из вложенных списков weights[q][i][j] (формат NNData / JSON)."""
+        if not weights:
+            e_str = "Weights list cannot be empty"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        model = cls([(len(layer), len(layer[0])) for layer in weights])
+        for q, layer in enumerate(weights):
+            try:
+                model.layers[q][...] = layer
+            except ValueError as e:
+                e_str = f"layer {q} is not a rectangular matrix: {e}"
+                logger.error(e_str)
+                raise ArgumentException(e_str)
+        return model
+
+    @classmethod
+    def from_layers(cls, layers: Sequence[npt.NDArray[np.float64]]) -> "CompactPerceptron":
+        """Из отдельных матриц слоёв (данные копируются в общий буфер)."""
+        model = cls([layer.shape for layer in layers])  # type: ignore[misc]
+        for q, layer in enumerate(layers):
+            model.layers[q][...] = layer
+        return model
+
+    def to_lists(self) -> List[List[List[float]]]:
+        """Вложенные списки для API / JSON."""
+        return [layer.tolist() for layer in self.layers]
+
+    def copy(self) -> "CompactPerceptron":
+        """Независимая копия: одно копирование буфера."""
+        model = CompactPerceptron(self.shapes)
+        np.copyto(model.buffer, self.buffer)
+        return model
+
+    def copy_from(self, other: "CompactPerceptron") -> None:
+        """Перезаписывает веса весами ``other`` той же архитектуры без выделения памяти."""
+        if self.shapes != other.shapes:
+            e_str = f"architectures do not match: {self.shapes} and {other.shapes}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+        np.copyto(self.buffer, other.buffer)
+
+    @property
+    def architecture(self) -> List[int]:
+        """Число нейронов в каждом слое, включая входной."""
+        return [self.shapes[0][1]] + [n_out for n_out, _ in self.shapes]
@@ -0,0 +1,122 @@
+import io
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from exceptions.argument_exception import ArgumentException
+from lib.perceptrone.forwrdpropagation.vectorized_forward_propagation import forward_layers
+from lib.perceptrone.mathh.np_mv import fold_min_max_into_layer, to_layer_arrays
+from lib.perceptrone.models.activation import ActivationType, IActivation
+from lib.perceptrone.training.activation.activation import ACTIVATIONS, SoftMax
+from log import logger
+
+
+class CompiledPerceptron:
+    """
+    Готовая к инференсу сеть, принимающая ненормализованные признаки.
+
+    Min-max нормализация — аффинное отображение, поэтому она вложена в первый слой:
+    ``layers[0]`` уже поделён на (max - min) по столбцам, а ``bias`` добавляется к его
+    взвешенным суммам (см. :func:`fold_min_max_into_layer`). Остальные слои — как в проекте.
+
+    Объекты активаций создаются один раз на каждое сочетание (activation_type, softmax_use);
+    векторные активации не хранят состояния, поэтому модель можно использовать из нескольких потоков.
+    Модель сохраняется в .npz (:meth:`to_npz`) и загружается без проекта (:meth:`from_npz`).
+    """
+
+    layers: List[npt.NDArray[np.float64]]
+    bias: npt.NDArray[np.float64]
+    classes: List[str]
+
+    def __init__(
+        self,
+        layers: Sequence[npt.NDArray[np.float64]],
+        bias: npt.NDArray[np.float64],
+        classes: Sequence[str],
+    ):
+        self.layers = list(layers)
+        self.bias = bias
+        self.classes = list(classes)
+        self._activations: Dict[Tuple[str, bool], List[IActivation]] = {}
+
+    @classmethod
+    def compile(
+        cls,
+        weights: Sequence[Sequence[Sequence[float]]],
+        mins: Sequence[float],
+        maxs: Sequence[float],
+        classes: Sequence[str],
+    ) -> "CompiledPerceptron":
+        """Из весов проекта и границ нормализации его признаков."""
+        layers = to_layer_arrays(weights)
+        layers[0], bias = fold_min_max_into_layer(layers[0], mins, maxs)
+        return cls(layers, bias, classes)
+
+    @property
+    def input_size(self) -> int:
+        return self.layers[0].shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(layer.nbytes for layer in self.layers) + self.bias.nbytes
+
+    def activations(self, activation_type: ActivationType, softmax_use: bool) -> List[IActivation]:
+        key = (activation_type, softmax_use)
+        activations = self._activations.get(key)
+        if activations is None:
+            activations = [ACTIVATIONS[activation_type]() for _ in self.layers]
+            if softmax_use:
+                activations[-1] = SoftMax()
+            self._activations[key] = activations
+        return activations
+
+    def predict(
+        self,
+        input_matrix: npt.NDArray[np.float64],
+        activation_type: ActivationType,
+        softmax_use: bool,
+    ) -> npt.NDArray[np.float64]:
+        """Выходы сети (batch, classes_count) для ненормализованных строк признаков (batch, input_size)."""
+        if input_matrix.ndim != 2 or input_matrix.shape[1] != self.input_size:
+            e_str = f"expected a matrix with {self.input_size} columns, got shape {input_matrix.shape}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        activations = self.activations(activation_type, softmax_use)
+        first_sums = input_matrix @ self.layers[0].T
+        first_sums += self.bias
+        current = activations[0].perform_vector(first_sums, out=first_sums)
+        if len(self.layers) == 1:
+            return current
+
+        layer_outputs, _ = forward_layers(current, self.layers[1:], activations[1:])
+        return layer_outputs[-1]
+
+    def to_npz(
+        self,
+        activation_type: Optional[ActivationType] = None,
+        softmax_use: Optional[bool] = None,
+    ) -> bytes:
+        """
+        Артефакт .npz: ``layer_0`` … ``layer_{n-1}``, ``bias``, ``classes`` и, если переданы,
+        ``activation_type`` / ``softmax_use`` — с какими активациями модель обучалась.
+        """
+        arrays: Dict[str, npt.NDArray] = {f"layer_{q}": layer for q, layer in enumerate(self.layers)}
+        arrays["bias"] = self.bias
+        arrays["classes"] = np.asarray(self.classes, dtype=np.str_)
+        if activation_type is not None:
+            arrays["activation_type"] = np.asarray(activation_type.value, dtype=np.str_)
+        if softmax_use is not None:
+            arrays["softmax_use"] = np.asarray(softmax_use)
+
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_npz(cls, content: bytes) -> "CompiledPerceptron":
+        with np.load(io.BytesIO(content), allow_pickle=False) as data:
+            layers_count = sum(1 for name in data.files if name.startswith("layer_"))
+            layers = [np.ascontiguousarray(data[f"layer_{q}"], dtype=np.float64) for q in range(layers_count)]
+            return cls(layers, np.asarray(data["bias"], dtype=np.float64), data["classes"].tolist())
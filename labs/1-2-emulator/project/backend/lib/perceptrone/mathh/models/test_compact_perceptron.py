@@ -0,0 +1,56 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.mathh.models import CompactPerceptron
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+WEIGHTS = \
+[
+    [
+        [0.1, 0.4],
+        [0.8, -0.3],
+        [0.2, 0.9],
+    ],[
+        [-0.2, 0.6, 0.5]
+    ]
+]
+
+
+def test_compact_perceptron_views_and_copy():
+    """
+    Слои — view на общий буфер, to_lists возвращает исходные списки,
+    copy / copy_from дают независимые веса.
+    """
+    errors: List[Any] = list()
+
+    model = CompactPerceptron.from_lists(WEIGHTS)
+    if model.to_lists() != WEIGHTS:
+        errors.append({"to_lists": model.to_lists()})
+    if model.architecture != [2, 3, 1]:
+        errors.append({"architecture": model.architecture})
+
+    for q, layer in enumerate(model.layers):
+        if not np.shares_memory(layer, model.buffer):
+            logger.error(f" Test error. layer {q} is not a view of the buffer")
+            errors.append({"layer": q, "view": False})
+
+    snapshot = model.copy()
+    model.layers[1] += 1.0
+    if model.buffer[-1] != WEIGHTS[1][0][2] + 1.0:
+        errors.append({"buffer": "in-place layer update is not visible in buffer"})
+    if snapshot.to_lists() != WEIGHTS:
+        logger.error(" Test error. snapshot changed together with the model")
+        errors.append({"snapshot": snapshot.to_lists()})
+
+    model.copy_from(snapshot)
+    if model.to_lists() != WEIGHTS:
+        errors.append({"copy_from": model.to_lists()})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_compact_perceptron_views_and_copy complete!")
@@ -0,0 +1,65 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.forwrdpropagation.vectorized_forward_propagation import vectorized_forward_propagation
+from lib.perceptrone.mathh.models import CompiledPerceptron
+from lib.perceptrone.mathh.mv import min_max_signs_normalize
+from lib.perceptrone.mathh.np_mv import to_layer_arrays
+from lib.perceptrone.models.activation import ActivationType
+from lib.perceptrone.training.activation.activation import Sigmoid, SoftMax
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 1e-9
+
+WEIGHTS = \
+[
+    [
+        [0.1, 0.4],
+        [0.8, -0.3],
+        [0.2, 0.9],
+    ],[
+        [-0.2, 0.6, 0.5],
+        [0.7, -0.1, 0.3],
+    ]
+]
+MINS = [10.0, 100.0]
+MAXS = [30.0, 300.0]
+RAW_INPUTS = [[10.0, 100.0], [20.0, 250.0], [35.0, 90.0]]
+
+
+def test_compiled_perceptron_matches_normalized_forward():
+    """
+    Сеть со вложенной в первый слой нормализацией на исходных признаках даёт те же выходы,
+    что нормализация + прямой проход по весам проекта; .npz-артефакт воспроизводит модель.
+    """
+    errors: List[Any] = list()
+
+    model = CompiledPerceptron.compile(WEIGHTS, MINS, MAXS, ["a", "b"])
+    compiled = model.predict(np.asarray(RAW_INPUTS), ActivationType.SIGMOID, True)
+    restored = CompiledPerceptron.from_npz(model.to_npz(ActivationType.SIGMOID, True))
+    reloaded = restored.predict(np.asarray(RAW_INPUTS), ActivationType.SIGMOID, True)
+
+    for i, raw in enumerate(RAW_INPUTS):
+        normalized = min_max_signs_normalize(raw, maxs=MAXS, mins=MINS, signs_count=len(raw))
+        expected, _ = vectorized_forward_propagation(
+            np.asarray(normalized), to_layer_arrays(WEIGHTS), [Sigmoid(), SoftMax()],
+        )
+        for j in range(len(expected)):
+            if abs(compiled[i][j] - expected[j]) > TOLERANCE:
+                logger.error(f" Test error. compiled output row {i} index {j}")
+                errors.append({"row": i, "index": j, "expected": float(expected[j]), "received": float(compiled[i][j])})
+            if reloaded[i][j] != compiled[i][j]:
+                logger.error(f" Test error. npz round trip row {i} index {j}")
+                errors.append({"row": i, "index": j, "compiled": float(compiled[i][j]), "reloaded": float(reloaded[i][j])})
+
+    if restored.classes != ["a", "b"]:
+        errors.append({"classes": restored.classes})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_compiled_perceptron_matches_normalized_forward complete!")
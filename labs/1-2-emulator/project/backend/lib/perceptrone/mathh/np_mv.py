@@ -0,0 +1,113 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from exceptions.argument_exception import ArgumentException
+from log import logger
+
+
+def to_layer_arrays(weights: Sequence[Sequence[Sequence[float]]]) -> List[npt.NDArray[np.float64]]:
+    """
+    Converts nested weight lists into contiguous per-layer float64 matrices.
+
+    weights[q] of shape (n_out, n_in) becomes an ndarray of the same shape.
+    """
+    if not weights:
+        e_str = "Weights list cannot be empty"
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+
+    return [np.ascontiguousarray(layer, dtype=np.float64) for layer in weights]
+
+
+def to_nested_lists(layers: Sequence[npt.NDArray[np.float64]]) -> List[List[List[float]]]:
+    """
+    Inverse of :func:`to_layer_arrays`: per-layer matrices back to nested lists (for JSON / API).
+    """
+    return [layer.tolist() for layer in layers]
+
+
+def flat_layer_views(
+    buffer: npt.NDArray[np.float64],
+    shapes: Sequence[Tuple[int, int]],
+) -> List[npt.NDArray[np.float64]]:
+    """
+    Splits a flat buffer into per-layer (n_out, n_in) views, laid out one after another.
+
+    Writes through the views land in ``buffer``, so the whole network can also be
+    processed as one contiguous vector.
+    """
+    views: List[npt.NDArray[np.float64]] = []
+    offset = 0
+    for n_out, n_in in shapes:
+        views.append(buffer[offset:offset + n_out * n_in].reshape(n_out, n_in))
+        offset += n_out * n_in
+    return views
+
+
+def min_max_bounds(
+    signs_matrix: npt.NDArray[np.float64],
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Column-wise (mins, maxs) of a (batch, signs_count) matrix, as in :func:`mv.min_max_samples_normalaize`."""
+    if signs_matrix.ndim != 2 or signs_matrix.shape[0] == 0:
+        e_str = f"expected a non-empty (batch, signs_count) matrix, got shape {signs_matrix.shape}"
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+    return signs_matrix.min(axis=0), signs_matrix.max(axis=0)
+
+
+def min_max_matrix_normalize(
+    signs_matrix: npt.NDArray[np.float64],
+    mins: Sequence[float],
+    maxs: Sequence[float],
+) -> npt.NDArray[np.float64]:
+    """
+    Row-wise analogue of :func:`mv.min_max_signs_normalize` for a (batch, signs_count) matrix:
+    (x - min) / (max - min) per column, computed in place on a fresh copy.
+    Constant features (max == min) become 0, as in :func:`fold_min_max_into_layer`.
+    """
+    signs_count = len(mins)
+    if len(maxs) != signs_count:
+        e_str = "The size of the maxs array is not equal to the size of the mins array"
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+    if signs_matrix.ndim != 2 or signs_matrix.shape[1] != signs_count:
+        e_str = f"expected a matrix with {signs_count} columns, got shape {signs_matrix.shape}"
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+
+    mins_row = np.asarray(mins, dtype=np.float64)
+    normalized = np.subtract(signs_matrix, mins_row, dtype=np.float64)
+    ranges = np.asarray(maxs, dtype=np.float64) - mins_row
+    normalized *= np.divide(1.0, ranges, out=np.zeros_like(ranges), where=ranges != 0.0)
+    return normalized
+
+
+def fold_min_max_into_layer(
+    layer: npt.NDArray[np.float64],
+    mins: Sequence[float],
+    maxs: Sequence[float],
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Absorbs min-max normalization into a (n_out, signs_count) layer.
+
+    W · ((x - min) / (max - min)) = (W / (max - min)) · x - (W / (max - min)) · min,
+    so the layer applied to raw x gives the same weighted sums as the original layer applied
+    to normalized x. Columns of constant features (max == min) are zeroed.
+
+    Returns:
+        (folded_layer, bias) — weighted sums are ``x @ folded_layer.T + bias``
+    """
+    if layer.shape[1] != len(mins) or len(mins) != len(maxs):
+        e_str = f"layer with {layer.shape[1]} inputs does not match {len(mins)} mins / {len(maxs)} maxs"
+        logger.error(e_str)
+        raise ArgumentException(e_str)
+
+    mins_row = np.asarray(mins, dtype=np.float64)
+    ranges = np.asarray(maxs, dtype=np.float64) - mins_row
+    scale = np.divide(1.0, ranges, out=np.zeros_like(ranges), where=ranges != 0.0)
+
+    folded = layer * scale
+    bias = -(folded @ mins_row)
+    return folded, bias
@@ -1,11 +1,14 @@
 from typing import Any, List
 
+import numpy as np
+
 from lib.perceptrone.mathh.models import Sample
 from lib.perceptrone.mathh.mv import (
     min_max_function,
     min_max_signs_normalize,
     min_max_samples_normalaize,
 )
+from lib.perceptrone.mathh.np_mv import min_max_bounds, min_max_matrix_normalize
 
 from log import logger
 from exceptions.test_exception import TestException
@@ -150,3 +153,61 @@ def test_min_max_samples_normalize():
         raise TestException(f" errors: {errors}")
     else:
         logger.info("test_min_max_samples_normalize complete!")
+
+
+def test_min_max_matrix_normalize():
+    """
+    min_max_bounds находит те же mins / maxs, что min_max_samples_normalaize;
+    min_max_matrix_normalize для матрицы признаков совпадает с min_max_signs_normalize,
+    применённым к каждой строке отдельно, и не изменяет входную матрицу.
+    """
+    errors: List[Any] = list()
+
+    mins, maxs = min_max_bounds(np.asarray([s.signs for s in SAMPLES], dtype=np.float64))
+    if mins.tolist() != EXPECTED_MINS or maxs.tolist() != EXPECTED_MAXS:
+        logger.error(" Test error. min_max_bounds")
+        errors.append({"expected": (EXPECTED_MINS, EXPECTED_MAXS), "received": (mins.tolist(), maxs.tolist())})
+
+    signs_matrix = np.asarray([s.signs for s in SAMPLES] + [[15.0, 350.0]], dtype=np.float64)
+    original = signs_matrix.copy()
+
+    result = min_max_matrix_normalize(signs_matrix, mins=EXPECTED_MINS, maxs=EXPECTED_MAXS)
+    for i, row in enumerate(original):
+        expected = min_max_signs_normalize(
+            signs=row.tolist(), maxs=EXPECTED_MAXS, mins=EXPECTED_MINS, signs_count=SIGNS_COUNT,
+        )
+        for j in range(SIGNS_COUNT):
+            if abs(result[i][j] - expected[j]) > TOLERANCE:
+                logger.error(f" Test error. min_max_matrix_normalize row {i} sign {j}")
+                errors.append({"row": i, "sign": j, "expected": expected[j], "received": float(result[i][j])})
+
+    if not np.array_equal(signs_matrix, original):
+        logger.error(" Test error. min_max_matrix_normalize modified its input")
+        errors.append({"input": "modified"})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_min_max_matrix_normalize complete!")
+
+
+def test_min_max_matrix_normalize_constant_column():
+    """
+    Постоянный признак (max == min) нормализуется в 0, а не в NaN: иначе обучение
+    на таком CSV получает NaN-loss и не меняет веса.
+    """
+    errors: List[Any] = list()
+
+    signs_matrix = np.asarray([[1.0, 5.0, 0.0], [2.0, 5.0, 4.0], [3.0, 5.0, 2.0]], dtype=np.float64)
+    mins, maxs = min_max_bounds(signs_matrix)
+    result = min_max_matrix_normalize(signs_matrix, mins=mins, maxs=maxs)  # type: ignore[arg-type]
+    expected = [[0.0, 0.0, 0.0], [0.5, 0.0, 1.0], [1.0, 0.0, 0.5]]
+
+    if not np.all(np.isfinite(result)) or not np.allclose(result, expected, atol=TOLERANCE):
+        logger.error(" Test error. min_max_matrix_normalize constant column")
+        errors.append({"expected": expected, "received": result.tolist()})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_min_max_matrix_normalize_constant_column complete!")
@@ -1,6 +1,10 @@
 
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
 
 
 class ActivationType(str, Enum):  # str для JSON-сериализации
@@ -30,6 +34,25 @@ class IActivation(ABC):
         """
         pass
 
+    @abstractmethod
+    def perform_vector(self, values: npt.NDArray[np.float64],
+                       out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """
+        Применяет функцию активации сразу ко всему слою.
+
+        Args:
+            values: взвешенные суммы слоя (n,) или пакета слоёв (batch, n) — по последней оси
+            out: буфер для результата той же формы (может совпадать с values).
+                Если передан — новая память не выделяется.
+        """
+        pass
+
+    @abstractmethod
+    def derivative_vector(self, values: npt.NDArray[np.float64],
+                          out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """Производная функции активации для всего слоя сразу (с тем же смыслом ``out``)."""
+        pass
+
     @abstractmethod
     def get_type(self)-> str: pass
 
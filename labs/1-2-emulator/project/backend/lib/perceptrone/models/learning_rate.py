@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class LearningRateScheduleType(str, Enum):
+    """Расписание скорости обучения перцептрона по эпохам (см. lib/perceptrone/learning_rate/readme.md)."""
+
+    CONSTANT = "CONSTANT"
+    STEP = "STEP"
+    EXPONENTIAL = "EXPONENTIAL"
+    COSINE = "COSINE"
+    REDUCE_ON_PLATEAU = "REDUCE_ON_PLATEAU"
@@ -1,9 +1,12 @@
 
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 from enum import Enum
 
+import numpy as np
+import numpy.typing as npt
+
 
 class LossType(str, Enum):
     MSE = "MSE"
@@ -15,5 +18,15 @@ class ILoss(ABC):
     @abstractmethod
     def perform(self, expected:List[float], outputs: List[float]) -> float: pass
 
+    @abstractmethod
+    def perform_batch(self, expected: npt.NDArray[np.float64], outputs: npt.NDArray[np.float64],
+                      out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """
+        Loss для каждой строки пакета (batch, k) -> (batch,) — то же, что perform построчно.
+
+        Args:
+            out: буфер (batch,) для результата (необязательно)
+        """
+
     @abstractmethod
     def get_type(self) -> LossType: pass
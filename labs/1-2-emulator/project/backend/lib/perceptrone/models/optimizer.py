@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+
+import numpy as np
+import numpy.typing as npt
+
+
+class OptimizerType(str, Enum):
+    SGD = "SGD"
+    MOMENTUM = "MOMENTUM"
+    NESTEROV = "NESTEROV"
+    RMSPROP = "RMSPROP"
+    ADAM = "ADAM"
+
+
+class IOptimizer(ABC):
+    """
+    Правило обновления весов по градиенту ∂E/∂w.
+
+    Работает с плоскими буферами всей сети (``CompactPerceptron.buffer`` и
+    ``TrainingWorkspace.gradient_buffer``); состояние (скорости, моменты) хранится
+    в массивах того же размера.
+    """
+
+    learning_rate: float
+
+    @abstractmethod
+    def step(self, params: npt.NDArray[np.float64], gradients: npt.NDArray[np.float64]) -> None:
+        """
+        Обновляет ``params`` на месте.
+
+        Args:
+            params: плоский буфер весов
+            gradients: плоский буфер градиентов той же длины; используется как черновик
+        """
+        pass
+
+    @abstractmethod
+    def get_type(self) -> OptimizerType: pass
@@ -0,0 +1,50 @@
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel
+
+
+class LossEvaluationMode(str, Enum):
+    """
+    Как считается loss эпохи, по которому выбираются лучшие веса.
+
+    FULL      — отдельный прямой проход по всей выборке после каждой эпохи
+    EVERY_N   — такой же проход, но только каждые N эпох (и в последней)
+    SUBSAMPLE — проход по фиксированной случайной подвыборке после каждой эпохи
+    RUNNING   — средний loss пакетов, собранный во время самого обучения (без лишнего прохода)
+    """
+    FULL = "FULL"
+    EVERY_N = "EVERY_N"
+    SUBSAMPLE = "SUBSAMPLE"
+    RUNNING = "RUNNING"
+
+
+class ParallelMode(str, Enum):
+    """
+    Как обучение делится между процессами при workers > 1.
+
+    SYNC    — градиенты частей пакета усредняются, один общий шаг на пакет (как в одном процессе)
+    HOGWILD — каждый процесс обучается на своей части выборки и обновляет общие веса без блокировок
+    """
+    SYNC = "SYNC"
+    HOGWILD = "HOGWILD"
+
+
+class TrainingResult(BaseModel):
+    """
+    Итог обучения перцептрона.
+
+    loss — loss возвращённых (лучших) весов в выбранном режиме оценки;
+    для FULL это точный средний loss по всей выборке.
+    epochs — запрошенное число эпох, stopped_epoch — сколько эпох пройдено на самом деле
+    (меньше epochs, если сработала ранняя остановка).
+    workers — число процессов, на которых шло обучение; utilization — загрузка процессов
+    (время вычислений во всех процессах / реальное время эпох: среднее число занятых процессов,
+    не больше workers; 1.0 для одного процесса).
+    """
+    weights: List[List[List[float]]]
+    loss: float
+    epochs: int
+    stopped_epoch: int
+    workers: int = 1
+    utilization: float = 1.0
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 import math
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
 
 from exceptions import UnexpectedBehaviourException
 from log import logger
@@ -12,16 +15,28 @@ class Rellu(IActivation):
     def perform(self, value: float) -> float:
         """ReLU: f(x) = max(0, x)"""
         return max(0, value)
-    
+
     def derivative(self, value: float) -> float:
         """
         Производная ReLU: f'(x) = 1 если x > 0, иначе 0
-        
+
         Args:
             value: взвешенная сумма (NET вход)
         """
         return 1.0 if value > 0 else 0.0
-    
+
+    def perform_vector(self, values: npt.NDArray[np.float64],
+                       out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """ReLU для всего слоя: max(0, x) поэлементно"""
+        return np.maximum(values, 0.0, out=out)
+
+    def derivative_vector(self, values: npt.NDArray[np.float64],
+                          out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """Производная ReLU для всего слоя: 1.0 там, где x > 0, иначе 0.0"""
+        if out is None:
+            out = np.empty_like(values, dtype=np.float64)
+        return np.greater(values, 0.0, out=out)
+
     def get_type(self) -> str:
         return ActivationType.RELLU
 
@@ -40,10 +55,33 @@ class Sigmoid(IActivation):
         """
         s = self.perform(value)
         return s * (1.0 - s)
-    
+
+    def perform_vector(self, values: npt.NDArray[np.float64],
+                       out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """Sigmoid для всего слоя: 1 / (1 + e^(-x)), по шагам на месте"""
+        out = np.negative(values, out=out)
+        with np.errstate(over="ignore"):
+            np.exp(out, out=out)
+        out += 1.0
+        return np.reciprocal(out, out=out)
+
+    def derivative_vector(self, values: npt.NDArray[np.float64],
+                          out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """
+        Производная Sigmoid для всего слоя.
+
+        f(x) · (1 - f(x)) = 1 / (4 · ch²(x/2)) — тот же результат без временного массива.
+        """
+        out = np.multiply(values, 0.5, out=out)
+        with np.errstate(over="ignore"):
+            np.cosh(out, out=out)
+            np.square(out, out=out)
+            out *= 4.0
+        return np.reciprocal(out, out=out)
+
     def get_type(self) -> str:
         return ActivationType.SIGMOID
-    
+
 
 class ILayerBasedActivation(IActivation, ABC):
 
@@ -51,42 +89,51 @@ class ILayerBasedActivation(IActivation, ABC):
     def set_layer_outputs(self, layer_weights_outputs: List[float] ) -> None:pass
 
 class SoftMax(ILayerBasedActivation):
+    """
+    Soft-max: f(s_j) = e^(s_j) / sum_k(e^(s_k))
+
+    Для устойчивости из всех s_k вычитается max(s): результат тот же, а e^x не переполняется.
+    """
+
+    _layer_max: float
+    _layer_exp_sum: float
 
-    _layer_sums_outputs: List[float]
     def perform(self, value:float) -> float:
-       
-        def exp(value:float)-> float:
-            return math.e**value
-        
-        exp_sum = sum([exp(val) for val in self._layer_sums_outputs])
-
-        return exp(value)/exp_sum
-    
-    def set_layer_outputs(self, layer_weights_outputs:List[float]):
-        self._layer_sums_outputs = layer_weights_outputs
+        # сумма экспонент слоя считается один раз в set_layer_outputs
+        return math.exp(value - self._layer_max) / self._layer_exp_sum
 
-        
-    def derivative(self, value: float) -> float:
+    def set_layer_outputs(self, layer_weights_outputs:List[float]):
+        self._layer_max = max(layer_weights_outputs)
+        self._layer_exp_sum = sum(math.exp(val - self._layer_max) for val in layer_weights_outputs)
+
+    def perform_vector(self, values: npt.NDArray[np.float64],
+                       out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        """Soft-max для всего слоя (или для каждой строки пакета): сдвиг на максимум, одна сумма на слой"""
+        out = np.subtract(values, np.max(values, axis=-1, keepdims=True), out=out)
+        np.exp(out, out=out)
+        out /= np.sum(out, axis=-1, keepdims=True)
+        return out
+
+    def _derivative_not_implemented(self) -> UnexpectedBehaviourException:
         str_e = "For the soft-max activation, the differentiation algorithm (taking the derivative) is not implemented" \
         "Since this behaviour is not used in calculations. The soft-max function is used only on the output layer " \
         "whtch dose not require taking the derivative of the activation function" \
         "to calculate errors."
         logger.error(str_e)
-        raise UnexpectedBehaviourException(str_e)
-        
-        
-    def get_type(self) -> str:
-        return ActivationType.SOFTMAX
-        
+        return UnexpectedBehaviourException(str_e)
+
+    def derivative(self, value: float) -> float:
+        raise self._derivative_not_implemented()
 
+    def derivative_vector(self, values: npt.NDArray[np.float64],
+                          out: Optional[npt.NDArray[np.float64]] = None) -> npt.NDArray[np.float64]:
+        raise self._derivative_not_implemented()
 
-        
-        
-        
+    def get_type(self) -> str:
+        return ActivationType.SOFTMAX
 
-    
 
 ACTIVATIONS:Dict[str, Any] = {
     ActivationType.RELLU: Rellu,
     ActivationType.SIGMOID: Sigmoid
-}
\ No newline at end of file
+}
@@ -0,0 +1,77 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.training.activation.activation import Rellu, Sigmoid, SoftMax
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 0.0001
+
+LAYER_SUMS = [-3.0, -0.5, 0.0, 0.17, 1.2, 4.0]
+
+
+def test_vector_activations_match_scalar():
+    """
+    perform_vector / derivative_vector дают те же значения, что scalar perform / derivative,
+    в том числе при записи в буфер ``out``.
+    """
+    values = np.asarray(LAYER_SUMS)
+    errors: List[Any] = list()
+
+    for activation in (Rellu(), Sigmoid()):
+        out = np.empty_like(values)
+        performed = activation.perform_vector(values, out=out)
+        derivatives = activation.derivative_vector(values)
+
+        for j, s in enumerate(LAYER_SUMS):
+            if abs(performed[j] - activation.perform(s)) > TOLERANCE:
+                logger.error(f" Test error. {activation.get_type()} perform_vector index {j}")
+                errors.append({"activation": activation.get_type(), "index": j,
+                               "expected": activation.perform(s), "received": float(performed[j])})
+            if abs(derivatives[j] - activation.derivative(s)) > TOLERANCE:
+                logger.error(f" Test error. {activation.get_type()} derivative_vector index {j}")
+                errors.append({"activation": activation.get_type(), "index": j,
+                               "expected": activation.derivative(s), "received": float(derivatives[j])})
+
+    softmax = SoftMax()
+    softmax.set_layer_outputs(LAYER_SUMS)
+    softmax_vector = softmax.perform_vector(values)
+    for j, s in enumerate(LAYER_SUMS):
+        if abs(softmax_vector[j] - softmax.perform(s)) > TOLERANCE:
+            logger.error(f" Test error. SOFTMAX perform_vector index {j}")
+            errors.append({"activation": "SOFTMAX", "index": j,
+                           "expected": softmax.perform(s), "received": float(softmax_vector[j])})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_vector_activations_match_scalar complete!")
+
+
+def test_softmax_large_logits():
+    """
+    Soft-max со сдвигом на максимум не переполняется: e^1000 вычислить нельзя,
+    но результат совпадает с soft-max для [0, -1, -1000].
+    """
+    logits = [1000.0, 999.0, 0.0]
+    expected = [1.0 / (1.0 + np.exp(-1.0)), np.exp(-1.0) / (1.0 + np.exp(-1.0)), 0.0]
+
+    softmax = SoftMax()
+    softmax.set_layer_outputs(logits)
+    scalar = [softmax.perform(s) for s in logits]
+    vector = softmax.perform_vector(np.asarray([logits, logits]))
+
+    errors: List[Any] = list()
+    for j in range(len(logits)):
+        for received in (scalar[j], vector[0][j], vector[1][j]):
+            if not np.isfinite(received) or abs(received - expected[j]) > TOLERANCE:
+                logger.error(f" Test error. SOFTMAX large logits index {j}")
+                errors.append({"index": j, "expected": expected[j], "received": float(received)})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_softmax_large_logits complete!")
@@ -0,0 +1,45 @@
+from typing import Optional
+
+from exceptions import ArgumentException
+from log import logger
+
+
+class EarlyStopping:
+    """
+    Остановка обучения, когда loss перестал улучшаться.
+
+    Улучшением считается loss < best - min_delta. Обучение останавливается, если
+    ``patience`` оценок подряд не было улучшения (``patience == 0`` — не останавливаться
+    по плато) или если loss достиг ``target_loss``.
+    """
+
+    patience: int
+    min_delta: float
+    target_loss: Optional[float]
+    best_loss: float
+    evaluations_without_improvement: int
+
+    def __init__(self, patience: int = 0, min_delta: float = 0.0, target_loss: Optional[float] = None):
+        if patience < 0 or min_delta < 0:
+            e_str = f"patience and min_delta must be >= 0, got {patience} and {min_delta}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        self.patience = patience
+        self.min_delta = min_delta
+        self.target_loss = target_loss
+        self.best_loss = float("inf")
+        self.evaluations_without_improvement = 0
+
+    def should_stop(self, loss: float) -> bool:
+        """Учитывает очередной loss эпохи и возвращает True, если обучение пора остановить."""
+        if self.target_loss is not None and loss <= self.target_loss:
+            return True
+
+        if loss < self.best_loss - self.min_delta:
+            self.best_loss = loss
+            self.evaluations_without_improvement = 0
+            return False
+
+        self.evaluations_without_improvement += 1
+        return 0 < self.patience <= self.evaluations_without_improvement
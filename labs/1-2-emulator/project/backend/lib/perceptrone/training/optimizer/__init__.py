@@ -0,0 +1 @@
+from lib.perceptrone.training.optimizer.optimizer import * # type: ignore[unused-variable]
@@ -0,0 +1,164 @@
+import math
+from typing import Any, Dict
+
+import numpy as np
+import numpy.typing as npt
+
+from lib.perceptrone.models.optimizer import IOptimizer, OptimizerType
+
+
+class SGD(IOptimizer):
+    """Градиентный спуск: w -= η · g"""
+
+    def __init__(self, learning_rate: float):
+        self.learning_rate = learning_rate
+
+    def step(self, params: npt.NDArray[np.float64], gradients: npt.NDArray[np.float64]) -> None:
+        gradients *= self.learning_rate
+        params -= gradients
+
+    def get_type(self) -> OptimizerType:
+        return OptimizerType.SGD
+
+
+class Momentum(IOptimizer):
+    """
+    SGD с моментом:
+        v = μ · v - η · g
+        w += v
+    """
+
+    def __init__(self, learning_rate: float, size: int, momentum: float = 0.9):
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        self._velocity = np.zeros(size, dtype=np.float64)
+
+    def step(self, params: npt.NDArray[np.float64], gradients: npt.NDArray[np.float64]) -> None:
+        gradients *= self.learning_rate
+        self._velocity *= self.momentum
+        self._velocity -= gradients
+        params += self._velocity
+
+    def get_type(self) -> OptimizerType:
+        return OptimizerType.MOMENTUM
+
+
+class Nesterov(IOptimizer):
+    """
+    Момент Нестерова (градиент как бы берётся в точке после шага по инерции):
+        v = μ · v - η · g
+        w += μ · v - η · g
+    """
+
+    def __init__(self, learning_rate: float, size: int, momentum: float = 0.9):
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        self._velocity = np.zeros(size, dtype=np.float64)
+
+    def step(self, params: npt.NDArray[np.float64], gradients: npt.NDArray[np.float64]) -> None:
+        gradients *= self.learning_rate
+        self._velocity *= self.momentum
+        self._velocity -= gradients
+        params -= gradients
+        np.multiply(self._velocity, self.momentum, out=gradients)
+        params += gradients
+
+    def get_type(self) -> OptimizerType:
+        return OptimizerType.NESTEROV
+
+
+class RMSProp(IOptimizer):
+    """
+    RMSProp:
+        s = ρ · s + (1 - ρ) · g²
+        w -= η · g / (√s + ε)
+    """
+
+    def __init__(self, learning_rate: float, size: int, rho: float = 0.9, eps: float = 1e-8):
+        self.learning_rate = learning_rate
+        self.rho = rho
+        self.eps = eps
+        self._square_avg = np.zeros(size, dtype=np.float64)
+        self._scratch = np.empty(size, dtype=np.float64)
+
+    def step(self, params: npt.NDArray[np.float64], gradients: npt.NDArray[np.float64]) -> None:
+        np.square(gradients, out=self._scratch)
+        self._scratch *= 1.0 - self.rho
+        self._square_avg *= self.rho
+        self._square_avg += self._scratch
+
+        np.sqrt(self._square_avg, out=self._scratch)
+        self._scratch += self.eps
+        gradients /= self._scratch
+        gradients *= self.learning_rate
+        params -= gradients
+
+    def get_type(self) -> OptimizerType:
+        return OptimizerType.RMSPROP
+
+
+class Adam(IOptimizer):
+    """
+    Adam:
+        m = β1 · m + (1 - β1) · g
+        v = β2 · v + (1 - β2) · g²
+        w -= η · m̂ / (√v̂ + ε),  m̂ = m / (1 - β1^t),  v̂ = v / (1 - β2^t)
+
+    Поправка на смещение внесена в шаг и ε (η·√(1-β2^t)/(1-β1^t) и ε·√(1-β2^t)) — результат тот же,
+    но массивы m и v не делятся на каждом шаге.
+    """
+
+    def __init__(self, learning_rate: float, size: int,
+                 beta1: float = 0.9, beta2: float = 0.999, eps: float = 1e-8):
+        self.learning_rate = learning_rate
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self._t = 0
+        self._m = np.zeros(size, dtype=np.float64)
+        self._v = np.zeros(size, dtype=np.float64)
+        self._scratch = np.empty(size, dtype=np.float64)
+
+    def step(self, params: npt.NDArray[np.float64], gradients: npt.NDArray[np.float64]) -> None:
+        self._t += 1
+
+        self._m *= self.beta1
+        np.multiply(gradients, 1.0 - self.beta1, out=self._scratch)
+        self._m += self._scratch
+
+        self._v *= self.beta2
+        np.square(gradients, out=self._scratch)
+        self._scratch *= 1.0 - self.beta2
+        self._v += self._scratch
+
+        v_correction = math.sqrt(1.0 - self.beta2 ** self._t)
+        step_size = self.learning_rate * v_correction / (1.0 - self.beta1 ** self._t)
+
+        np.sqrt(self._v, out=self._scratch)
+        self._scratch += self.eps * v_correction
+        np.divide(self._m, self._scratch, out=self._scratch)
+        self._scratch *= step_size
+        params -= self._scratch
+
+    def get_type(self) -> OptimizerType:
+        return OptimizerType.ADAM
+
+
+OPTIMIZERS: Dict[str, Any] = {
+    OptimizerType.SGD: SGD,
+    OptimizerType.MOMENTUM: Momentum,
+    OptimizerType.NESTEROV: Nesterov,
+    OptimizerType.RMSPROP: RMSProp,
+    OptimizerType.ADAM: Adam,
+}
+
+
+def build_optimizer(optimizer_type: OptimizerType, learning_rate: float, size: int) -> IOptimizer:
+    """
+    Оптимизатор ``optimizer_type`` для плоского буфера весов длины ``size``.
+
+    ``size`` нужен только оптимизаторам с состоянием (скорости, моменты); у SGD состояния нет.
+    """
+    if optimizer_type == OptimizerType.SGD:
+        return SGD(learning_rate)
+    return OPTIMIZERS[optimizer_type](learning_rate, size)
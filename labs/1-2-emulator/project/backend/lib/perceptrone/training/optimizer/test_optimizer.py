@@ -0,0 +1,69 @@
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.models.optimizer import OptimizerType
+from lib.perceptrone.training.optimizer import build_optimizer
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+TOLERANCE = 1e-9
+LEARNING_RATE = 0.1
+
+PARAMS = [0.5, -0.3, 0.0, 1.2]
+GRADIENTS = [
+    [0.2, -0.1, 0.05, 0.0],
+    [0.1, -0.3, -0.05, 0.4],
+    [-0.2, 0.2, 0.01, 0.3],
+]
+
+
+def _reference(optimizer_type: OptimizerType) -> np.ndarray:
+    """Те же формулы без буферов и in-place операций."""
+    w = np.asarray(PARAMS)
+    v = np.zeros_like(w)
+    m = np.zeros_like(w)
+    for t, g in enumerate(np.asarray(GRADIENTS), start=1):
+        if optimizer_type == OptimizerType.SGD:
+            w = w - LEARNING_RATE * g
+        elif optimizer_type == OptimizerType.MOMENTUM:
+            v = 0.9 * v - LEARNING_RATE * g
+            w = w + v
+        elif optimizer_type == OptimizerType.NESTEROV:
+            v = 0.9 * v - LEARNING_RATE * g
+            w = w + 0.9 * v - LEARNING_RATE * g
+        elif optimizer_type == OptimizerType.RMSPROP:
+            v = 0.9 * v + 0.1 * g ** 2
+            w = w - LEARNING_RATE * g / (np.sqrt(v) + 1e-8)
+        elif optimizer_type == OptimizerType.ADAM:
+            m = 0.9 * m + 0.1 * g
+            v = 0.999 * v + 0.001 * g ** 2
+            m_hat = m / (1 - 0.9 ** t)
+            v_hat = v / (1 - 0.999 ** t)
+            w = w - LEARNING_RATE * m_hat / (np.sqrt(v_hat) + 1e-8)
+    return w
+
+
+def test_optimizers_match_reference():
+    """
+    Шаги оптимизаторов на плоских буферах совпадают с формулами, записанными напрямую.
+    """
+    errors: List[Any] = list()
+
+    for optimizer_type in OptimizerType:
+        params = np.asarray(PARAMS)
+        optimizer = build_optimizer(optimizer_type, LEARNING_RATE, params.size)
+        for g in GRADIENTS:
+            optimizer.step(params, np.asarray(g))
+
+        expected = _reference(optimizer_type)
+        if not np.allclose(params, expected, atol=TOLERANCE):
+            logger.error(f" Test error. {optimizer_type} step does not match reference")
+            errors.append({"optimizer": optimizer_type, "expected": expected.tolist(), "received": params.tolist()})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_optimizers_match_reference complete!")
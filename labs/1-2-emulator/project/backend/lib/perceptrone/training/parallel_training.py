@@ -0,0 +1,355 @@
+"""
+Обучение перцептрона на нескольких процессах (ядрах CPU).
+
+Веса, обучающая выборка и градиенты лежат в ``multiprocessing.shared_memory``, поэтому
+процессы ничего не копируют друг другу. Главный процесс запускает команду, отпуская
+семафор каждого процесса, и ждёт на общем семафоре отчёты о завершении, проверяя между
+попытками, живы ли процессы: упавший исполнитель не подвешивает обучение.
+
+SYNC    — каждый шаг пакет делится на части по числу процессов, каждый процесс считает
+          градиент своей части, главный процесс усредняет их (с весом по размеру части)
+          и делает шаг оптимизатора. Результат совпадает с обучением в одном процессе.
+HOGWILD — каждый процесс проходит свою часть эпохи и обновляет общие веса без блокировок
+          своим экземпляром оптимизатора; процессы встречаются только в конце эпохи.
+
+Процессы запускаются через ``billiard`` (форк ``multiprocessing`` из Celery) в режиме spawn:
+задачи Celery выполняются в daemon-процессах пула prefork, и стандартный ``multiprocessing``
+не даёт им порождать дочерние процессы, а ``billiard`` — даёт.
+"""
+import math
+import os
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from billiard import get_context
+
+from exceptions import UnexpectedBehaviourException
+from lib.perceptrone.forwrdpropagation.vectorized_forward_propagation import forward_layers_into
+from lib.perceptrone.loss import LossType, LOSSES
+from lib.perceptrone.mathh.models.compact_perceptron import CompactPerceptron
+from lib.perceptrone.mathh.np_mv import flat_layer_views
+from lib.perceptrone.models.activation import ActivationType
+from lib.perceptrone.models.optimizer import IOptimizer, OptimizerType
+from lib.perceptrone.models.training import ParallelMode
+from lib.perceptrone.training.activation.activation import ACTIVATIONS, SoftMax
+from lib.perceptrone.training.optimizer import build_optimizer
+from lib.perceptrone.training.training_workspace import TrainingWorkspace
+from lib.perceptrone.training.vectorized_backpropagation import VectorizedBackPropagation
+from log import logger
+
+
+# Команды главного процесса (ctrl[0])
+_STOP = 0
+_SYNC_STEP = 1
+_HOGWILD_EPOCH = 2
+
+# Сколько ждать завершения одной команды (пакет SYNC или эпоха HOGWILD), прежде чем считать,
+# что процесс завис; завершившийся процесс замечается через _POLL_INTERVAL_SECONDS
+_ROUND_TIMEOUT_SECONDS = 300.0
+_POLL_INTERVAL_SECONDS = 0.2
+
+
+@dataclass
+class _WorkerSpec:
+    """Всё, что нужно процессу-исполнителю: имена блоков общей памяти и параметры сети."""
+    workers: int
+    shapes: List[Tuple[int, int]]
+    n_samples: int
+    signs_count: int
+    classes_count: int
+    batch_size: int
+    activation_type: ActivationType
+    softmax_use: bool
+    loss_type: LossType
+    optimizer_type: OptimizerType
+    shm_names: Dict[str, str]
+
+
+def _array_layouts(spec: _WorkerSpec) -> Dict[str, Tuple[Tuple[int, ...], Any]]:
+    size = sum(n_out * n_in for n_out, n_in in spec.shapes)
+    return {
+        "weights": ((size,), np.float64),
+        "gradients": ((spec.workers, size), np.float64),
+        "signs": ((spec.n_samples, spec.signs_count), np.float64),
+        "marks": ((spec.n_samples, spec.classes_count), np.float64),
+        "order": ((spec.n_samples,), np.int64),
+        "ctrl": ((4,), np.int64),              # команда, начало пакета, размер пакета, собирать ли loss
+        "learning_rate": ((1,), np.float64),
+        "stats": ((spec.workers, 2), np.float64),  # сумма loss примеров, время вычислений (с)
+    }
+
+
+def _shard(start: int, length: int, worker_id: int, workers: int) -> Tuple[int, int]:
+    """Границы части worker_id из workers для отрезка [start, start + length)."""
+    return start + worker_id * length // workers, start + (worker_id + 1) * length // workers
+
+
+def _close_blocks(blocks: List[shared_memory.SharedMemory], unlink: bool) -> None:
+    for shm in blocks:
+        try:
+            shm.close()
+        except BufferError:
+            # на блок ещё смотрят ndarray (веса модели) — отображение освободится вместе с ними
+            pass
+        if unlink:
+            shm.unlink()
+
+
+def _worker_main(worker_id: int, spec: _WorkerSpec, go: Any, done: Any) -> None:
+    blocks: List[shared_memory.SharedMemory] = []
+    arrays: Dict[str, npt.NDArray[Any]] = {}
+    for key, (shape, dtype) in _array_layouts(spec).items():
+        # блоками владеет главный процесс — он их и удаляет; у процесса, запущенного billiard,
+        # свой resource tracker (только POSIX), который иначе удалил бы блоки при выходе процесса
+        shm = shared_memory.SharedMemory(name=spec.shm_names[key])
+        if os.name == "posix":
+            resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        blocks.append(shm)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    try:
+        weights = arrays["weights"]
+        layers = flat_layer_views(weights, spec.shapes)
+        activations = [ACTIVATIONS[spec.activation_type]() for _ in range(len(spec.shapes))]
+        if spec.softmax_use:
+            activations[-1] = SoftMax()
+
+        bp = VectorizedBackPropagation(LOSSES[spec.loss_type](), layers, activations)
+        workspace = TrainingWorkspace(layers, spec.batch_size)
+        optimizer: IOptimizer = build_optimizer(spec.optimizer_type, 0.0, weights.size)
+        output_activation = not bp.fuses_softmax_cross_entropy()
+
+        ctrl, order, stats = arrays["ctrl"], arrays["order"], arrays["stats"]
+        signs, marks = arrays["signs"], arrays["marks"]
+
+        def batch_gradients(lo: int, hi: int, collect_loss: bool) -> float:
+            batch_len = workspace.load_batch(signs, marks, order[lo:hi])
+            forward_layers_into(workspace, layers, activations, batch_len, output_activation=output_activation)
+            bp.calculate_gradients_into(workspace, batch_len, collect_loss=collect_loss)
+            return float(np.sum(workspace.losses[:batch_len])) if collect_loss else 0.0
+
+        while True:
+            go.acquire()
+            command = int(ctrl[0])
+            if command == _STOP:
+                break
+
+            started = time.perf_counter()
+            collect_loss = bool(ctrl[3])
+            loss_sum = 0.0
+
+            if command == _SYNC_STEP:
+                lo, hi = _shard(int(ctrl[1]), int(ctrl[2]), worker_id, spec.workers)
+                if hi > lo:
+                    loss_sum = batch_gradients(lo, hi, collect_loss)
+                    np.copyto(arrays["gradients"][worker_id], workspace.gradient_buffer)
+                else:
+                    arrays["gradients"][worker_id].fill(0.0)
+
+            elif command == _HOGWILD_EPOCH:
+                optimizer.learning_rate = float(arrays["learning_rate"][0])
+                lo, hi = _shard(0, spec.n_samples, worker_id, spec.workers)
+                for start in range(lo, hi, spec.batch_size):
+                    loss_sum += batch_gradients(start, min(start + spec.batch_size, hi), collect_loss)
+                    optimizer.step(weights, workspace.gradient_buffer)
+
+            stats[worker_id, 0] = loss_sum
+            stats[worker_id, 1] += time.perf_counter() - started
+            done.release()
+
+    except Exception as e:
+        # главный процесс увидит, что процесс завершился, и прервёт обучение
+        logger.error(f"parallel training worker {worker_id} failed: {e}")
+    finally:
+        _close_blocks(blocks, unlink=False)
+
+
+class ParallelTrainer:
+    """
+    Пул процессов для одного задания обучения.
+
+    Веса сети — ``model`` (:class:`CompactPerceptron` поверх общей памяти); главный процесс
+    читает их для оценки loss и снимков лучшей эпохи между вызовами :meth:`run_epoch`.
+    После использования нужно вызвать :meth:`close`.
+    """
+
+    mode: ParallelMode
+    workers: int
+    model: CompactPerceptron
+
+    def __init__(
+        self,
+        mode: ParallelMode,
+        workers: int,
+        model: CompactPerceptron,
+        signs_matrix: npt.NDArray[np.float64],
+        marks_matrix: npt.NDArray[np.float64],
+        batch_size: int,
+        activation_type: ActivationType,
+        softmax_use: bool,
+        loss_type: LossType,
+        optimizer_type: OptimizerType,
+    ):
+        self.mode = mode
+        self.workers = workers
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._processes: List[Any] = []
+        self._go: List[Any] = []
+
+        spec = _WorkerSpec(
+            workers=workers,
+            shapes=model.shapes,
+            n_samples=signs_matrix.shape[0],
+            signs_count=signs_matrix.shape[1],
+            classes_count=marks_matrix.shape[1],
+            batch_size=batch_size,
+            activation_type=activation_type,
+            softmax_use=softmax_use,
+            loss_type=loss_type,
+            optimizer_type=optimizer_type,
+            shm_names={},
+        )
+
+        self._arrays: Dict[str, npt.NDArray[Any]] = {}
+        try:
+            for key, (shape, dtype) in _array_layouts(spec).items():
+                nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+                shm = shared_memory.SharedMemory(create=True, size=nbytes)
+                self._blocks.append(shm)
+                spec.shm_names[key] = shm.name
+                self._arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+            self._arrays["stats"].fill(0.0)
+            np.copyto(self._arrays["signs"], signs_matrix)
+            np.copyto(self._arrays["marks"], marks_matrix)
+
+            self.model = CompactPerceptron(model.shapes, buffer=self._arrays["weights"])
+            self.model.copy_from(model)
+
+            self._gradient = np.empty(self.model.buffer.size, dtype=np.float64)
+            self._n_samples = spec.n_samples
+            self._batch_size = batch_size
+
+            context = get_context("spawn")
+            self._done = context.Semaphore(0)
+            for worker_id in range(workers):
+                go = context.Semaphore(0)
+                process = context.Process(target=_worker_main, args=(worker_id, spec, go, self._done), daemon=True)
+                process.start()
+                self._go.append(go)
+                self._processes.append(process)
+        except Exception:
+            self.close()
+            raise
+
+    def _round(self, command: int, start: int = 0, batch_len: int = 0, collect_loss: bool = False) -> float:
+        """
+        Одна команда всем процессам: старт, ожидание завершения. Возвращает сумму loss примеров.
+
+        Raises:
+            UnexpectedBehaviourException: процесс-исполнитель завершился или не ответил
+                за ``_ROUND_TIMEOUT_SECONDS``
+        """
+        ctrl = self._arrays["ctrl"]
+        ctrl[0], ctrl[1], ctrl[2], ctrl[3] = command, start, batch_len, int(collect_loss)
+        for go in self._go:
+            go.release()
+
+        deadline = time.monotonic() + _ROUND_TIMEOUT_SECONDS
+        reported = 0
+        while reported < self.workers:
+            if self._done.acquire(timeout=_POLL_INTERVAL_SECONDS):
+                reported += 1
+                continue
+            dead = [worker_id for worker_id, process in enumerate(self._processes) if not process.is_alive()]
+            if dead or time.monotonic() > deadline:
+                e_str = (
+                    f"parallel training workers {dead} exited" if dead
+                    else f"parallel training workers did not respond in {_ROUND_TIMEOUT_SECONDS} s"
+                )
+                logger.error(e_str)
+                raise UnexpectedBehaviourException(e_str)
+        return float(np.sum(self._arrays["stats"][:, 0]))
+
+    def run_epoch(self, order: npt.NDArray[np.int64], optimizer: IOptimizer, collect_loss: bool) -> float:
+        """
+        Одна эпоха по перестановке ``order``.
+
+        SYNC — шаг ``optimizer`` по усреднённому градиенту после каждого пакета;
+        HOGWILD — процессы используют свои оптимизаторы того же типа со скоростью ``optimizer.learning_rate``.
+
+        Returns:
+            сумма loss примеров за эпоху (если ``collect_loss``), иначе 0
+        """
+        np.copyto(self._arrays["order"], order)
+
+        if self.mode == ParallelMode.HOGWILD:
+            self._arrays["learning_rate"][0] = optimizer.learning_rate
+            return self._round(_HOGWILD_EPOCH, collect_loss=collect_loss)
+
+        gradients = self._arrays["gradients"]
+        fractions = np.empty(self.workers, dtype=np.float64)
+        running_loss = 0.0
+        for start in range(0, self._n_samples, self._batch_size):
+            batch_len = min(self._batch_size, self._n_samples - start)
+            running_loss += self._round(_SYNC_STEP, start, batch_len, collect_loss)
+
+            # градиент части — среднее по её примерам, поэтому вес части — её доля в пакете
+            for worker_id in range(self.workers):
+                lo, hi = _shard(start, batch_len, worker_id, self.workers)
+                fractions[worker_id] = (hi - lo) / batch_len
+            np.dot(fractions, gradients, out=self._gradient)
+            optimizer.step(self.model.buffer, self._gradient)
+
+        return running_loss
+
+    @property
+    def busy_seconds(self) -> float:
+        """Суммарное время вычислений во всех процессах."""
+        return float(np.sum(self._arrays["stats"][:, 1])) if "stats" in self._arrays else 0.0
+
+    def close(self) -> None:
+        """Останавливает процессы и освобождает общую память. Веса ``model`` после этого недоступны."""
+        if self._processes:
+            self._arrays["ctrl"][0] = _STOP
+            for go in self._go:
+                go.release()
+            for process in self._processes:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+            self._processes = []
+            self._go = []
+
+        self._arrays = {}
+        _close_blocks(self._blocks, unlink=True)
+        self._blocks = []
+
+
+def resolve_workers(requested: int, n_samples: int, mode: ParallelMode, batch_size: int) -> int:
+    """
+    Сколько процессов реально запускать: не больше ядер и примеров, а в SYNC — и ``batch_size``:
+    пакет делится между процессами, и лишние процессы только ждали бы остальных.
+    """
+    workers = min(requested, os.cpu_count() or 1, n_samples)
+    if mode == ParallelMode.SYNC and batch_size < workers:
+        logger.warning(
+            f"SYNC parallel training splits each batch between processes: "
+            f"batch_size={batch_size} limits workers to {batch_size} (requested {requested})"
+        )
+        workers = batch_size
+    return max(workers, 1)
+
+
+def parallel_utilization(busy_seconds: float, wall_seconds: float) -> float:
+    """
+    Загрузка процессов: сколько секунд вычислений приходится на секунду реального времени,
+    то есть среднее число одновременно занятых процессов (от 0 до ``workers``).
+    """
+    if wall_seconds <= 0.0 or not math.isfinite(busy_seconds):
+        return 1.0
+    return busy_seconds / wall_seconds
@@ -1,13 +1,19 @@
 from typing import Any, List
 
+import numpy as np
+
 from lib.perceptrone.training.backpropagation import BackPropagation
+from lib.perceptrone.training.vectorized_backpropagation import VectorizedBackPropagation
+from lib.perceptrone.forwrdpropagation.vectorized_forward_propagation import forward_layers, forward_layers_into
+from lib.perceptrone.training.training_workspace import TrainingWorkspace
 from lib.perceptrone.mathh.models import Perceptron
-from lib.perceptrone.loss import MSE
-from lib.perceptrone.training.activation.activation import Rellu
+from lib.perceptrone.loss import MSE, CrossEntropy
+from lib.perceptrone.training.activation.activation import Rellu, Sigmoid, SoftMax
 
 from lib.perceptrone.mathh.mv import (
     apply_adjustments
 )
+from lib.perceptrone.mathh.np_mv import to_layer_arrays
 
 from log import logger
 from exceptions.test_exception import TestException
@@ -79,6 +85,126 @@ def test_bp_iteration():
     else:
         logger.info("test complete!")
 
+def test_vectorized_bp_iteration():
+
+    bp = VectorizedBackPropagation(MSE(), to_layer_arrays(WEIGHTS), [Rellu(), Rellu()])
+    gradients = bp.training_iteration_calculate(
+        np.asarray(INPUTS), np.asarray(OUTPUTS), np.asarray(EXPECTED_OUTPUTS),
+        [np.asarray(s) for s in WEIGHTD_SUMS_OUTPUT],
+    )
+    # корректировки Δw = -η · ∂E/∂w, как у скалярной версии
+    result = [g * (-LEARNING_RATE) for g in gradients]
+
+    errors:List[Any] = list()
+    for q in range(len(EXPECTED_WEIGHTS_CHANGES)):
+        for i in range(len(EXPECTED_WEIGHTS_CHANGES[q])):
+            for j in range(len(EXPECTED_WEIGHTS_CHANGES[q][i])):
+                w = EXPECTED_WEIGHTS_CHANGES[q][i][j]
+                if abs(w - result[q][i][j]) > 0.0001:
+                    logger.error(f" Test error. incorrect weight  layer {q} | line {i} | column {j}")
+                    errors.append({"position":(q, i, j), "expected":w , "received":float(result[q][i][j])})
+
+
+    if(len(errors)):
+        raise TestException(f" errors:  {errors}")
+    else:
+        logger.info("test complete!")
+
+def test_vectorized_bp_batch_average():
+    """
+    Градиент для пакета примеров равен среднему градиентов по каждому примеру отдельно.
+    """
+    batch_inputs = np.asarray([INPUTS, [0.9, 0.1], [0.2, 0.7]])
+    batch_expected = np.asarray([EXPECTED_OUTPUTS, [0.0], [0.5]])
+    layers = to_layer_arrays(WEIGHTS)
+    activations = [Rellu(), Rellu()]
+    bp = VectorizedBackPropagation(MSE(), layers, activations)
+
+    layer_outputs, sums = forward_layers(batch_inputs, layers, activations)
+    result = bp.training_iteration_calculate(batch_inputs, layer_outputs[-1], batch_expected, sums, layer_outputs)
+
+    expected = [np.zeros_like(w) for w in layers]
+    for n in range(batch_inputs.shape[0]):
+        single_outputs, single_sums = forward_layers(batch_inputs[n], layers, activations)
+        single = bp.training_iteration_calculate(
+            batch_inputs[n], single_outputs[-1], batch_expected[n], single_sums, single_outputs,
+        )
+        for q in range(len(layers)):
+            expected[q] += single[q] / batch_inputs.shape[0]
+
+    errors:List[Any] = list()
+    for q in range(len(expected)):
+        if not np.allclose(expected[q], result[q], atol=0.0001):
+            logger.error(f" Test error. incorrect batch gradient  layer {q}")
+            errors.append({"layer": q, "expected": expected[q].tolist(), "received": result[q].tolist()})
+
+    if(len(errors)):
+        raise TestException(f" errors:  {errors}")
+    else:
+        logger.info("test complete!")
+
+def test_inplace_gradients_match_adjustments():
+    """
+    Градиенты из буферов TrainingWorkspace совпадают с градиентами
+    training_iteration_calculate (неполный пакет: 2 примера в буфере на 4).
+    """
+    signs = np.asarray([INPUTS, [0.9, 0.1]])
+    marks = np.asarray([EXPECTED_OUTPUTS, [0.0]])
+    layers = to_layer_arrays(WEIGHTS)
+    activations = [Rellu(), Rellu()]
+    bp = VectorizedBackPropagation(MSE(), layers, activations)
+
+    layer_outputs, sums = forward_layers(signs, layers, activations)
+    expected = bp.training_iteration_calculate(signs, layer_outputs[-1], marks, sums, layer_outputs)
+
+    workspace = TrainingWorkspace(layers, batch_size=4)
+    batch_len = workspace.load_batch(signs, marks, np.arange(2))
+    forward_layers_into(workspace, layers, activations, batch_len)
+    gradients = bp.calculate_gradients_into(workspace, batch_len)
+
+    errors:List[Any] = list()
+    for q in range(len(expected)):
+        if not np.allclose(expected[q], gradients[q], atol=0.0001):
+            logger.error(f" Test error. incorrect in-place gradient  layer {q}")
+            errors.append({"layer": q, "expected": expected[q].tolist(), "received": gradients[q].tolist()})
+
+    if(len(errors)):
+        raise TestException(f" errors:  {errors}")
+    else:
+        logger.info("test complete!")
+
+def test_collected_batch_losses():
+    """
+    calculate_gradients_into(collect_loss=True) пишет в workspace.losses loss каждого примера —
+    и для MSE, и для soft-max + cross-entropy, где выходы последнего слоя не вычисляются.
+    """
+    signs = np.asarray([INPUTS, [0.9, 0.1], [0.2, 0.7]])
+    marks = np.asarray([[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]])
+    layers = to_layer_arrays([WEIGHTS[0], [[-0.2, 0.6, 0.5], [0.3, -0.1, 0.4]]])
+
+    errors:List[Any] = list()
+    for loss, activations in ((MSE(), [Sigmoid(), Sigmoid()]), (CrossEntropy(), [Sigmoid(), SoftMax()])):
+        bp = VectorizedBackPropagation(loss, layers, activations)
+        layer_outputs, _ = forward_layers(signs, layers, activations)
+
+        workspace = TrainingWorkspace(layers, batch_size=4)
+        batch_len = workspace.load_batch(signs, marks, np.arange(3))
+        forward_layers_into(workspace, layers, activations, batch_len,
+                            output_activation=not bp.fuses_softmax_cross_entropy())
+        bp.calculate_gradients_into(workspace, batch_len, collect_loss=True)
+
+        for n in range(batch_len):
+            expected = loss.perform(marks[n].tolist(), layer_outputs[-1][n].tolist())
+            if abs(expected - workspace.losses[n]) > 0.0001:
+                logger.error(f" Test error. incorrect collected loss  {loss.get_type()} | sample {n}")
+                errors.append({"loss": loss.get_type(), "sample": n,
+                               "expected": expected, "received": float(workspace.losses[n])})
+
+    if(len(errors)):
+        raise TestException(f" errors:  {errors}")
+    else:
+        logger.info("test complete!")
+
 def test_apply_adjustiments():
     EXPECTED_WEIGHTS =\
     [
@@ -0,0 +1,41 @@
+from typing import Any, List
+
+from lib.perceptrone.training.early_stopping import EarlyStopping
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+LOSSES = [1.0, 0.5, 0.45, 0.449, 0.4485, 0.3, 0.2999, 0.2998]
+
+
+def _stopped_at(early_stopping: EarlyStopping) -> int:
+    for epoch, loss in enumerate(LOSSES, start=1):
+        if early_stopping.should_stop(loss):
+            return epoch
+    return -1
+
+
+def test_early_stopping():
+    """
+    Плато с учётом min_delta, patience == 0 (выключено) и target_loss.
+    """
+    cases = [
+        ({"patience": 2, "min_delta": 0.01}, 5),     # 0.449 и 0.4485 не лучше 0.45 на 0.01
+        ({"patience": 3, "min_delta": 0.01}, -1),    # 0.3 сбрасывает счётчик до третьей оценки
+        ({"patience": 2, "min_delta": 0.0}, -1),     # любое уменьшение — улучшение
+        ({"patience": 0, "min_delta": 0.01}, -1),
+        ({"patience": 0, "target_loss": 0.45}, 3),
+    ]
+
+    errors: List[Any] = list()
+    for kwargs, expected in cases:
+        received = _stopped_at(EarlyStopping(**kwargs))
+        if received != expected:
+            logger.error(f" Test error. early stopping {kwargs}")
+            errors.append({"params": kwargs, "expected": expected, "received": received})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_early_stopping complete!")
@@ -0,0 +1,143 @@
+import os
+import time
+from typing import Any, List
+
+import numpy as np
+
+from lib.perceptrone.forwrdpropagation.vectorized_forward_propagation import forward_layers_into
+from lib.perceptrone.loss import LossType, LOSSES
+from lib.perceptrone.mathh.models import CompactPerceptron
+from lib.perceptrone.models.activation import ActivationType
+from lib.perceptrone.models.optimizer import OptimizerType
+from lib.perceptrone.models.training import ParallelMode
+from lib.perceptrone.training.activation.activation import Sigmoid, SoftMax
+from lib.perceptrone.training.optimizer import build_optimizer
+from lib.perceptrone.training.parallel_training import ParallelTrainer, resolve_workers
+from lib.perceptrone.training.training_workspace import TrainingWorkspace
+from lib.perceptrone.training.vectorized_backpropagation import VectorizedBackPropagation
+
+from log import logger
+from exceptions import UnexpectedBehaviourException
+from exceptions.test_exception import TestException
+
+
+LEARNING_RATE = 0.1
+BATCH_SIZE = 5
+
+
+def _data():
+    rng = np.random.default_rng(7)
+    signs = rng.uniform(size=(23, 3))
+    classes = (signs[:, 0] > signs[:, 1]).astype(int)
+    marks = np.eye(2)[classes]
+    weights = [rng.normal(scale=0.5, size=(4, 3)).tolist(), rng.normal(scale=0.5, size=(2, 4)).tolist()]
+    return signs, marks, weights
+
+
+def _serial_epoch(weights, signs, marks, order) -> CompactPerceptron:
+    model = CompactPerceptron.from_lists(weights)
+    activations = [Sigmoid(), SoftMax()]
+    bp = VectorizedBackPropagation(LOSSES[LossType.CROSS_ENTROPY](), model.layers, activations)
+    optimizer = build_optimizer(OptimizerType.SGD, LEARNING_RATE, model.buffer.size)
+    workspace = TrainingWorkspace(model.layers, BATCH_SIZE)
+    for start in range(0, len(order), BATCH_SIZE):
+        batch_len = workspace.load_batch(signs, marks, order[start:start + BATCH_SIZE])
+        forward_layers_into(workspace, model.layers, activations, batch_len, output_activation=False)
+        bp.calculate_gradients_into(workspace, batch_len)
+        optimizer.step(model.buffer, workspace.gradient_buffer)
+    return model
+
+
+def test_parallel_training():
+    """
+    SYNC на 2 процессах даёт те же веса, что и эпоха в одном процессе;
+    HOGWILD проходит эпоху и собирает loss всех примеров.
+    """
+    signs, marks, weights = _data()
+    order = np.random.default_rng(3).permutation(len(signs))
+    expected = _serial_epoch(weights, signs, marks, order)
+
+    errors: List[Any] = list()
+    for mode in ParallelMode:
+        trainer = ParallelTrainer(
+            mode, 2, CompactPerceptron.from_lists(weights), signs, marks, BATCH_SIZE,
+            ActivationType.SIGMOID, True, LossType.CROSS_ENTROPY, OptimizerType.SGD,
+        )
+        try:
+            optimizer = build_optimizer(OptimizerType.SGD, LEARNING_RATE, trainer.model.buffer.size)
+            running_loss = trainer.run_epoch(order, optimizer, collect_loss=True)
+            received = trainer.model.buffer.copy()
+            busy_seconds = trainer.busy_seconds
+        finally:
+            trainer.close()
+
+        if mode == ParallelMode.SYNC and not np.allclose(received, expected.buffer, atol=1e-9):
+            logger.error(" Test error. SYNC weights differ from single-process epoch")
+            errors.append({"mode": mode, "expected": expected.buffer.tolist(), "received": received.tolist()})
+        if not np.isfinite(running_loss) or running_loss <= 0.0 or busy_seconds <= 0.0:
+            logger.error(f" Test error. {mode} running loss / busy time")
+            errors.append({"mode": mode, "running_loss": running_loss, "busy_seconds": busy_seconds})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_parallel_training complete!")
+
+
+def test_parallel_workers_limits():
+    """
+    SYNC не запускает процессов больше ``batch_size`` (при ``batch_size == 1`` — один процесс),
+    HOGWILD ограничен только ядрами и примерами.
+    """
+    cpus = os.cpu_count() or 1
+    cases = [
+        ((8, 100, ParallelMode.SYNC, 1), 1),
+        ((8, 100, ParallelMode.SYNC, 3), min(3, cpus)),
+        ((8, 100, ParallelMode.HOGWILD, 1), min(8, cpus)),
+        ((8, 2, ParallelMode.HOGWILD, 1), min(2, cpus)),
+    ]
+
+    errors: List[Any] = list()
+    for args, expected in cases:
+        received = resolve_workers(*args)
+        if received != expected:
+            logger.error(f" Test error. resolve_workers{args}")
+            errors.append({"args": args, "expected": expected, "received": received})
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_parallel_workers_limits complete!")
+
+
+def test_parallel_worker_crash():
+    """Упавший процесс-исполнитель — сразу UnexpectedBehaviourException, а не ожидание таймаута."""
+    signs, marks, weights = _data()
+    order = np.arange(len(signs))
+
+    errors: List[Any] = list()
+    trainer = ParallelTrainer(
+        ParallelMode.SYNC, 2, CompactPerceptron.from_lists(weights), signs, marks, BATCH_SIZE,
+        ActivationType.SIGMOID, True, LossType.CROSS_ENTROPY, OptimizerType.SGD,
+    )
+    try:
+        optimizer = build_optimizer(OptimizerType.SGD, LEARNING_RATE, trainer.model.buffer.size)
+        trainer.run_epoch(order, optimizer, collect_loss=False)
+
+        trainer._processes[0].terminate()
+        started = time.perf_counter()
+        try:
+            trainer.run_epoch(order, optimizer, collect_loss=False)
+            errors.append({"crash": "no exception"})
+        except UnexpectedBehaviourException:
+            pass
+        elapsed = time.perf_counter() - started
+        if elapsed > 10.0:
+            errors.append({"crash detected after seconds": elapsed})
+    finally:
+        trainer.close()
+
+    if len(errors):
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_parallel_worker_crash complete!")
@@ -0,0 +1,63 @@
+from typing import List, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from exceptions import ArgumentException
+from lib.perceptrone.mathh.np_mv import flat_layer_views
+from log import logger
+
+
+class TrainingWorkspace:
+    """
+    Буферы одного задания обучения, выделяемые один раз.
+
+    Для каждого слоя q хранятся матрицы (batch_size, n_q) под взвешенные суммы s^q,
+    выходы y^q, локальные ошибки δ^q и производные f'(s^q), а также матрица
+    градиента той же формы, что и weights[q], и вектор loss примеров пакета. Прямой и обратный проходы пишут
+    в эти буферы через ``out=``, поэтому шаг обучения не создаёт новых массивов.
+    Неполный последний пакет использует первые ``batch_len`` строк.
+
+    Градиенты слоёв — view на один плоский ``gradient_buffer`` (в том же порядке,
+    что и :class:`CompactPerceptron`), чтобы оптимизатор обновлял всю сеть одной операцией.
+    """
+
+    batch_size: int
+    inputs: npt.NDArray[np.float64]
+    expected: npt.NDArray[np.float64]
+    weighted_sums: List[npt.NDArray[np.float64]]
+    layer_outputs: List[npt.NDArray[np.float64]]
+    local_errors: List[npt.NDArray[np.float64]]
+    derivatives: List[npt.NDArray[np.float64]]
+    gradient_buffer: npt.NDArray[np.float64]
+    gradients: List[npt.NDArray[np.float64]]
+    losses: npt.NDArray[np.float64]
+
+    def __init__(self, weights: Sequence[npt.NDArray[np.float64]], batch_size: int):
+        if batch_size < 1:
+            e_str = f"batch_size must be >= 1, got {batch_size}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        self.batch_size = batch_size
+        self.inputs = np.empty((batch_size, weights[0].shape[1]), dtype=np.float64)
+        self.expected = np.empty((batch_size, weights[-1].shape[0]), dtype=np.float64)
+        self.weighted_sums = [np.empty((batch_size, w.shape[0]), dtype=np.float64) for w in weights]
+        self.layer_outputs = [np.empty((batch_size, w.shape[0]), dtype=np.float64) for w in weights]
+        self.local_errors = [np.empty((batch_size, w.shape[0]), dtype=np.float64) for w in weights]
+        self.derivatives = [np.empty((batch_size, w.shape[0]), dtype=np.float64) for w in weights]
+        self.gradient_buffer = np.empty(sum(w.size for w in weights), dtype=np.float64)
+        self.gradients = flat_layer_views(self.gradient_buffer, [w.shape for w in weights])  # type: ignore[misc]
+        self.losses = np.empty(batch_size, dtype=np.float64)
+
+    def load_batch(
+        self,
+        signs: npt.NDArray[np.float64],
+        class_marks: npt.NDArray[np.float64],
+        indices: npt.NDArray[np.int64],
+    ) -> int:
+        """Копирует строки ``indices`` в буферы входов/ожиданий. Возвращает размер пакета."""
+        batch_len = len(indices)
+        np.take(signs, indices, axis=0, out=self.inputs[:batch_len])
+        np.take(class_marks, indices, axis=0, out=self.expected[:batch_len])
+        return batch_len
@@ -0,0 +1,162 @@
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from lib.perceptrone.training.itraining_algorithm import ITrainingAlgorithm
+from lib.perceptrone.training.training_workspace import TrainingWorkspace
+from lib.perceptrone.loss import ILoss, LossType
+from lib.perceptrone.loss.softmax_cross_entropy import softmax_cross_entropy, softmax_cross_entropy_gradient
+from lib.perceptrone.models.activation import ActivationType, IActivation
+
+
+class VectorizedBackPropagation(ITrainingAlgorithm):
+    """
+    Матричная версия :class:`BackPropagation`.
+
+    Те же формулы (1)-(4) из readme.md, но над ndarray целого слоя:
+    локальные ошибки считаются как W^T·δ ⊙ f'(s), а градиенты весов —
+    одним внешним произведением δ^q ⊗ y^(q-1) на слой.
+
+    Все аргументы могут быть как векторами одного примера, так и пакетом
+    (строки — примеры). Для пакета градиент — среднее по примерам:
+    ∂E/∂w^q = (δ^q)^T · Y^(q-1) / batch. Скорости обучения здесь нет —
+    шаг по градиенту делает оптимизатор (см. :func:`build_optimizer`).
+    """
+
+    weights: List[npt.NDArray[np.float64]]
+    activations: Sequence[IActivation]
+    loss: ILoss
+
+    def __init__(self, loss: ILoss,
+                 weights: List[npt.NDArray[np.float64]], activations: Sequence[IActivation]):
+        self.weights = weights
+        self.activations = activations
+        self.loss = loss
+
+    def fuses_softmax_cross_entropy(self) -> bool:
+        """
+        Soft-max на выходе + cross-entropy: δ^Q = y - d считается прямо по логитам s^Q,
+        поэтому выходы y^Q выходного слоя для обучения не нужны.
+        """
+        return self.activations[-1].get_type() == ActivationType.SOFTMAX \
+            and self.loss.get_type() == LossType.CROSS_ENTROPY
+
+    def _output_local_errors(self, outputs: npt.NDArray[np.float64], expected: npt.NDArray[np.float64],
+                             output_sums: npt.NDArray[np.float64],
+                             out: Optional[npt.NDArray[np.float64]] = None,
+                             derivative_out: Optional[npt.NDArray[np.float64]] = None,
+                             losses_out: Optional[npt.NDArray[np.float64]] = None,
+                             ) -> npt.NDArray[np.float64]:
+        """
+        Формула (2) для выходного слоя, с теми же упрощениями для soft-max, что и в скалярной версии.
+        Если передан ``losses_out``, в него заодно пишется loss каждого примера.
+        """
+        if self.fuses_softmax_cross_entropy():
+            if losses_out is None:
+                return softmax_cross_entropy_gradient(output_sums, expected, out=out)
+            _, out = softmax_cross_entropy(output_sums, expected, gradient_out=out, losses_out=losses_out)
+            return out
+
+        if losses_out is not None:
+            self.loss.perform_batch(expected, outputs, out=losses_out)
+
+        output_type = self.activations[-1].get_type()
+        out = np.subtract(outputs, expected, out=out)
+
+        if output_type == ActivationType.SOFTMAX and self.loss.get_type() == LossType.MSE:
+            out *= outputs
+            return out
+
+        out *= self.activations[-1].derivative_vector(output_sums, out=derivative_out)
+        return out
+
+    def training_iteration_calculate(self, inputs: npt.NDArray[np.float64], outputs: npt.NDArray[np.float64],
+                                     expected: npt.NDArray[np.float64],
+                                     weighted_sums_output: List[npt.NDArray[np.float64]],
+                                     layer_outputs: Optional[List[npt.NDArray[np.float64]]] = None,
+                                     ) -> List[npt.NDArray[np.float64]]:
+        """
+        Одна итерация обучения.
+
+        Args:
+            inputs: входные значения (y^0), вектор (d,) или пакет (batch, d)
+            outputs: выходы нейронов выходного слоя (y^Q)
+            expected: желаемые значения (d)
+            weighted_sums_output: взвешенные суммы слоёв до активации (s^q)
+            layer_outputs: выходы слоёв после активации (y^q) из прямого прохода.
+                Если не переданы — восстанавливаются по s^q один раз на слой.
+
+        Returns:
+            градиенты ∂E/∂w^q той же формы, что и weights[q]
+        """
+        num_layers = len(self.weights)
+        x = np.asarray(inputs, dtype=np.float64)
+        d = np.asarray(expected, dtype=np.float64)
+
+        if layer_outputs is None:
+            layer_outputs = [
+                self.activations[q].perform_vector(weighted_sums_output[q]) for q in range(num_layers)
+            ]
+
+        local_errors: List[npt.NDArray[np.float64]] = [np.empty(0) for _ in range(num_layers)]
+        local_errors[-1] = self._output_local_errors(
+            np.asarray(outputs, dtype=np.float64), d, weighted_sums_output[-1],
+        )
+
+        # Формула (1): δ^q = W[q+1]^T · δ^(q+1) ⊙ f'(s^q).
+        # Записано как δ^(q+1) · W[q+1] — одинаково работает и для вектора, и для пакета строк.
+        for q in range(num_layers - 2, -1, -1):
+            local_errors[q] = (local_errors[q + 1] @ self.weights[q + 1]) \
+                * self.activations[q].derivative_vector(weighted_sums_output[q])
+
+        # ∂E/∂w^q = δ^q ⊗ y^(q-1); для пакета — одно матричное произведение и усреднение
+        gradients: List[npt.NDArray[np.float64]] = []
+        for q in range(num_layers):
+            y_prev = x if q == 0 else layer_outputs[q - 1]
+            if x.ndim == 1:
+                gradients.append(np.outer(local_errors[q], y_prev))
+            else:
+                gradients.append((local_errors[q].T @ y_prev) / x.shape[0])
+
+        return gradients
+
+    def calculate_gradients_into(self, workspace: TrainingWorkspace, batch_len: int,
+                                 collect_loss: bool = False) -> List[npt.NDArray[np.float64]]:
+        """
+        Градиенты ∂E/∂w^q по пакету из буферов ``workspace`` (после :func:`forward_layers_into`).
+
+        Те же формулы, что в :meth:`training_iteration_calculate`, но все промежуточные
+        результаты пишутся в заранее выделенные буферы. Результат — ``workspace.gradients``.
+
+        Если :meth:`fuses_softmax_cross_entropy`, выходы последнего слоя в ``workspace``
+        не читаются — прямой проход можно вызвать с ``output_activation=False``.
+        При ``collect_loss`` loss каждого примера пакета (до обновления весов) пишется в ``workspace.losses``.
+        """
+        b = batch_len
+        ws = workspace
+        num_layers = len(self.weights)
+
+        self._output_local_errors(
+            ws.layer_outputs[-1][:b], ws.expected[:b], ws.weighted_sums[-1][:b],
+            out=ws.local_errors[-1][:b], derivative_out=ws.derivatives[-1][:b],
+            losses_out=ws.losses[:b] if collect_loss else None,
+        )
+
+        for q in range(num_layers - 2, -1, -1):
+            delta = np.matmul(ws.local_errors[q + 1][:b], self.weights[q + 1], out=ws.local_errors[q][:b])
+            delta *= self.activations[q].derivative_vector(ws.weighted_sums[q][:b], out=ws.derivatives[q][:b])
+
+        for q in range(num_layers):
+            y_prev = ws.inputs[:b] if q == 0 else ws.layer_outputs[q - 1][:b]
+            np.matmul(ws.local_errors[q][:b].T, y_prev, out=ws.gradients[q])
+            ws.gradients[q] *= 1.0 / b
+
+        return ws.gradients
+
+    def get_loss_function(self): return self.loss
+
+    def get_losses(self): pass
+
+    def get_output_loss(self): pass
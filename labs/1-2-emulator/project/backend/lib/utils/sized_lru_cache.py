@@ -0,0 +1,82 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from exceptions.argument_exception import ArgumentException
+from log import logger
+
+
+V = TypeVar("V")
+
+
+class SizedLRUCache(Generic[V]):
+    """
+    LRU-кэш, ограниченный суммарным размером значений в байтах, а не числом записей.
+
+    Каждая запись хранится вместе с версией источника (например, mtime файла):
+    :meth:`get` с другой версией считается промахом и удаляет устаревшую запись.
+    Потокобезопасен — синхронные обработчики FastAPI выполняются в пуле потоков.
+    """
+
+    def __init__(self, max_bytes: int):
+        if max_bytes <= 0:
+            e_str = f"max_bytes must be positive, got {max_bytes}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Hashable, V, int]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, version: Hashable, value: V, size: int) -> None:
+        """Значение больше ``max_bytes`` не кэшируется; иначе вытесняются давно не запрошенные записи."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return
+
+            while self._bytes + size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+            self._entries[key] = (version, value, size)
+            self._bytes += size
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
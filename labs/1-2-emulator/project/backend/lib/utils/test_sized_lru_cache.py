@@ -0,0 +1,45 @@
+from typing import Any, List
+
+from lib.utils.sized_lru_cache import SizedLRUCache
+
+from log import logger
+from exceptions.test_exception import TestException
+
+
+def test_sized_lru_cache():
+    """
+    Кэш на 100 байт: запись с другой версией — промах, вытесняется давно не запрошенная запись,
+    слишком большое значение не кэшируется, invalidate удаляет запись; счётчики сходятся.
+    """
+    cache: SizedLRUCache[str] = SizedLRUCache(max_bytes=100)
+    errors: List[Any] = list()
+
+    cache.put("a", 1, "A", 40)
+    cache.put("b", 1, "B", 40)
+    if cache.get("a", 1) != "A":           # hit, "a" становится самой свежей
+        errors.append({"case": "hit", "key": "a"})
+    if cache.get("b", 2) is not None:      # версия сменилась: miss, запись удалена
+        errors.append({"case": "stale version", "key": "b"})
+
+    cache.put("c", 1, "C", 40)
+    cache.put("d", 1, "D", 40)             # 120 > 100: вытесняется "a"
+    if cache.get("a", 1) is not None or cache.get("d", 1) != "D":
+        errors.append({"case": "eviction"})
+
+    cache.put("huge", 1, "H", 101)
+    if cache.get("huge", 1) is not None:
+        errors.append({"case": "oversized value cached"})
+
+    cache.invalidate("c")
+    if cache.get("c", 1) is not None:
+        errors.append({"case": "invalidate"})
+
+    expected = {"entries": 1, "bytes": 40, "max_bytes": 100, "hits": 2, "misses": 4, "evictions": 1}
+    if cache.stats() != expected:
+        errors.append({"case": "stats", "expected": expected, "received": cache.stats()})
+
+    if len(errors):
+        logger.error(f" Test error. SizedLRUCache: {errors}")
+        raise TestException(f" errors: {errors}")
+    else:
+        logger.info("test_sized_lru_cache complete!")
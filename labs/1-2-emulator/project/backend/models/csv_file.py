@@ -1,24 +1,108 @@
 
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel
 
 
+class CsvStats(BaseModel):
+    """
+    Статистика CSV, считается один раз при загрузке: по каждому признаку min/max/среднее/
+    стандартное отклонение и число примеров каждого класса (классы в порядке первого появления).
+    """
+
+    rows_count: int
+    mins: List[float]
+    maxs: List[float]
+    means: List[float]
+    stds: List[float]
+    class_counts: Dict[str, int]
+
+    @property
+    def signs_count(self) -> int:
+        return len(self.mins)
+
+    @property
+    def classes(self) -> List[str]:
+        return list(self.class_counts)
+
+
 class CsvFile(BaseModel):
     id: str
     user_id: str
     name: str
     created_at: int
     is_sample: bool
+    stats: Optional[CsvStats] = None
+
+
+class CsvColumns:
+    """
+    Содержимое CSV по столбцам: матрица признаков ``features`` (rows, signs_count) float64,
+    номера классов ``labels`` (rows,) int64 и имена классов в порядке первого появления.
+
+    One-hot разметка (rows, classes_count) строится только при первом обращении к ``class_marks``,
+    границы признаков (mins, maxs) — при первом обращении к ``bounds``, если не переданы готовыми.
+    """
+
+    features: npt.NDArray[np.float64]
+    labels: npt.NDArray[np.int64]
+    classes: List[str]
+
+    def __init__(
+        self,
+        features: npt.NDArray[np.float64],
+        labels: npt.NDArray[np.int64],
+        classes: List[str],
+        bounds: Optional[Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = None,
+    ):
+        self.features = features
+        self.labels = labels
+        self.classes = classes
+        self._bounds = bounds
+        self._class_marks: Optional[npt.NDArray[np.float64]] = None
+
+    @property
+    def nbytes(self) -> int:
+        # вместе с one-hot разметкой, которая появится при первом обучении
+        return self.features.nbytes + self.labels.nbytes + self.rows_count * len(self.classes) * 8
+
+    @property
+    def rows_count(self) -> int:
+        return self.features.shape[0]
+
+    @property
+    def signs_count(self) -> int:
+        return self.features.shape[1]
 
+    @property
+    def bounds(self) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """(mins, maxs) каждого признака."""
+        if self._bounds is None:
+            self._bounds = (self.features.min(axis=0), self.features.max(axis=0))
+        return self._bounds
 
-class SampleModel(BaseModel):
-    signs_vector: List[float]
-    class_mark: List[float]
+    def stats(self) -> CsvStats:
+        if self.rows_count == 0:
+            # у пустой выборки нет границ признаков
+            return CsvStats(rows_count=0, mins=[], maxs=[], means=[], stds=[], class_counts={})
+        mins, maxs = self.bounds
+        counts = np.bincount(self.labels, minlength=len(self.classes))
+        return CsvStats(
+            rows_count=self.rows_count,
+            mins=mins.tolist(),
+            maxs=maxs.tolist(),
+            means=self.features.mean(axis=0).tolist(),
+            stds=self.features.std(axis=0).tolist(),
+            class_counts={c: int(n) for c, n in zip(self.classes, counts)},
+        )
 
-    
-# Where is x - vector of signs, y - class mark
-class CsvFileData(BaseModel):
-    rows: List[SampleModel]
-    classes: List[str]
\ No newline at end of file
+    @property
+    def class_marks(self) -> npt.NDArray[np.float64]:
+        if self._class_marks is None:
+            marks = np.zeros((self.rows_count, len(self.classes)), dtype=np.float64)
+            marks[np.arange(self.rows_count), self.labels] = 1.0
+            self._class_marks = marks
+        return self._class_marks
@@ -1,9 +1,10 @@
 import uuid
 import time
+from typing import Any, Dict, Optional
 
 from models.progect_nn import ProjectType
 
-from sqlalchemy import String, BigInteger, ForeignKey, Boolean
+from sqlalchemy import JSON, String, BigInteger, ForeignKey, Boolean
 from sqlalchemy.orm import Mapped, mapped_column
 
 from base import Base
@@ -35,6 +36,8 @@ class CsvFileDB(Base):
     name: Mapped[str] = mapped_column(String, nullable=False)
     created_at: Mapped[int] = mapped_column(BigInteger, nullable=False, default=_now_ts)
     is_sample: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # CsvStats; NULL — ещё не посчитана (файлы, загруженные до появления колонки)
+    stats: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
 
 
 class ProjectDB(Base):
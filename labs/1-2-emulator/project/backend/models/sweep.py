@@ -0,0 +1,70 @@
+from enum import Enum
+from typing import Annotated as Annot, List, Optional
+
+from pydantic import BaseModel, Field
+
+from config import (
+    config,
+    float_constraint_validator as fcv,
+    hidden_layers_list_validator as hllv,
+    num_constraint_validator as ncv,
+)
+from lib.perceptrone.loss import LossType
+from lib.perceptrone.models.activation import ActivationType
+from lib.perceptrone.models.optimizer import OptimizerType
+
+
+class SweepSearch(str, Enum):
+    GRID = "GRID"      # все сочетания значений
+    RANDOM = "RANDOM"  # max_runs случайных различных сочетаний
+
+
+class SweepSpace(BaseModel):
+    """Перебираемые значения гиперпараметров перцептрона (каждое поле — список вариантов)."""
+    hidden_layers_architectures: List[
+        Annot[List[int], hllv(config.PublicConstraints.PERCEPTRON_HIDDEN_LAYERS)]
+    ] = Field(min_length=1)
+    activation_types: List[ActivationType] = Field(min_length=1)
+    loss_types: List[LossType] = Field(default=[LossType.MSE], min_length=1)
+    softmax_use: List[bool] = Field(default=[False], min_length=1)
+    learning_rates: List[
+        Annot[float, fcv(config.PublicConstraints.PERCEPTRON_LEARN_LEARNING_RATE_RANGE)]
+    ] = Field(min_length=1)
+    epochs: List[
+        Annot[int, ncv(config.PublicConstraints.PERCEPTRON_LEARN_EPOCHS_RANGE)]
+    ] = Field(min_length=1)
+
+
+class SweepRunParams(BaseModel):
+    """Одно сочетание гиперпараметров из :class:`SweepSpace`."""
+    hidden_layers_architecture: List[int]
+    activation_type: ActivationType
+    loss_type: LossType
+    softmax_use: bool
+    learning_rate: float
+    epochs: int
+
+
+class SweepRunResult(BaseModel):
+    run_index: int
+    params: SweepRunParams
+    loss: float
+    accuracy: float
+    stopped_epoch: int
+
+
+class SweepRequest(BaseModel):
+    """Сообщение клиента в ``/ws/sweep``; общие для всех запусков параметры обучения задаются один раз."""
+    project_id: str
+    space: SweepSpace
+    search: SweepSearch = SweepSearch.GRID
+    max_runs: Annot[int, ncv(config.PublicConstraints.PERCEPTRON_SWEEP_MAX_RUNS_RANGE)] = 16
+    seed: Optional[int] = None
+    batch_size: Annot[int, ncv(config.PublicConstraints.PERCEPTRON_LEARN_BATCH_SIZE_RANGE)] = 1
+    optimizer_type: OptimizerType = OptimizerType.SGD
+    early_stopping_patience: Annot[
+        int, ncv(config.PublicConstraints.PERCEPTRON_LEARN_EARLY_STOPPING_PATIENCE_RANGE)
+    ] = 0
+    early_stopping_min_delta: Annot[
+        float, fcv(config.PublicConstraints.PERCEPTRON_LEARN_EARLY_STOPPING_MIN_DELTA_RANGE)
+    ] = 0.0
@@ -0,0 +1,37 @@
+from typing import Any, List
+
+import numpy as np
+
+from exceptions.test_exception import TestException
+from log import logger
+from models.csv_file import CsvColumns
+
+
+def test_csv_columns_stats():
+    """Среднее и (смещённое) отклонение по столбцам, число примеров каждого класса, пустая выборка."""
+    features = np.array([[1.0, 10.0], [3.0, 10.0], [5.0, 40.0], [7.0, 20.0]])
+    columns = CsvColumns(features=features, labels=np.array([1, 0, 1, 1]), classes=["b", "a", "c"])
+    stats = columns.stats()
+
+    errors: List[Any] = list()
+
+    if stats.rows_count != 4:
+        errors.append(("rows_count", stats.rows_count))
+    if stats.mins != [1.0, 10.0] or stats.maxs != [7.0, 40.0]:
+        errors.append(("bounds", stats.mins, stats.maxs))
+    if not np.allclose(stats.means, [4.0, 20.0]):
+        errors.append(("means", stats.means))
+    if not np.allclose(stats.stds, [np.sqrt(5.0), np.sqrt(150.0)]):
+        errors.append(("stds", stats.stds))
+    if list(stats.class_counts.items()) != [("b", 1), ("a", 3), ("c", 0)]:
+        errors.append(("class_counts", stats.class_counts))
+
+    empty = CsvColumns(
+        features=np.empty((0, 2)), labels=np.empty(0, dtype=np.int64), classes=[],
+    ).stats()
+    if (empty.rows_count, empty.mins, empty.means, empty.stds, empty.class_counts) != (0, [], [], [], {}):
+        errors.append(("empty", empty))
+
+    if errors:
+        raise TestException(f" errors: {errors}")
+    logger.info("test_csv_columns_stats complete!")
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from pydantic import BaseModel
 
@@ -7,6 +7,8 @@ from pydantic import BaseModel
 class WSMessageType(str, Enum):
     QUEUE_UPDATE = "queue_update"
     TRAINING_COMPLETED = "training_completed"
+    SWEEP_RUN_COMPLETED = "sweep_run_completed"
+    SWEEP_COMPLETED = "sweep_completed"
     ERROR = "error"
 
 
@@ -18,7 +20,25 @@ class WSQueueUpdate(BaseModel):
 class WSTrainingCompleted(BaseModel):
     type: WSMessageType = WSMessageType.TRAINING_COMPLETED
     epochs: int
+    stopped_epoch: int
     loss: float
+    workers: int
+    utilization: float
+    project: Dict[str, Any]
+    image_id: str
+
+
+class WSSweepRunCompleted(BaseModel):
+    type: WSMessageType = WSMessageType.SWEEP_RUN_COMPLETED
+    completed: int
+    total: int
+    run: Dict[str, Any]
+
+
+class WSSweepCompleted(BaseModel):
+    type: WSMessageType = WSMessageType.SWEEP_COMPLETED
+    best: Dict[str, Any]
+    runs: List[Dict[str, Any]]
     project: Dict[str, Any]
     image_id: str
 
@@ -1,10 +1,11 @@
 import math
 import traceback
-from typing import Annotated as Annot, Any, Dict, List
+from typing import Annotated as Annot, Any, Dict, List, Optional
 
 import numpy as np
 import numpy.typing as npt
-from fastapi import APIRouter, Body, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Path
+from fastapi.responses import Response
 
 from config import (
     config,
@@ -12,10 +13,9 @@ from config import (
     float_constraint_validator as fcv,
     num_constraint_validator as ncv,
 )
-from lib.kohonen.models.enums import NeighbourhoodFunctionType, TopologyDistanceType
-from lib.kohonen.normalization import min_max_bounds_from_samples, min_max_normalize
+from lib.kohonen.models.enums import DecayType, NeighbourhoodFunctionType, SomTrainingMode, TopologyDistanceType
 from lib.kohonen.vector_distance_calculation.euclidean import EuclideanVectorDistanceCalculator
-from models.csv_file import CsvFileData
+from models.csv_file import CsvColumns
 from models.progect_nn import (
     NNData,
     NNDataWithoutWeights,
@@ -38,10 +38,6 @@ from ports.api.handlers.tools import oauth2_scheme
 router = APIRouter()
 
 
-def _csv_rows_to_matrix(data: CsvFileData) -> npt.NDArray[np.float64]:
-    return np.asarray([row.signs_vector for row in data.rows], dtype=np.float64)
-
-
 def _map_rows_cols(neurons: int) -> tuple[int, int]:
     r = int(math.isqrt(neurons))
     if r * r != neurons:
@@ -95,16 +91,16 @@ def init_new_kohonen_network(
         raise HTTPException(status_code=401, detail=str(e))
 
     try:
-        data: CsvFileData = csv_service.get_data(file_id=file_id, user_id=payload.user_id)
+        data: CsvColumns = csv_service.get_columns(file_id=file_id, user_id=payload.user_id)
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InternalServerException:
         raise HTTPException(status_code=500, detail="Internal server error")
 
     try:
-        if not data.rows:
+        if data.rows_count == 0:
             raise HTTPException(status_code=400, detail="CSV contains no data rows")
-        feature_dim = len(data.rows[0].signs_vector)
+        feature_dim = data.signs_count
         if feature_dim != input_layer_size:
             raise HTTPException(
                 status_code=400,
@@ -112,8 +108,8 @@ def init_new_kohonen_network(
             )
 
         rows, cols = _map_rows_cols(output_layer_size)
-        samples = _csv_rows_to_matrix(data)
-        mins, maxs = min_max_bounds_from_samples(samples)
+        samples = data.features
+        mins, maxs = data.bounds
 
         weights = kohonen_network_service.init_network(
             rows,
@@ -200,6 +196,12 @@ def learn_kohonen_network(
     ] = Body(...),
     neighbourhood_function: NeighbourhoodFunctionType = Body(...),
     topology_distance: TopologyDistanceType = Body(...),
+    training_mode: SomTrainingMode = Body(default=SomTrainingMode.ONLINE),
+    neighbourhood_cutoff: Optional[Annot[
+        float,
+        fcv(config.PublicConstraints.KOHONEN_LEARN_NEIGHBOURHOOD_CUTOFF_RANGE),
+    ]] = Body(default=None),
+    decay_type: DecayType = Body(default=DecayType.LINEAR),
 ) -> Dict[str, Any]:
     try:
         payload = auth_service.token_validate(token)
@@ -210,7 +212,7 @@ def learn_kohonen_network(
         p: ProjectWithData = project_service.get_project(payload.user_id, project_id)
         if p.project_type != ProjectType.KOHONEN:
             raise HTTPException(status_code=400, detail="project is not a Kohonen network")
-        samples_data: CsvFileData = csv_service.get_data(p.csv_file_id, payload.user_id)
+        samples_data: CsvColumns = csv_service.get_columns(p.csv_file_id, payload.user_id)
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InternalServerException:
@@ -221,7 +223,7 @@ def learn_kohonen_network(
         n_neurons = weights.shape[0]
         rows, cols = _map_rows_cols(n_neurons)
 
-        samples = _csv_rows_to_matrix(samples_data)
+        samples = samples_data.features
         if samples.shape[0] == 0:
             raise HTTPException(status_code=400, detail="CSV contains no data rows")
         if samples.shape[1] != p.nn_data.input_size:
@@ -256,6 +258,9 @@ def learn_kohonen_network(
             vector_distance_calc=vec,
             top_dist_calc=topo,
             neighbour_func=nf,
+            mode=training_mode,
+            neighbourhood_cutoff=neighbourhood_cutoff,
+            decay_type=decay_type,
         )
 
         updated = NNData(
@@ -316,31 +321,29 @@ def get_answer_kohonen(
         raise HTTPException(status_code=401, detail=str(e))
 
     try:
-        p: ProjectWithData = project_service.get_project(payload.user_id, project_id)
-        if p.project_type != ProjectType.KOHONEN:
-            raise HTTPException(status_code=400, detail="project is not a Kohonen network")
+        model = project_service.get_compiled_model(
+            payload.user_id, project_id, kohonen_network_service.compile,
+        )
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InternalServerException:
         raise HTTPException(status_code=500, detail="Internal server error")
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        weights = _weights_matrix(p.nn_data)
-        n_neurons = weights.shape[0]
+        n_neurons = model.weights.shape[0]
         rows, cols = _map_rows_cols(n_neurons)
 
-        mins = np.asarray(p.nn_data.mins, dtype=np.float64)
-        maxs = np.asarray(p.nn_data.maxs, dtype=np.float64)
         x = np.asarray(input_vector, dtype=np.float64).ravel()
-        if x.size != p.nn_data.input_size:
+        if x.size != model.input_size:
             raise HTTPException(
                 status_code=400,
-                detail=f"input_vector length {x.size} != input_size {p.nn_data.input_size}",
+                detail=f"input_vector length {x.size} != input_size {model.input_size}",
             )
 
-        normalized = min_max_normalize(x, mins, maxs)
-        vec = EuclideanVectorDistanceCalculator()
-        distances = vec.perform(weights, normalized)
+        normalized = model.normalize(x)
+        distances = model.squared_distances(x)
         winner = int(np.argmin(distances))
     except HTTPException:
         raise
@@ -358,3 +361,37 @@ def get_answer_kohonen(
         "normalized_input": normalized.tolist(),
         "squared_distances": distances.tolist(),
     }
+
+
+@router.get("/export/{project_id}")
+def export_compiled_kohonen(
+    token: str = Depends(oauth2_scheme),
+    project_id: str = Path(...),
+) -> Response:
+    """Скомпилированная карта (нормализация вложена в аффинную оценку расстояний) как .npz."""
+    try:
+        payload = auth_service.token_validate(token)
+    except AuthException as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+    try:
+        model = project_service.get_compiled_model(
+            payload.user_id, project_id, kohonen_network_service.compile,
+        )
+        content = model.to_npz()
+    except NotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InternalServerException:
+        raise HTTPException(status_code=500, detail="Internal server error")
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"error while exporting kohonen network: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return Response(
+        content,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{project_id}.npz"'},
+    )
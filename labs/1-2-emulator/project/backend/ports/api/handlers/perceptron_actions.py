@@ -1,10 +1,13 @@
 import traceback
-from typing import Annotated as Annot, Any, Dict, List
+from typing import Annotated as Annot, Any, Dict, List, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException
+import numpy as np
+from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
+from fastapi.responses import Response
 
 from config import (
     config,
+    finite_input_matrix_validator as finite_in_mat,
     finite_input_vector_validator as finite_in_vec,
     float_constraint_validator as fcv,
     hidden_layers_list_validator as hllv,
@@ -13,8 +16,10 @@ from config import (
 
 from lib.perceptrone.models.activation import ActivationType
 from lib.perceptrone.loss import LossType
-from lib.perceptrone.mathh.models import Sample
-from models.csv_file import CsvFileData
+from lib.perceptrone.models.learning_rate import LearningRateScheduleType
+from lib.perceptrone.models.optimizer import OptimizerType
+from lib.perceptrone.models.training import LossEvaluationMode, ParallelMode
+from models.csv_file import CsvColumns, CsvStats
 from models.progect_nn import (
     NNData,
     NNDataWithoutWeights,
@@ -36,10 +41,6 @@ router = APIRouter()
 
 
 
-def _csv_data_to_samples(data: CsvFileData) -> List[Sample]:
-    return [Sample(signs=row.signs_vector, class_marks=row.class_mark) for row in data.rows]
-
-
 @router.post("/init")
 def init_new_perceptron(
     token: str = Depends(oauth2_scheme),
@@ -55,27 +56,30 @@ def init_new_perceptron(
         raise HTTPException(status_code=401, detail=str(e))
 
     try:
-        data: CsvFileData = csv_service.get_data(file_id=file_id, user_id=payload.user_id)
+        stats: CsvStats = csv_service.get_stats(file_id=file_id, user_id=payload.user_id)
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InternalServerException:
         raise HTTPException(status_code=500, detail="Internal server error")
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        input_layer_size: int = len(data.rows[0].signs_vector)
-        output_layer_size: int = len(data.classes)
+        if stats.rows_count == 0:
+            raise HTTPException(status_code=400, detail="CSV contains no data rows")
+        input_layer_size: int = stats.signs_count
+        output_layer_size: int = len(stats.classes)
 
         architecture: List[int] = [input_layer_size] + hidden_layers_architecture + [output_layer_size]
-        raw_samples: List[Sample] = _csv_data_to_samples(data)
 
-        weights, mins, maxs = nn_service.init_perceptron(architecture, raw_samples)
+        weights = nn_service.init_perceptron(architecture)
 
         nn_data: NNData = NNData(
             weights=weights,
             input_size=input_layer_size,
-            mins=mins,
-            maxs=maxs,
-            classes=data.classes,
+            mins=stats.mins,
+            maxs=stats.maxs,
+            classes=stats.classes,
         )
         img = nn_service.get_visualisation(weights)
 
@@ -86,6 +90,8 @@ def init_new_perceptron(
             project_type=ProjectType.PERCEPTRON,
         )
         image_id = project_service.save_image(payload.user_id, project.id, img)
+    except HTTPException:
+        raise
     except DomainException as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -123,6 +129,39 @@ def learn_perceptron(
         float,
         fcv(config.PublicConstraints.PERCEPTRON_LEARN_LEARNING_RATE_RANGE),
     ] = Body(...),
+    batch_size: Annot[int, ncv(config.PublicConstraints.PERCEPTRON_LEARN_BATCH_SIZE_RANGE)] = Body(default=1),
+    loss_evaluation: LossEvaluationMode = Body(default=LossEvaluationMode.FULL),
+    loss_evaluation_interval: Annot[
+        int,
+        ncv(config.PublicConstraints.PERCEPTRON_LEARN_LOSS_EVALUATION_INTERVAL_RANGE),
+    ] = Body(default=1),
+    loss_evaluation_subsample: Annot[
+        int,
+        ncv(config.PublicConstraints.PERCEPTRON_LEARN_LOSS_EVALUATION_SUBSAMPLE_RANGE),
+    ] = Body(default=1000),
+    early_stopping_patience: Annot[
+        int,
+        ncv(config.PublicConstraints.PERCEPTRON_LEARN_EARLY_STOPPING_PATIENCE_RANGE),
+    ] = Body(default=0),
+    early_stopping_min_delta: Annot[
+        float,
+        fcv(config.PublicConstraints.PERCEPTRON_LEARN_EARLY_STOPPING_MIN_DELTA_RANGE),
+    ] = Body(default=0.0),
+    target_loss: Optional[Annot[
+        float,
+        fcv(config.PublicConstraints.PERCEPTRON_LEARN_TARGET_LOSS_RANGE),
+    ]] = Body(default=None),
+    optimizer_type: OptimizerType = Body(default=OptimizerType.SGD),
+    lr_schedule: LearningRateScheduleType = Body(default=LearningRateScheduleType.CONSTANT),
+    lr_decay: Annot[float, fcv(config.PublicConstraints.PERCEPTRON_LEARN_LR_DECAY_RANGE)] = Body(default=0.5),
+    lr_step_size: Annot[int, ncv(config.PublicConstraints.PERCEPTRON_LEARN_LR_STEP_SIZE_RANGE)] = Body(default=10),
+    lr_min: Annot[float, fcv(config.PublicConstraints.PERCEPTRON_LEARN_LR_MIN_RANGE)] = Body(default=0.0),
+    lr_warmup_epochs: Annot[
+        int,
+        ncv(config.PublicConstraints.PERCEPTRON_LEARN_LR_WARMUP_EPOCHS_RANGE),
+    ] = Body(default=0),
+    workers: Annot[int, ncv(config.PublicConstraints.PERCEPTRON_LEARN_WORKERS_RANGE)] = Body(default=1),
+    parallel_mode: ParallelMode = Body(default=ParallelMode.SYNC),
 ) -> Dict[str, Any]:
     try:
         payload = auth_service.token_validate(token)
@@ -131,24 +170,40 @@ def learn_perceptron(
 
     try:
         p: ProjectWithData = project_service.get_project(payload.user_id, project_id)
-        samples_data: CsvFileData = csv_service.get_data(p.csv_file_id, payload.user_id)
+        samples_data: CsvColumns = csv_service.get_columns(p.csv_file_id, payload.user_id)
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InternalServerException:
         raise HTTPException(status_code=500, detail="Internal server error")
 
     try:
-        raw_samples: List[Sample] = _csv_data_to_samples(samples_data)
-
-        p.nn_data.weights = nn_service.train(
+        result = nn_service.train(
             weights=p.nn_data.weights,
-            samples=raw_samples,
+            signs=samples_data.features,
+            class_marks=samples_data.class_marks,
             activation_type=activation_type,
             loss_type=loss_type,
             softmax_use=softmax_use,
             epochs=epochs,
             learning_rate=learning_rate,
+            batch_size=batch_size,
+            loss_evaluation=loss_evaluation,
+            loss_evaluation_interval=loss_evaluation_interval,
+            loss_evaluation_subsample=loss_evaluation_subsample,
+            early_stopping_patience=early_stopping_patience,
+            early_stopping_min_delta=early_stopping_min_delta,
+            target_loss=target_loss,
+            optimizer_type=optimizer_type,
+            lr_schedule=lr_schedule,
+            lr_decay=lr_decay,
+            lr_step_size=lr_step_size,
+            lr_min=lr_min,
+            lr_warmup_epochs=lr_warmup_epochs,
+            workers=workers,
+            parallel_mode=parallel_mode,
+            bounds=samples_data.bounds,
         )
+        p.nn_data.weights = result.weights
 
         img = nn_service.get_visualisation(p.nn_data.weights)
         image_id = project_service.save_image(payload.user_id, p.id, img)
@@ -163,6 +218,10 @@ def learn_perceptron(
     return {
         "project": p.model_dump(),
         "image_id": image_id,
+        "loss": result.loss,
+        "stopped_epoch": result.stopped_epoch,
+        "workers": result.workers,
+        "utilization": result.utilization,
     }
 
 
@@ -183,24 +242,20 @@ def get_answer(
         raise HTTPException(status_code=401, detail=str(e))
 
     try:
-        p: ProjectWithData = project_service.get_project(payload.user_id, perceptron_id)
+        model = project_service.get_compiled_model(payload.user_id, perceptron_id, nn_service.compile)
     except NotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InternalServerException:
         raise HTTPException(status_code=500, detail="Internal server error")
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     try:
-        classes = p.nn_data.classes
+        classes = model.classes
 
-        output_vector = nn_service.predict(
-            weights=p.nn_data.weights,
-            input_vector=input_vector,
-            activation_type=activation_type,
-            softmax_use=softmax_use,
-            mins=p.nn_data.mins,
-            maxs=p.nn_data.maxs,
-            input_size=p.nn_data.input_size,
-        )
+        output_vector: List[float] = model.predict(
+            np.asarray([input_vector], dtype=np.float64), activation_type, softmax_use,
+        )[0].tolist()
 
         predicted: str = classes[output_vector.index(max(output_vector))]
         confidences: Dict[str, float] = {
@@ -219,3 +274,106 @@ def get_answer(
         "output": output_vector,
     }
 
+
+@router.post("/get_answers")
+def get_answers(
+    token: str = Depends(oauth2_scheme),
+    perceptron_id: str = Body(...),
+    input_matrix: Optional[
+        Annot[
+            List[List[float]],
+            finite_in_mat(
+                config.PublicConstraints.PERCEPTRON_GET_ANSWERS_MAX_ROWS,
+                config.PublicConstraints.PERCEPTRON_GET_ANSWER_INPUT_VECTOR_MAX_LEN,
+            ),
+        ]
+    ] = Body(default=None),
+    csv_file_id: Optional[str] = Body(default=None),
+    activation_type: ActivationType = Body(...),
+    softmax_use: bool = Body(default=False),
+) -> Dict[str, Any]:
+    """Классифицирует все строки ``input_matrix`` или все строки сохранённого CSV-файла за один проход."""
+    try:
+        payload = auth_service.token_validate(token)
+    except AuthException as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+    if (input_matrix is None) == (csv_file_id is None):
+        raise HTTPException(status_code=400, detail="Exactly one of input_matrix or csv_file_id is required")
+
+    try:
+        model = project_service.get_compiled_model(payload.user_id, perceptron_id, nn_service.compile)
+        if csv_file_id is not None:
+            signs_matrix = csv_service.get_columns(csv_file_id, payload.user_id).features
+        else:
+            signs_matrix = np.asarray(input_matrix, dtype=np.float64)
+    except NotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InternalServerException:
+        raise HTTPException(status_code=500, detail="Internal server error")
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        classes = model.classes
+        if signs_matrix.ndim != 2 or signs_matrix.shape[0] == 0:
+            raise HTTPException(status_code=400, detail="No rows to score")
+
+        outputs = model.predict(signs_matrix, activation_type, softmax_use)
+
+        predicted_indices = np.argmax(outputs, axis=1)
+        rounded = np.round(outputs, 4)
+        predicted: List[str] = [classes[i] for i in predicted_indices.tolist()]
+        confidence: List[float] = rounded[np.arange(len(outputs)), predicted_indices].tolist()
+        confidences: Dict[str, List[float]] = {
+            classes[i]: rounded[:, i].tolist() for i in range(len(classes))
+        }
+    except HTTPException:
+        raise
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"error while getting answers: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return {
+        "classes": classes,
+        "predicted": predicted,
+        "confidence": confidence,
+        "confidences": confidences,
+    }
+
+
+@router.get("/export/{perceptron_id}")
+def export_compiled_perceptron(
+    token: str = Depends(oauth2_scheme),
+    perceptron_id: str = Path(...),
+    activation_type: Optional[ActivationType] = Query(default=None),
+    softmax_use: Optional[bool] = Query(default=None),
+) -> Response:
+    """Скомпилированная модель (нормализация вложена в первый слой) как .npz для инференса вне сервиса."""
+    try:
+        payload = auth_service.token_validate(token)
+    except AuthException as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+    try:
+        model = project_service.get_compiled_model(payload.user_id, perceptron_id, nn_service.compile)
+        content = model.to_npz(activation_type=activation_type, softmax_use=softmax_use)
+    except NotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InternalServerException:
+        raise HTTPException(status_code=500, detail="Internal server error")
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"error while exporting perceptron: {e}")
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return Response(
+        content,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{perceptron_id}.npz"'},
+    )
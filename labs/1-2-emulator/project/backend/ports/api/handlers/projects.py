@@ -76,3 +76,13 @@ def delete_project(
         raise HTTPException(status_code=500, detail="Internal server error")
 
     return {"deleted": project_id}
+
+
+@router.get("/model_cache")
+def get_model_cache_stats(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
+    try:
+        auth_service.token_validate(token)
+    except AuthException as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+    return {"model_cache": project_service.get_model_cache_stats()}
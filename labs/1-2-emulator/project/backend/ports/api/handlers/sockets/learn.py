@@ -56,6 +56,21 @@ async def ws_learn(websocket: WebSocket, token: str = Query(...)):
         loss_type=data.get("loss_type", "MSE"),
         epochs=data["epochs"],
         learning_rate=data["learning_rate"],
+        batch_size=data.get("batch_size", 1),
+        loss_evaluation=data.get("loss_evaluation", "FULL"),
+        loss_evaluation_interval=data.get("loss_evaluation_interval", 1),
+        loss_evaluation_subsample=data.get("loss_evaluation_subsample", 1000),
+        early_stopping_patience=data.get("early_stopping_patience", 0),
+        early_stopping_min_delta=data.get("early_stopping_min_delta", 0.0),
+        target_loss=data.get("target_loss"),
+        optimizer_type=data.get("optimizer_type", "SGD"),
+        lr_schedule=data.get("lr_schedule", "CONSTANT"),
+        lr_decay=data.get("lr_decay", 0.5),
+        lr_step_size=data.get("lr_step_size", 10),
+        lr_min=data.get("lr_min", 0.0),
+        lr_warmup_epochs=data.get("lr_warmup_epochs", 0),
+        workers=data.get("workers", 1),
+        parallel_mode=data.get("parallel_mode", "SYNC"),
     )
 
     try:
@@ -74,6 +89,9 @@ async def ws_learn(websocket: WebSocket, token: str = Query(...)):
                 await websocket.send_json(
                     WSTrainingCompleted(
                         epochs=result["epochs"],
+                        stopped_epoch=result["stopped_epoch"],
+                        workers=result["workers"],
+                        utilization=result["utilization"],
                         loss=result["loss"],
                         project=result["project"],
                         image_id=result["image_id"],
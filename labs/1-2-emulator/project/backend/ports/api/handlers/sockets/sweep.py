@@ -0,0 +1,103 @@
+import asyncio
+from typing import Set
+
+from fastapi import APIRouter, WebSocket, Query
+from pydantic import ValidationError
+
+from ports.celery.tasks import start_sweep
+from container import auth_service, project_service, sweep_service
+from config import config
+from models.sweep import SweepRequest
+from models.ws_models import WSSweepRunCompleted, WSSweepCompleted, WSError
+from exceptions.auth_exception import AuthException
+from exceptions.domain import DomainException
+from exceptions.not_found import NotFoundException
+from log import logger
+
+router = APIRouter()
+
+
+@router.websocket("/sweep")
+async def ws_sweep(websocket: WebSocket, token: str = Query(...)):
+    await websocket.accept()
+
+    try:
+        payload = auth_service.token_validate(token)
+    except AuthException:
+        await websocket.send_json(WSError(detail="Unauthorized").model_dump())
+        await websocket.close()
+        return
+
+    try:
+        request = SweepRequest.model_validate(await websocket.receive_json())
+    except ValidationError as e:
+        await websocket.send_json(WSError(detail=f"Invalid request: {e.errors()}").model_dump())
+        await websocket.close()
+        return
+    except Exception:
+        await websocket.send_json(WSError(detail="Invalid request").model_dump())
+        await websocket.close()
+        return
+
+    try:
+        project_service.get_project(payload.user_id, request.project_id)
+    except NotFoundException:
+        await websocket.send_json(WSError(detail="Project not found").model_dump())
+        await websocket.close()
+        return
+
+    try:
+        runs = sweep_service.build_runs(request.space, request.search, request.max_runs, request.seed)
+    except DomainException as e:
+        await websocket.send_json(WSError(detail=str(e)).model_dump())
+        await websocket.close()
+        return
+
+    final = start_sweep(
+        user_id=payload.user_id,
+        project_id=request.project_id,
+        runs=runs,
+        batch_size=request.batch_size,
+        optimizer_type=request.optimizer_type.value,
+        early_stopping_patience=request.early_stopping_patience,
+        early_stopping_min_delta=request.early_stopping_min_delta,
+    )
+    run_results = final.parent.results
+
+    try:
+        reported: Set[int] = set()
+        while True:
+            for index, run_result in enumerate(run_results):
+                if index in reported or not run_result.ready():
+                    continue
+                reported.add(index)
+                if run_result.successful():
+                    run = sweep_service.strip_weights(run_result.result).model_dump(mode="json")
+                    await websocket.send_json(
+                        WSSweepRunCompleted(completed=len(reported), total=len(runs), run=run).model_dump()
+                    )
+
+            state = final.state
+            if state == "SUCCESS":
+                result = final.result
+                await websocket.send_json(
+                    WSSweepCompleted(
+                        best=result["best"],
+                        runs=result["runs"],
+                        project=result["project"],
+                        image_id=result["image_id"],
+                    ).model_dump()
+                )
+                break
+
+            elif state == "FAILURE" or any(r.failed() for r in run_results):
+                await websocket.send_json(
+                    WSError(detail="Sweep failed").model_dump()
+                )
+                break
+
+            await asyncio.sleep(config.POLL_INTERVAL_SECONDS)
+    except Exception as e:
+        logger.error(f"WebSocket error: {e}")
+    finally:
+        await websocket.close()
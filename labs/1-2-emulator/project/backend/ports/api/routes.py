@@ -7,6 +7,7 @@ from ports.api.handlers.images import router as images_router
 from ports.api.handlers.csv_files import router as csv_router
 from ports.api.handlers.auth import router as auth_router
 from ports.api.handlers.sockets.learn import router as ws_learn_router
+from ports.api.handlers.sockets.sweep import router as ws_sweep_router
 from ports.api.routers.public_constraints_router import (
     router as public_constraints_router,
 )
@@ -27,3 +28,4 @@ main_router.include_router(
 main_router.include_router(images_router, prefix="/images", tags=["images"])
 main_router.include_router(csv_router, prefix="/csv", tags=["csv"])
 main_router.include_router(ws_learn_router, prefix="/ws", tags=["websocket"])
+main_router.include_router(ws_sweep_router, prefix="/ws", tags=["websocket"])
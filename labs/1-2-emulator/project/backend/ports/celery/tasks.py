@@ -1,19 +1,19 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from celery import shared_task
+from celery import chord, group, shared_task
+from celery.result import AsyncResult
 
-from lib.perceptrone.mathh.models import Sample
 from lib.perceptrone.models.activation import ActivationType
 from lib.perceptrone.loss import LossType
+from lib.perceptrone.models.learning_rate import LearningRateScheduleType
+from lib.perceptrone.models.optimizer import OptimizerType
+from lib.perceptrone.models.training import LossEvaluationMode, ParallelMode
 
-from container import project_service, csv_service, nn_service
+from container import project_service, csv_service, nn_service, sweep_service
+from models.sweep import SweepRunParams
 from log import logger
 
 
-def _csv_data_to_samples(data) -> List[Sample]:
-    return [Sample(signs=row.signs_vector, class_marks=row.class_mark) for row in data.rows]
-
-
 @shared_task
 def train_perceptron_task(
     user_id: str,
@@ -23,41 +23,184 @@ def train_perceptron_task(
     loss_type: str,
     epochs: int,
     learning_rate: float,
+    batch_size: int = 1,
+    loss_evaluation: str = LossEvaluationMode.FULL.value,
+    loss_evaluation_interval: int = 1,
+    loss_evaluation_subsample: int = 1000,
+    early_stopping_patience: int = 0,
+    early_stopping_min_delta: float = 0.0,
+    target_loss: Optional[float] = None,
+    optimizer_type: str = OptimizerType.SGD.value,
+    lr_schedule: str = LearningRateScheduleType.CONSTANT.value,
+    lr_decay: float = 0.5,
+    lr_step_size: int = 10,
+    lr_min: float = 0.0,
+    lr_warmup_epochs: int = 0,
+    workers: int = 1,
+    parallel_mode: str = ParallelMode.SYNC.value,
 ) -> Dict[str, Any]:
     p = project_service.get_project(user_id, project_id)
-    samples_data = csv_service.get_data(p.csv_file_id, user_id)
-    raw_samples = _csv_data_to_samples(samples_data)
+    samples_data = csv_service.get_columns(p.csv_file_id, user_id)
 
     act = ActivationType(activation_type)
     lt = LossType(loss_type)
 
-    p.nn_data.weights = nn_service.train(
+    result = nn_service.train(
         weights=p.nn_data.weights,
-        samples=raw_samples,
+        signs=samples_data.features,
+        class_marks=samples_data.class_marks,
         activation_type=act,
         loss_type=lt,
         softmax_use=softmax_use,
         epochs=epochs,
         learning_rate=learning_rate,
+        batch_size=batch_size,
+        loss_evaluation=LossEvaluationMode(loss_evaluation),
+        loss_evaluation_interval=loss_evaluation_interval,
+        loss_evaluation_subsample=loss_evaluation_subsample,
+        early_stopping_patience=early_stopping_patience,
+        early_stopping_min_delta=early_stopping_min_delta,
+        target_loss=target_loss,
+        optimizer_type=OptimizerType(optimizer_type),
+        lr_schedule=LearningRateScheduleType(lr_schedule),
+        lr_decay=lr_decay,
+        lr_step_size=lr_step_size,
+        lr_min=lr_min,
+        lr_warmup_epochs=lr_warmup_epochs,
+        workers=workers,
+        parallel_mode=ParallelMode(parallel_mode),
+        bounds=samples_data.bounds,
     )
-
-    loss = nn_service.compute_loss(
-        weights=p.nn_data.weights,
-        samples=raw_samples,
-        activation_type=act,
-        loss_type=lt,
-        softmax_use=softmax_use,
-    )
+    p.nn_data.weights = result.weights
+    loss = result.loss
 
     img = nn_service.get_visualisation(p.nn_data.weights)
     image_id = project_service.save_image(user_id, p.id, img)
     project_service.update_weights(user_id, p.id, p.nn_data.weights)
 
-    logger.info(f"Training completed: project={p.id}, epochs={epochs}, loss={loss:.6f}")
+    logger.info(
+        f"Training completed: project={p.id}, epochs={result.stopped_epoch}/{epochs}, loss={loss:.6f}, "
+        f"workers={result.workers}, utilization={result.utilization:.2f}"
+    )
 
     return {
         "project": p.model_dump(),
         "image_id": image_id,
         "epochs": epochs,
+        "stopped_epoch": result.stopped_epoch,
         "loss": loss,
+        "workers": result.workers,
+        "utilization": result.utilization,
     }
+
+
+@shared_task
+def sweep_run_task(
+    user_id: str,
+    project_id: str,
+    run_index: int,
+    run: Dict[str, Any],
+    batch_size: int = 1,
+    optimizer_type: str = OptimizerType.SGD.value,
+    early_stopping_patience: int = 0,
+    early_stopping_min_delta: float = 0.0,
+) -> Dict[str, Any]:
+    """Один запуск перебора: новая сеть заданной архитектуры обучается с нуля, проект не изменяется."""
+    params = SweepRunParams.model_validate(run)
+    p = project_service.get_project(user_id, project_id)
+    dataset = csv_service.get_columns(p.csv_file_id, user_id)
+
+    architecture = [p.nn_data.input_size] + params.hidden_layers_architecture + [len(p.nn_data.classes)]
+    weights = nn_service.init_perceptron(architecture)
+
+    result = nn_service.train(
+        weights=weights,
+        signs=dataset.features,
+        class_marks=dataset.class_marks,
+        activation_type=params.activation_type,
+        loss_type=params.loss_type,
+        softmax_use=params.softmax_use,
+        epochs=params.epochs,
+        learning_rate=params.learning_rate,
+        batch_size=batch_size,
+        early_stopping_patience=early_stopping_patience,
+        early_stopping_min_delta=early_stopping_min_delta,
+        optimizer_type=OptimizerType(optimizer_type),
+        bounds=dataset.bounds,
+    )
+    accuracy = nn_service.compute_accuracy(
+        result.weights, dataset.features, dataset.labels, params.activation_type, params.softmax_use,
+        bounds=dataset.bounds,
+    )
+
+    logger.info(
+        f"Sweep run completed: project={project_id}, run={run_index}, "
+        f"loss={result.loss:.6f}, accuracy={accuracy:.4f}"
+    )
+
+    return {
+        "run_index": run_index,
+        "params": params.model_dump(mode="json"),
+        "loss": result.loss,
+        "accuracy": accuracy,
+        "stopped_epoch": result.stopped_epoch,
+        "weights": result.weights,
+    }
+
+
+@shared_task
+def finish_sweep_task(results: List[Dict[str, Any]], user_id: str, project_id: str) -> Dict[str, Any]:
+    """Сохраняет в проект веса лучшего запуска перебора."""
+    best = sweep_service.pick_best(results)
+
+    img = nn_service.get_visualisation(best["weights"])
+    image_id = project_service.save_image(user_id, project_id, img)
+    project_service.update_weights(user_id, project_id, best["weights"])
+    p = project_service.get_project(user_id, project_id)
+
+    logger.info(
+        f"Sweep completed: project={project_id}, runs={len(results)}, best_run={best['run_index']}, "
+        f"loss={best['loss']:.6f}, accuracy={best['accuracy']:.4f}"
+    )
+
+    return {
+        "best": sweep_service.strip_weights(best).model_dump(mode="json"),
+        "runs": [
+            sweep_service.strip_weights(r).model_dump(mode="json")
+            for r in sorted(results, key=lambda r: r["run_index"])
+        ],
+        "project": p.model_dump(),
+        "image_id": image_id,
+    }
+
+
+def start_sweep(
+    user_id: str,
+    project_id: str,
+    runs: List[SweepRunParams],
+    batch_size: int = 1,
+    optimizer_type: str = OptimizerType.SGD.value,
+    early_stopping_patience: int = 0,
+    early_stopping_min_delta: float = 0.0,
+) -> AsyncResult:
+    """
+    Ставит запуски перебора в очередь группой, их разбирают все свободные воркеры параллельно;
+    ``finish_sweep_task`` выполняется, когда завершились все запуски.
+
+    Returns:
+        результат финальной задачи; ``.parent`` — GroupResult с результатами отдельных запусков
+    """
+    header = group(
+        sweep_run_task.s(
+            user_id=user_id,
+            project_id=project_id,
+            run_index=index,
+            run=run.model_dump(mode="json"),
+            batch_size=batch_size,
+            optimizer_type=optimizer_type,
+            early_stopping_patience=early_stopping_patience,
+            early_stopping_min_delta=early_stopping_min_delta,
+        )
+        for index, run in enumerate(runs)
+    )
+    return chord(header)(finish_sweep_task.s(user_id=user_id, project_id=project_id))
@@ -1,38 +1,42 @@
 import csv
+import json
 import os
-from typing import List, Optional, Sequence, Tuple
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from exceptions.domain import DomainException
 from exceptions.not_found import NotFoundException
-from models.csv_file import CsvFileData, SampleModel
+from log import logger
+from models.csv_file import CsvColumns
 
 
-def _non_empty_fieldnames(fieldnames: Optional[Sequence[str]]) -> List[str]:
-    """Порядок ключей DictReader без пустых имён (часто из‑за лишней запятой в заголовке Excel)."""
-    out: List[str] = []
-    for raw in fieldnames or []:
-        if raw is None:
-            continue
-        if not str(raw).strip():
-            continue
-        out.append(str(raw))
-    return out
+def _non_empty_columns(fieldnames: Optional[Sequence[str]]) -> List[int]:
+    """Номера колонок заголовка без пустых имён (часто из‑за лишней запятой в заголовке Excel)."""
+    return [i for i, raw in enumerate(fieldnames or []) if raw is not None and str(raw).strip()]
 
 
-def _feature_and_label_keys(fieldnames: Optional[Sequence[str]]) -> Tuple[List[str], str]:
+def _feature_and_label_columns(fieldnames: Optional[Sequence[str]]) -> Tuple[List[int], int]:
     """Формат: ``номер_примера, признак1, …, признакK, метка`` — первая колонка не признак, метка всегда последняя."""
-    keys = _non_empty_fieldnames(fieldnames)
-    if len(keys) < 3:
+    columns = _non_empty_columns(fieldnames)
+    if len(columns) < 3:
         raise DomainException(
             "В CSV нужно минимум три колонки: номер примера, хотя бы один признак и метка в последней колонке",
         )
-    label_key = keys[-1]
-    feature_keys = keys[1:-1]
-    if not feature_keys:
+    label_column = columns[-1]
+    feature_columns = columns[1:-1]
+    if not feature_columns:
         raise DomainException(
             "Нет колонок признаков между номером примера и меткой класса",
         )
-    return feature_keys, label_key
+    return feature_columns, label_column
+
+
+# Разобранный CSV рядом с ним в той же папке: {file_id}.<suffix>. meta.json пишется последним
+# и хранит версию CSV, по которой сделаны остальные файлы.
+_SIDECAR_ARRAYS = ("features", "labels", "bounds")
+_SIDECAR_META = "meta.json"
 
 
 class CsvDiskRepository:
@@ -42,6 +46,7 @@ class CsvDiskRepository:
 
     def save(self, file_id: str, content: bytes) -> str:
         os.makedirs(self.directory, exist_ok=True)
+        self._delete_sidecars(file_id)
         path: str = os.path.join(self.directory, f"{file_id}.csv")
         with open(path, "wb") as f:
             f.write(content)
@@ -62,35 +67,106 @@ class CsvDiskRepository:
         if not os.path.exists(path):
             raise NotFoundException(f"CSV file '{file_id}' not found")
         os.remove(path)
-
-    def get_data(self, file_id: str) -> CsvFileData:
+        self._delete_sidecars(file_id)
+
+    def get_version(self, file_id: str) -> Tuple[int, int]:
+        """(mtime_ns, size) CSV-файла."""
+        st = os.stat(self.get_file(file_id))
+        return st.st_mtime_ns, st.st_size
+
+    def get_columns(self, file_id: str) -> CsvColumns:
+        """
+        Столбцы CSV из сохранённых рядом .npy (memory-mapped, без разбора текста),
+        а если их нет или они сделаны по другой версии файла — разбор CSV и запись .npy.
+        """
+        version = self.get_version(file_id)
+        columns = self._load_sidecars(file_id, version)
+        if columns is None:
+            columns = self._parse_columns(file_id)
+            self._save_sidecars(file_id, version, columns)
+        return columns
+
+    def _sidecar_path(self, file_id: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{file_id}.{suffix}")
+
+    def _load_sidecars(self, file_id: str, version: Tuple[int, int]) -> Optional[CsvColumns]:
+        try:
+            with open(self._sidecar_path(file_id, _SIDECAR_META)) as f:
+                meta = json.load(f)
+            if tuple(meta["version"]) != version:
+                return None
+            features, labels, bounds = (
+                np.load(self._sidecar_path(file_id, f"{name}.npy"), mmap_mode="r") for name in _SIDECAR_ARRAYS
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+        return CsvColumns(features=features, labels=labels, classes=meta["classes"], bounds=(bounds[0], bounds[1]))
+
+    def _save_sidecars(self, file_id: str, version: Tuple[int, int], columns: CsvColumns) -> None:
+        """Запись через временные файлы и os.replace: параллельный читатель видит либо старые, либо новые файлы."""
+        if columns.rows_count == 0:
+            return
+        mins, maxs = columns.bounds
+        arrays = {"features": columns.features, "labels": columns.labels, "bounds": np.stack([mins, maxs])}
+        tmp_suffix = f".{os.getpid()}.tmp"
+        try:
+            for name in _SIDECAR_ARRAYS:
+                path = self._sidecar_path(file_id, f"{name}.npy")
+                with open(path + tmp_suffix, "wb") as f:
+                    np.save(f, arrays[name])
+                os.replace(path + tmp_suffix, path)
+
+            path = self._sidecar_path(file_id, _SIDECAR_META)
+            with open(path + tmp_suffix, "w") as f:
+                json.dump({"version": list(version), "classes": columns.classes}, f, ensure_ascii=False)
+            os.replace(path + tmp_suffix, path)
+        except OSError as e:
+            # без кэша всё работает, просто CSV будет разобран снова
+            logger.warning(f"could not save parsed CSV '{file_id}': {e}")
+
+    def _delete_sidecars(self, file_id: str) -> None:
+        for suffix in (_SIDECAR_META,) + tuple(f"{name}.npy" for name in _SIDECAR_ARRAYS):
+            try:
+                os.remove(self._sidecar_path(file_id, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _parse_columns(self, file_id: str) -> CsvColumns:
+        """
+        Разбирает CSV сразу в столбцы: признаки — один плоский float64-буфер, заполняемый потоком
+        значений, метки — номера классов через словарь за один проход, без объекта на каждую строку.
+        """
         path = self.get_file(file_id)
-        rows: List[SampleModel] = []
-        classes: List[str] = []
 
         with open(path, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
-            raw_dict_rows: List[dict] = list(reader)
-
-        feature_cols, label_col = _feature_and_label_keys(fieldnames)
-
-        for row in raw_dict_rows:
-            label = str(row[label_col])
-            if label not in classes:
-                classes.append(label)
-
-        for row in raw_dict_rows:
-            try:
-                x = [float(row[c]) for c in feature_cols]
-            except (TypeError, ValueError) as e:
-                raise DomainException(
-                    "Ожидаются числовые значения во всех колонках признаков; "
-                    f"проверьте строку и заголовки ({e})",
-                ) from e
-            label_idx = classes.index(str(row[label_col]))
-            y: List[float] = [1.0 if i == label_idx else 0.0 for i in range(len(classes))]
-            rows.append(SampleModel(signs_vector=x, class_mark=y))
-
-        return CsvFileData(rows=rows, classes=classes)
-    
\ No newline at end of file
+            reader = csv.reader(f)
+            fieldnames = next(reader, None)
+            records = [record for record in reader if record]
+
+        feature_columns, label_column = _feature_and_label_columns(fieldnames)
+
+        try:
+            if len(feature_columns) == 1:
+                column = feature_columns[0]
+                values: Iterator[float] = (float(record[column]) for record in records)
+            else:
+                get_features = itemgetter(*feature_columns)
+                values = (float(value) for record in records for value in get_features(record))
+            features = np.fromiter(values, dtype=np.float64, count=len(records) * len(feature_columns))
+            class_codes: Dict[str, int] = {}
+            labels = np.fromiter(
+                (class_codes.setdefault(record[label_column], len(class_codes)) for record in records),
+                dtype=np.int64,
+                count=len(records),
+            )
+        except (IndexError, TypeError, ValueError) as e:
+            raise DomainException(
+                "Ожидаются числовые значения во всех колонках признаков; "
+                f"проверьте строку и заголовки ({e})",
+            ) from e
+
+        return CsvColumns(
+            features=features.reshape(len(records), len(feature_columns)),
+            labels=labels,
+            classes=list(class_codes),
+        )
@@ -3,7 +3,7 @@ from typing import List
 
 from sqlalchemy.orm import Session, sessionmaker
 
-from models.csv_file import CsvFile
+from models.csv_file import CsvFile, CsvStats
 from models.db_models import CsvFileDB
 from exceptions.not_found import NotFoundException
 from exceptions.forbidden_exception import ForbiddenException
@@ -12,6 +12,13 @@ from exceptions.domain import DomainException
 from log import logger
 
 
+def _to_csv_file(row: CsvFileDB) -> CsvFile:
+    return CsvFile(id=row.id, user_id=row.user_id,
+                   name=row.name, created_at=row.created_at,
+                   is_sample=row.is_sample,
+                   stats=CsvStats.model_validate(row.stats) if row.stats is not None else None)
+
+
 class CSVRelativeRepository:
 
     def __init__(self, session_factory: sessionmaker[Session]) -> None:
@@ -24,9 +31,7 @@ class CSVRelativeRepository:
                 session.add(db_file)
                 session.commit()
                 session.refresh(db_file)
-                return CsvFile(id=db_file.id, user_id=db_file.user_id,
-                               name=db_file.name, created_at=db_file.created_at,
-                               is_sample=db_file.is_sample)
+                return _to_csv_file(db_file)
         except DomainException:
             raise
         except Exception as e:
@@ -38,9 +43,7 @@ class CSVRelativeRepository:
         try:
             with self.session_factory() as session:
                 rows = session.query(CsvFileDB).filter(CsvFileDB.user_id == user_id).all()
-                return [CsvFile(id=r.id, user_id=r.user_id,
-                                name=r.name, created_at=r.created_at,
-                                is_sample=r.is_sample) for r in rows]
+                return [_to_csv_file(r) for r in rows]
         except DomainException:
             raise
         except Exception as e:
@@ -56,9 +59,7 @@ class CSVRelativeRepository:
                 ).first()
                 if row is None:
                     raise NotFoundException(f"CSV file '{id}' not found")
-                return CsvFile(id=row.id, user_id=row.user_id,
-                               name=row.name, created_at=row.created_at,
-                               is_sample=row.is_sample)
+                return _to_csv_file(row)
         except DomainException:
             raise
         except Exception as e:
@@ -66,6 +67,21 @@ class CSVRelativeRepository:
             traceback.print_exc()
             raise InternalServerException()
 
+    def set_stats(self, id: str, stats: CsvStats):
+        try:
+            with self.session_factory() as session:
+                row = session.query(CsvFileDB).filter(CsvFileDB.id == id).first()
+                if row is None:
+                    raise NotFoundException(f"CSV file '{id}' not found")
+                row.stats = stats.model_dump()
+                session.commit()
+        except DomainException:
+            raise
+        except Exception as e:
+            logger.error(f"error while saving csv file stats: {e}")
+            traceback.print_exc()
+            raise InternalServerException()
+
     def delete(self, id: str, user_id: str):
         try:
             with self.session_factory() as session:
@@ -0,0 +1,105 @@
+import os
+import tempfile
+from typing import Any, List
+
+import numpy as np
+
+from exceptions.domain import DomainException
+from exceptions.test_exception import TestException
+from log import logger
+from repository.csv_disk_repository import CsvDiskRepository
+
+
+def test_csv_parse_columns():
+    """
+    Классы нумеруются в порядке первого появления, пустая колонка в конце заголовка
+    не считается меткой, короткая строка — DomainException, one-hot строится при первом обращении.
+    """
+    errors: List[Any] = list()
+    with tempfile.TemporaryDirectory() as directory:
+        repo = CsvDiskRepository(directory)
+        repo.save("iris", (
+            "id,a,b,label,\n"
+            "1,0.5,1,virginica,\n"
+            "2,1.5,2,setosa,\n"
+            "\n"
+            "3,2.5,3,virginica,\n"
+        ).encode())
+        columns = repo._parse_columns("iris")
+
+        if columns.classes != ["virginica", "setosa"]:
+            errors.append(("classes", columns.classes))
+        if columns.labels.tolist() != [0, 1, 0]:
+            errors.append(("labels", columns.labels.tolist()))
+        if not np.array_equal(columns.features, [[0.5, 1.0], [1.5, 2.0], [2.5, 3.0]]):
+            errors.append(("features", columns.features.tolist()))
+
+        if columns._class_marks is not None:
+            errors.append(("class_marks built eagerly",))
+        if not np.array_equal(columns.class_marks, [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]):
+            errors.append(("class_marks", columns.class_marks.tolist()))
+        if columns._class_marks is None:
+            errors.append(("class_marks not cached",))
+
+        repo.save("short", b"id,a,b,label\n1,0.5,1,virginica\n2,1.5\n")
+        try:
+            repo._parse_columns("short")
+            errors.append(("short row", "no exception"))
+        except DomainException:
+            pass
+
+    if errors:
+        raise TestException(f" errors: {errors}")
+    logger.info("test_csv_parse_columns complete!")
+
+
+def test_csv_sidecars():
+    """
+    Второе чтение берёт столбцы из .npy (memory-mapped), изменённый мимо ``save`` CSV разбирается
+    заново, а ``save`` и ``delete`` удаляют .npy и meta.json.
+    """
+    errors: List[Any] = list()
+    with tempfile.TemporaryDirectory() as directory:
+        repo = CsvDiskRepository(directory)
+        meta_path = os.path.join(directory, "iris.meta.json")
+        sidecars = [meta_path] + [os.path.join(directory, f"iris.{n}.npy") for n in ("features", "labels", "bounds")]
+
+        repo.save("iris", b"id,a,b,label\n1,0.5,1,x\n2,1.5,4,y\n")
+        parsed = repo.get_columns("iris")
+        if not all(os.path.exists(p) for p in sidecars):
+            errors.append(("sidecars not written", os.listdir(directory)))
+
+        loaded = repo.get_columns("iris")
+        if not isinstance(loaded.features, np.memmap):
+            errors.append(("not loaded from sidecars", type(loaded.features)))
+        if (
+            not np.array_equal(loaded.features, parsed.features)
+            or not np.array_equal(loaded.labels, parsed.labels)
+            or loaded.classes != parsed.classes
+            or not np.array_equal(loaded.bounds[0], [0.5, 1.0])
+            or not np.array_equal(loaded.bounds[1], [1.5, 4.0])
+        ):
+            errors.append(("round-trip", loaded.features.tolist(), loaded.labels.tolist(), loaded.classes))
+        del loaded  # отображённые в память файлы иначе не удалить в Windows
+
+        # CSV переписан в обход save: другая версия, .npy устарели
+        with open(repo.get_file("iris"), "wb") as f:
+            f.write(b"id,a,b,label\n1,7,8,z\n")
+        os.utime(repo.get_file("iris"), ns=(1, 1))
+        changed = repo.get_columns("iris")
+        if isinstance(changed.features, np.memmap) or changed.features.tolist() != [[7.0, 8.0]] or changed.classes != ["z"]:
+            errors.append(("stale sidecars used", changed.features.tolist(), changed.classes))
+
+        repo.save("iris", b"id,a,b,label\n1,0.5,1,x\n")
+        if any(os.path.exists(p) for p in sidecars):
+            errors.append(("sidecars kept after save", os.listdir(directory)))
+
+        del changed
+        repo.get_columns("iris")
+        repo.delete("iris")
+        if os.listdir(directory):
+            errors.append(("files kept after delete", os.listdir(directory)))
+
+    if errors:
+        raise TestException(f" errors: {errors}")
+    logger.info("test_csv_sidecars complete!")
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Any
+from typing import Any, Tuple
 
 from exceptions.not_found import NotFoundException
 from models.progect_nn import NNData
@@ -28,6 +28,14 @@ class WeightsDiskRepository:
             raise NotFoundException(f"Weights file '{id}' not found")
         os.remove(path)
 
+    def get_version(self, id: str) -> Tuple[int, int]:
+        """(mtime_ns, size) файла весов: меняется при каждой перезаписи, в том числе из другого процесса."""
+        try:
+            st = os.stat(os.path.join(self.directory, f"{id}.json"))
+        except FileNotFoundError:
+            raise NotFoundException(f"Weights file '{id}' not found")
+        return st.st_mtime_ns, st.st_size
+
     def get_by_id(self, id:str) -> NNData:
         weights_path: str = os.path.join(self.directory, f"{id}.json")
         if not os.path.exists(weights_path):
@@ -1,10 +1,11 @@
 import os
 import traceback
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from models.csv_file import CsvFile, CsvFileData
+from models.csv_file import CsvColumns, CsvFile, CsvStats
 from repository.csv_disk_repository import CsvDiskRepository
 from repository.csv_postgres_repository import CSVRelativeRepository
+from lib.utils.sized_lru_cache import SizedLRUCache
 from exceptions.domain import DomainException
 from exceptions.internal_server_exception import InternalServerException
 from log import logger
@@ -13,9 +14,11 @@ from config import config
 
 
 class CsvService:
-    def __init__(self, disk_repo: CsvDiskRepository, relative_repo: CSVRelativeRepository):
+    def __init__(self, disk_repo: CsvDiskRepository, relative_repo: CSVRelativeRepository,
+                 columns_cache: Optional[SizedLRUCache[CsvColumns]] = None):
         self.disk_repo = disk_repo
         self.relative_repo = relative_repo
+        self.columns_cache = columns_cache
 
     def save(self, user_id: str, content: bytes, name: str) -> CsvFile:
         try:
@@ -38,8 +41,22 @@ class CsvService:
             traceback.print_exc()
             raise InternalServerException()
 
+        file.stats = self._save_stats(file.id)
         return file
 
+    def _save_stats(self, file_id: str) -> Optional[CsvStats]:
+        """
+        Разбирает только что сохранённый CSV (заодно появляются .npy рядом с ним) и записывает
+        статистику в БД. Файл с ошибкой формата принимается как раньше — она всплывёт при создании проекта.
+        """
+        try:
+            stats = self._load_columns(file_id).stats()
+            self.relative_repo.set_stats(file_id, stats)
+        except DomainException as e:
+            logger.warning(f"csv file '{file_id}' saved without stats: {e}")
+            return None
+        return stats
+
     def init_samples(self, user_id: str):
         self.init_sample("sample_Iris.csv", user_id)
         self.init_sample("sample_colors.csv", user_id)
@@ -55,11 +72,37 @@ class CsvService:
 
     def delete(self, user_id: str, file_id: str):
         self.relative_repo.delete(file_id, user_id)
+        if self.columns_cache is not None:
+            self.columns_cache.invalidate(file_id)
         self.disk_repo.delete(file_id)
 
-    def get_data(self, file_id: str, user_id: str) -> CsvFileData:
+    def get_columns(self, file_id: str, user_id: str) -> CsvColumns:
+        """
+        Разобранный CSV: из кэша процесса, иначе из .npy рядом с файлом, иначе разбор CSV
+        (см. :meth:`CsvDiskRepository.get_columns`). Запись кэша привязана к mtime/размеру CSV.
+        """
         self.relative_repo.get_by_id(file_id, user_id)
-        return self.disk_repo.get_data(file_id)
+        return self._load_columns(file_id)
+
+    def get_stats(self, file_id: str, user_id: str) -> CsvStats:
+        """Статистика из БД; для файлов, загруженных до её появления, считается здесь и сохраняется."""
+        file = self.relative_repo.get_by_id(file_id, user_id)
+        if file.stats is not None:
+            return file.stats
+        stats = self._load_columns(file_id).stats()
+        self.relative_repo.set_stats(file_id, stats)
+        return stats
+
+    def _load_columns(self, file_id: str) -> CsvColumns:
+        if self.columns_cache is None:
+            return self.disk_repo.get_columns(file_id)
+
+        version = self.disk_repo.get_version(file_id)
+        columns = self.columns_cache.get(file_id, version)
+        if columns is None:
+            columns = self.disk_repo.get_columns(file_id)
+            self.columns_cache.put(file_id, version, columns, columns.nbytes)
+        return columns
     
     def get_file(self, user_id: str, file_id: str) -> str:
         self.relative_repo.get_by_id(file_id, user_id)
@@ -1,8 +1,12 @@
+from typing import Optional
+
 import numpy as np
 import numpy.typing as npt
 
-from lib.kohonen.decreasing import decreasing_linear_rate, decreasing_linear_sigma
+from lib.kohonen.decreasing import DecreasingSchedule
 from lib.kohonen.initialization import initialize_som_weights_pca_grid
+from lib.kohonen.models.enums import DecayType, SomTrainingMode
+from lib.kohonen.models.compiled_kohonen import CompiledKohonen
 from lib.kohonen.normalization import min_max_normalize, normalize_samples_min_max
 from lib.kohonen.neighbour_function import INeighbourFunction
 from lib.kohonen.topologic_distance import ITopologicCalculator
@@ -12,6 +16,10 @@ from lib.kohonen.visualisation import (
     get_u_matrix_visualisation,
 )
 from lib.kohonen.weights_updator import WeightApdator
+from lib.kohonen.weights_updator.batch import BatchWeightApdator
+from models.progect_nn import ProjectType, ProjectWithData
+from exceptions import ArgumentException
+from log import logger
 
 
 class KohonenNetworkService:
@@ -74,14 +82,26 @@ class KohonenNetworkService:
         vector_distance_calc: IVectorDistanceCalculator,
         top_dist_calc: ITopologicCalculator,
         neighbour_func: INeighbourFunction,
+        mode: SomTrainingMode = SomTrainingMode.ONLINE,
+        neighbourhood_cutoff: Optional[float] = None,
+        decay_type: DecayType = DecayType.LINEAR,
     ) -> npt.NDArray[np.float64]:
         """
         Обучение SOM: ``epochs`` проходов по выборке; на каждом глобальном шаге скорость
-        и ``sigma`` задаются :func:`decreasing_linear_rate` и :func:`decreasing_linear_sigma`
-        из ``lib.kohonen.decreasing``. Выборка один раз нормализуется через
+        и ``sigma`` убывают по расписанию ``decay_type`` (:class:`DecreasingSchedule`
+        из ``lib.kohonen.decreasing``), посчитанному массивом на эпоху. Выборка один раз нормализуется через
         :func:`normalize_samples_min_max` по ``mins``/``maxs`` (построчно то же, что
         :func:`min_max_normalize` в :meth:`predict`).
 
+        ``mode == BATCH`` — batch SOM (:class:`BatchWeightApdator`): за эпоху победители всех
+        примеров находятся одним матричным произведением, веса пересчитываются один раз,
+        ``sigma`` убывает по эпохам, а скорость обучения не используется. Сходится за десятки эпох.
+
+        ``neighbourhood_cutoff = k`` — соседство нейронов дальше ``k * sigma`` от победителя
+        считается нулём; в online-режиме обновляется только окно сетки вокруг победителя
+        (:meth:`WeightApdator.update_weights_in_window`), и поздние шаги с малым ``sigma``
+        стоят O(окна), а не O(карты).
+
         **Дополнительно для «полного» цикла (по желанию):** критерий остановки по
         качеству карты, валидация, сохранение чекпоинтов.
         """
@@ -94,6 +114,8 @@ class KohonenNetworkService:
             )
         if epochs < 1:
             raise ValueError(f"epochs must be >= 1, got {epochs}")
+        if neighbourhood_cutoff is not None and neighbourhood_cutoff <= 0:
+            raise ValueError(f"neighbourhood_cutoff must be > 0, got {neighbourhood_cutoff}")
 
         dim = samples.shape[1]
         lo = np.asarray(mins, dtype=np.float64).ravel()
@@ -107,26 +129,37 @@ class KohonenNetworkService:
         n_samples = samples.shape[0]
         total_steps = epochs * n_samples
         normalized_samples = normalize_samples_min_max(samples, lo, hi)
+
+        if mode == SomTrainingMode.BATCH:
+            batch_updator = BatchWeightApdator(top_dist_calc, neighbour_func)
+            sigmas = DecreasingSchedule.sigma(decay_type, epochs, sigma_start, sigma_end).values().tolist()
+            for sigma in sigmas:
+                radius = neighbourhood_cutoff * sigma if neighbourhood_cutoff is not None else None
+                batch_updator.update_weights(weights, normalized_samples, sigma, radius)
+            return weights
+
         weight_updator = WeightApdator(
             top_dist_calc, neighbour_func, learning_rate_start
         )
-        global_step = 0
-        for _ in range(epochs):
+        lr_schedule = DecreasingSchedule.learning_rate(
+            decay_type, total_steps, learning_rate_start, learning_rate_end
+        )
+        sigma_schedule = DecreasingSchedule.sigma(decay_type, total_steps, sigma_start, sigma_end)
+        for epoch in range(epochs):
             order = np.random.permutation(n_samples)
-            for idx in order:
-                x = normalized_samples[int(idx)]
-                lr = decreasing_linear_rate(
-                    global_step, total_steps, learning_rate_start, learning_rate_end
-                )
-                sigma = decreasing_linear_sigma(
-                    global_step, total_steps, sigma_start, sigma_end
-                )
+            first_step = epoch * n_samples
+            lrs = lr_schedule.values(first_step, n_samples).tolist()
+            sigmas = sigma_schedule.values(first_step, n_samples).tolist()
+            for idx, lr, sigma in zip(order.tolist(), lrs, sigmas):
+                x = normalized_samples[idx]
                 distances = vector_distance_calc.perform(weights, x)
-                output_vector = -distances
-                weight_updator.update_weights(
-                    weights, lr, output_vector, x, sigma
-                )
-                global_step += 1
+                winner = int(np.argmin(distances))
+                if neighbourhood_cutoff is None:
+                    weight_updator.update_weights_by_winner(weights, lr, winner, x, sigma)
+                else:
+                    weight_updator.update_weights_in_window(
+                        weights, lr, winner, x, sigma, neighbourhood_cutoff * sigma
+                    )
         return weights
 
     def predict(
@@ -142,6 +175,15 @@ class KohonenNetworkService:
         winner_idx = np.argmin(distances)
         return np.array([float(winner_idx)], dtype=np.float64)
 
+    def compile(self, project: ProjectWithData) -> CompiledKohonen:
+        """Готовая к инференсу карта проекта (см. :meth:`ProjectsService.get_compiled_model`)."""
+        if project.project_type != ProjectType.KOHONEN:
+            e_str = "project is not a Kohonen network"
+            logger.error(e_str)
+            raise ArgumentException(e_str, is_public=True)
+
+        return CompiledKohonen.compile(project.nn_data.weights[0], project.nn_data.mins, project.nn_data.maxs)
+
     def get_component_matrix_visualisation(
         self,
         weights: npt.NDArray[np.float64],
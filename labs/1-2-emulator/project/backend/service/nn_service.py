@@ -1,62 +1,143 @@
-import copy
-import random
-from typing import List, Tuple
+import time
+from typing import List, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
 
-from lib.perceptrone.models.activation import ActivationType
+from lib.perceptrone.models.activation import ActivationType, IActivation
+from lib.perceptrone.learning_rate import ReduceOnPlateau, build_learning_rate_schedule
+from lib.perceptrone.models.learning_rate import LearningRateScheduleType
+from lib.perceptrone.models.optimizer import OptimizerType
+from lib.perceptrone.models.training import LossEvaluationMode, ParallelMode, TrainingResult
 from lib.perceptrone.training.activation.activation import ActivationType, ACTIVATIONS, SoftMax
-from lib.perceptrone.forwrdpropagation.forward_propagation import forward_propagation
-from lib.perceptrone.loss import LossType, LOSSES
-from lib.perceptrone.mathh.models import Sample, Perceptron
-from lib.perceptrone.mathh.mv import (
-    apply_adjustments,
-    init_perceptron as build_perceptron,
-    min_max_samples_normalaize,
-    min_max_signs_normalize,
+from lib.perceptrone.forwrdpropagation.vectorized_forward_propagation import (
+    forward_layers,
+    forward_layers_into,
+    vectorized_forward_propagation,
 )
-from lib.perceptrone.training.backpropagation import BackPropagation
+from lib.perceptrone.loss import ILoss, LossType, LOSSES, softmax_cross_entropy_loss
+from lib.perceptrone.mathh.models import CompactPerceptron, CompiledPerceptron
+from lib.perceptrone.mathh.mv import init_perceptron as build_perceptron
+from lib.perceptrone.mathh.np_mv import min_max_bounds, min_max_matrix_normalize, to_layer_arrays
+from lib.perceptrone.training.early_stopping import EarlyStopping
+from lib.perceptrone.training.optimizer import build_optimizer
+from lib.perceptrone.training.parallel_training import ParallelTrainer, parallel_utilization, resolve_workers
+from lib.perceptrone.training.training_workspace import TrainingWorkspace
+from lib.perceptrone.training.vectorized_backpropagation import VectorizedBackPropagation
 from lib.perceptrone.visualisation.visualisation import get_visualisation as _get_visualisation, ColorTheme
+from models.progect_nn import ProjectType, ProjectWithData
+from exceptions import ArgumentException
+from log import logger
+
+
+def _mean_loss(
+    layers: List[npt.NDArray[np.float64]],
+    activations: List[IActivation],
+    loss: ILoss,
+    signs_matrix: npt.NDArray[np.float64],
+    marks_matrix: npt.NDArray[np.float64],
+) -> float:
+    """
+    Средний loss по всем примерам одним матричным прямым проходом.
+
+    Для soft-max + cross-entropy loss считается по логитам выходного слоя через log-sum-exp
+    (без вычисления вероятностей и клипа log(0)), поэтому soft-max, как и при обучении, не применяется.
+    """
+    fused = activations[-1].get_type() == ActivationType.SOFTMAX and loss.get_type() == LossType.CROSS_ENTROPY
+    layer_outputs, _ = forward_layers(signs_matrix, layers, activations, output_activation=not fused)
+
+    if fused:
+        return float(np.mean(softmax_cross_entropy_loss(layer_outputs[-1], marks_matrix)))
+
+    return float(np.mean(loss.perform_batch(marks_matrix, layer_outputs[-1])))
+
+
+def _normalized(
+    signs: npt.NDArray[np.float64],
+    bounds: Optional[Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = None,
+) -> npt.NDArray[np.float64]:
+    """
+    Min-max нормализация признаков по ``bounds`` = (mins, maxs); без них — по границам самой выборки
+    (как при инициализации проекта).
+    """
+    mins, maxs = bounds if bounds is not None else min_max_bounds(signs)
+    return min_max_matrix_normalize(signs, mins=mins, maxs=maxs)  # type: ignore[arg-type]
 
 
 class NNService:
 
-    def init_perceptron(
-        self,
-        architecture: List[int],
-        samples: List[Sample],
-    ) -> Tuple[List[List[List[float]]], List[float], List[float]]:
+    def init_perceptron(self, architecture: List[int]) -> List[List[List[float]]]:
         """
-        Возвращает (weights, mins, maxs).
+        Случайные начальные веса; границы нормализации (mins, maxs) проекта берутся
+        из статистики CSV (:class:`CsvStats`), посчитанной при загрузке.
         """
-        weights = build_perceptron(architecture)
-
-        signs_count = len(samples[0].signs)
-        classes_count = len(samples[0].class_marks)
-        _, mins, maxs = min_max_samples_normalaize(
-            samples, signs_count=signs_count, classes_count=classes_count,
-        )
-
-        return weights, mins, maxs
+        return build_perceptron(architecture)
 
     def train(
         self,
         weights: List[List[List[float]]],
-        samples: List[Sample],
+        signs: npt.NDArray[np.float64],
+        class_marks: npt.NDArray[np.float64],
         activation_type: ActivationType,
         loss_type: LossType,
         softmax_use: bool,
         epochs: int,
         learning_rate: float,
-    ) -> List[List[List[float]]]:
-        """Обучает перцептрон (мутирует weights in-place)."""
-        signs_count = len(samples[0].signs)
-        classes_count = len(samples[0].class_marks)
+        batch_size: int = 1,
+        loss_evaluation: LossEvaluationMode = LossEvaluationMode.FULL,
+        loss_evaluation_interval: int = 1,
+        loss_evaluation_subsample: int = 1000,
+        early_stopping_patience: int = 0,
+        early_stopping_min_delta: float = 0.0,
+        target_loss: Optional[float] = None,
+        optimizer_type: OptimizerType = OptimizerType.SGD,
+        lr_schedule: LearningRateScheduleType = LearningRateScheduleType.CONSTANT,
+        lr_decay: float = 0.5,
+        lr_step_size: int = 10,
+        lr_min: float = 0.0,
+        lr_warmup_epochs: int = 0,
+        workers: int = 1,
+        parallel_mode: ParallelMode = ParallelMode.SYNC,
+        bounds: Optional[Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = None,
+    ) -> TrainingResult:
+        """
+        Обучает перцептрон (мутирует weights in-place) и возвращает лучшие веса и их loss.
 
-        normalized_samples, _, _ = min_max_samples_normalaize(
-            samples, signs_count=signs_count, classes_count=classes_count,
-        )
+        ``signs`` — ненормализованные признаки (rows, signs_count), ``class_marks`` — one-hot (rows, classes_count),
+        ``bounds`` — готовые (mins, maxs) признаков для нормализации (иначе считаются по ``signs``).
+
+        ``batch_size == 1`` — стохастический градиентный спуск (обновление после каждого примера);
+        при ``batch_size > 1`` пакет примеров проходит через сеть одной матрицей,
+        градиенты усредняются и веса обновляются один раз на пакет.
+        Шаг по градиенту делает оптимизатор ``optimizer_type`` (SGD, момент, Нестеров, RMSProp, Adam)
+        со скоростью из расписания ``lr_schedule`` (см. :func:`build_learning_rate_schedule`);
+        для REDUCE_ON_PLATEAU скорость умножается на ``lr_decay`` после ``lr_step_size`` оценок loss без улучшения.
+
+        ``workers > 1`` — обучение на нескольких процессах (см. :class:`ParallelTrainer`) в режиме
+        ``parallel_mode``; число процессов ограничивается числом ядер и примеров. SYNC делит между
+        процессами каждый пакет, поэтому процессов не больше ``batch_size`` (при ``batch_size == 1`` —
+        обучение в одном процессе): части меньше одного примера только ждали бы остальных.
+
+        ``loss_evaluation`` задаёт, как считается loss эпохи для выбора лучших весов
+        (см. :class:`LossEvaluationMode`): ``loss_evaluation_interval`` — N для EVERY_N,
+        ``loss_evaluation_subsample`` — размер подвыборки для SUBSAMPLE.
+
+        Ранняя остановка (см. :class:`EarlyStopping`) проверяется по тому же loss эпохи:
+        ``early_stopping_patience`` оценок без улучшения больше ``early_stopping_min_delta``
+        (0 — выключено) или достижение ``target_loss``.
+        """
+        if batch_size < 1:
+            e_str = f"batch_size must be >= 1, got {batch_size}"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        if loss_evaluation_interval < 1 or loss_evaluation_subsample < 1:
+            e_str = (
+                f"loss_evaluation_interval and loss_evaluation_subsample must be >= 1, "
+                f"got {loss_evaluation_interval} and {loss_evaluation_subsample}"
+            )
+            logger.error(e_str)
+            raise ArgumentException(e_str)
 
         layers_count = len(weights) + 1
         activations = [ACTIVATIONS[activation_type]() for _ in range(layers_count - 1)]
@@ -65,97 +146,133 @@ class NNService:
         if softmax_use:
             activations[-1] = SoftMax()
 
-        perceptron = Perceptron(
-            weights=weights, activations=activations, layers_count=layers_count,
-        )
-        bp = BackPropagation(loss, learning_rate, perceptron)
+        signs_matrix = _normalized(signs, bounds)
+        marks_matrix = np.asarray(class_marks, dtype=np.float64)
+        n_samples = signs_matrix.shape[0]
 
-        best_loss = float("inf")
-        best_weights: List[List[List[float]]] = copy.deepcopy(perceptron.weights)
+        model = CompactPerceptron.from_lists(weights)
+        workers = resolve_workers(workers, n_samples, parallel_mode, batch_size)
+        trainer = ParallelTrainer(
+            parallel_mode, workers, model, signs_matrix, marks_matrix, batch_size,
+            activation_type, softmax_use, loss_type, optimizer_type,
+        ) if workers > 1 else None
 
-        for _ in range(epochs):
-            random.shuffle(normalized_samples)
-            for sample in normalized_samples:
-                outputs, weighted_sums = forward_propagation(sample.signs, perceptron)
-                adjustments = bp.training_iteration_calculate(
-                    sample.signs, outputs, sample.class_marks, weighted_sums,
-                )
-                perceptron.weights = apply_adjustments(weights, adjustments)
+        try:
+            if trainer is not None:
+                # веса обучаются в общей памяти процессов
+                model = trainer.model
+            layers = model.layers
+            bp = VectorizedBackPropagation(loss, layers, activations)
+            optimizer = build_optimizer(optimizer_type, learning_rate, model.buffer.size)
+            workspace = TrainingWorkspace(layers, min(batch_size, n_samples)) if trainer is None else None
 
-            epoch_loss = sum(
-                loss.perform(s.class_marks, forward_propagation(s.signs, perceptron)[0])
-                for s in normalized_samples
-            ) / len(normalized_samples)
+            learning_rates = build_learning_rate_schedule(
+                lr_schedule, learning_rate, epochs,
+                decay=lr_decay, step_size=lr_step_size, min_learning_rate=lr_min, warmup_epochs=lr_warmup_epochs,
+            )
+            plateau = ReduceOnPlateau(factor=lr_decay, patience=lr_step_size) \
+                if lr_schedule == LearningRateScheduleType.REDUCE_ON_PLATEAU else None
+            lr_scale = 1.0
 
-            if epoch_loss < best_loss:
-                best_loss = epoch_loss
-                best_weights = copy.deepcopy(perceptron.weights)
+            eval_signs, eval_marks = signs_matrix, marks_matrix
+            if loss_evaluation == LossEvaluationMode.SUBSAMPLE and loss_evaluation_subsample < n_samples:
+                subsample = np.sort(np.random.choice(n_samples, size=loss_evaluation_subsample, replace=False))
+                eval_signs, eval_marks = signs_matrix[subsample], marks_matrix[subsample]
 
-        for q in range(len(weights)):
-            for i in range(len(weights[q])):
-                for j in range(len(weights[q][i])):
-                    weights[q][i][j] = best_weights[q][i][j]
+            collect_loss = loss_evaluation == LossEvaluationMode.RUNNING
+            early_stopping = EarlyStopping(early_stopping_patience, early_stopping_min_delta, target_loss)
+            stopped_epoch = epochs
 
-        return best_weights
+            # Резервный буфер под лучшую эпоху выделяется один раз;
+            # улучшение loss — одно копирование буфера, восстановление — просто чтение из него.
+            best_loss = float("inf")
+            best_model = model.copy()
 
-    def predict(
-        self,
-        weights: List[List[List[float]]],
-        input_vector: List[float],
-        activation_type: ActivationType,
-        softmax_use: bool,
-        mins: List[float],
-        maxs: List[float],
-        input_size: int,
-    ) -> List[float]:
-        """Возвращает выходной вектор перцептрона."""
-        normalized_input = min_max_signs_normalize(
-            input_vector, maxs=maxs, mins=mins, signs_count=input_size,
+            started = time.perf_counter()
+            for epoch in range(epochs):
+                running_loss = 0.0
+                optimizer.learning_rate = float(learning_rates[epoch]) * lr_scale
+                order = np.random.permutation(n_samples)
+
+                if trainer is not None:
+                    running_loss = trainer.run_epoch(order, optimizer, collect_loss)
+                else:
+                    for start in range(0, n_samples, batch_size):
+                        batch_len = workspace.load_batch(  # type: ignore[union-attr]
+                            signs_matrix, marks_matrix, order[start:start + batch_size],
+                        )
+                        forward_layers_into(
+                            workspace, layers, activations, batch_len,  # type: ignore[arg-type]
+                            output_activation=not bp.fuses_softmax_cross_entropy(),
+                        )
+                        bp.calculate_gradients_into(workspace, batch_len, collect_loss=collect_loss)  # type: ignore[arg-type]
+                        optimizer.step(model.buffer, workspace.gradient_buffer)  # type: ignore[union-attr]
+                        if collect_loss:
+                            running_loss += float(np.sum(workspace.losses[:batch_len]))  # type: ignore[union-attr]
+
+                if collect_loss:
+                    epoch_loss = running_loss / n_samples
+                elif loss_evaluation == LossEvaluationMode.EVERY_N \
+                        and (epoch + 1) % loss_evaluation_interval != 0 and epoch != epochs - 1:
+                    continue
+                else:
+                    epoch_loss = _mean_loss(layers, activations, loss, eval_signs, eval_marks)
+
+                if epoch_loss < best_loss:
+                    best_loss = epoch_loss
+                    best_model.copy_from(model)
+
+                if early_stopping.should_stop(epoch_loss):
+                    stopped_epoch = epoch + 1
+                    logger.info(f"Early stopping at epoch {stopped_epoch}/{epochs}, loss={epoch_loss:.6f}")
+                    break
+
+                if plateau is not None:
+                    lr_scale = plateau.update(epoch_loss)
+
+            wall_seconds = time.perf_counter() - started
+            utilization = parallel_utilization(trainer.busy_seconds, wall_seconds) if trainer is not None else 1.0
+        finally:
+            if trainer is not None:
+                trainer.close()
+
+        best_weights = best_model.to_lists()
+        weights[:] = best_weights
+
+        # веса уже провалидированы CompactPerceptron — повторно обходить списки pydantic не нужно
+        return TrainingResult.model_construct(
+            weights=best_weights, loss=best_loss, epochs=epochs, stopped_epoch=stopped_epoch,
+            workers=workers, utilization=utilization,
         )
 
-        layers_count = len(weights) + 1
-        activations = [ACTIVATIONS[activation_type]() for _ in range(layers_count - 1)]
-        if softmax_use:
-            activations[-1] = SoftMax()
+    def compile(self, project: ProjectWithData) -> CompiledPerceptron:
+        """Готовая к инференсу модель проекта (см. :meth:`ProjectsService.get_compiled_model`)."""
+        if project.project_type != ProjectType.PERCEPTRON:
+            e_str = f"project {project.id} is not a perceptron"
+            logger.error(e_str)
+            raise ArgumentException(e_str, is_public=True)
 
-        perceptron = Perceptron(
-            weights=weights, activations=activations, layers_count=layers_count,
+        return CompiledPerceptron.compile(
+            project.nn_data.weights, project.nn_data.mins, project.nn_data.maxs, project.nn_data.classes,
         )
-        output_vector, _ = forward_propagation(normalized_input, perceptron)
-        return output_vector
 
-    def compute_loss(
+    def compute_accuracy(
         self,
         weights: List[List[List[float]]],
-        samples: List[Sample],
+        signs: npt.NDArray[np.float64],
+        labels: npt.NDArray[np.int64],
         activation_type: ActivationType,
-        loss_type: LossType,
         softmax_use: bool,
+        bounds: Optional[Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]] = None,
     ) -> float:
-        """Средний loss по всем samples на текущих весах."""
-        signs_count = len(samples[0].signs)
-        classes_count = len(samples[0].class_marks)
-
-        normalized_samples, _, _ = min_max_samples_normalaize(
-            samples, signs_count=signs_count, classes_count=classes_count,
-        )
-
+        """Доля примеров, у которых номер наибольшего выхода совпадает с номером класса ``labels``."""
         layers_count = len(weights) + 1
         activations = [ACTIVATIONS[activation_type]() for _ in range(layers_count - 1)]
         if softmax_use:
             activations[-1] = SoftMax()
 
-        perceptron = Perceptron(
-            weights=weights, activations=activations, layers_count=layers_count,
-        )
-
-        loss_fn = LOSSES[loss_type]()
-        total_loss = 0.0
-        for sample in normalized_samples:
-            outputs, _ = forward_propagation(sample.signs, perceptron)
-            total_loss += loss_fn.perform(sample.class_marks, outputs)
-
-        return total_loss / len(normalized_samples)
+        outputs, _ = vectorized_forward_propagation(_normalized(signs, bounds), to_layer_arrays(weights), activations)
+        return float(np.mean(np.argmax(outputs, axis=1) == labels))
 
     def get_visualisation(
         self,
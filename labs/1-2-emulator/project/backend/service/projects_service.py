@@ -1,5 +1,5 @@
 import traceback
-from typing import List
+from typing import Callable, Dict, List, Optional, Protocol, TypeVar
 import numpy.typing as npt
 import numpy as np
 
@@ -7,19 +7,29 @@ from models.progect_nn import Project, NNData, ProjectWithData, ProjectType
 from repository.image_disk_repository import ImageRepository
 from repository.weights_disk_repository import WeightsDiskRepository
 from repository.projects_postgres_repository import ProjectsRepository
+from lib.utils.sized_lru_cache import SizedLRUCache
 from exceptions.domain import DomainException
 from exceptions.internal_server_exception import InternalServerException
 from log import logger
 
 
+class CompiledModel(Protocol):
+    nbytes: int
+
+
+M = TypeVar("M", bound=CompiledModel)
+
+
 class ProjectsService:
 
     def __init__(self, image_repository: ImageRepository,
                  weights_disk_repository: WeightsDiskRepository,
-                 projects_repository: ProjectsRepository):
+                 projects_repository: ProjectsRepository,
+                 model_cache: Optional[SizedLRUCache[CompiledModel]] = None):
         self.image_repository = image_repository
         self.weights_disk_repository = weights_disk_repository
         self.projects_repository = projects_repository
+        self.model_cache = model_cache
 
     def create(
         self,
@@ -80,6 +90,41 @@ class ProjectsService:
             nn_data=project_data,
         )
 
+    def get_compiled_model(self, user_id: str, id: str, compile: Callable[[ProjectWithData], M]) -> M:
+        """
+        Готовая к инференсу модель проекта из кэша.
+
+        Ключ — (user_id, id): запись появляется только после успешного :meth:`get_project`,
+        поэтому попадание не обходит проверку владельца. Версия — mtime/размер файла весов
+        и сам ``compile``: веса, перезаписанные воркером Celery, не будут выданы из кэша,
+        а модель, собранная другим ``compile``, — не пройдёт мимо его проверки типа проекта.
+        При промахе проект читается целиком и собирается через ``compile``.
+        """
+        if self.model_cache is None:
+            return compile(self.get_project(user_id, id))
+
+        try:
+            version = (self.weights_disk_repository.get_version(id), compile)
+        except DomainException:
+            raise
+        except Exception as e:
+            logger.error(f"error while getting project weights version: {e}")
+            traceback.print_exc()
+            raise InternalServerException()
+
+        key = (user_id, id)
+        model = self.model_cache.get(key, version)
+        if model is None:
+            model = compile(self.get_project(user_id, id))
+            self.model_cache.put(key, version, model, model.nbytes)
+        return model  # type: ignore[return-value]
+
+    def get_model_cache_stats(self) -> Dict[str, int]:
+        """Счётчики кэша моделей этого процесса (попадания, промахи, вытеснения, занятые байты)."""
+        if self.model_cache is None:
+            return {}
+        return self.model_cache.stats()
+
     def update_weights(self, user_id: str, id: str, weights: List[List[List[float]]]):
         try:
             project_info = self.projects_repository.get_by_id(id=id, user_id=user_id)
@@ -108,6 +153,9 @@ class ProjectsService:
             traceback.print_exc()
             raise InternalServerException()
 
+        if self.model_cache is not None:
+            self.model_cache.invalidate((user_id, id))
+
     def get_projects(self, user_id: str) -> List[Project]:
         return self.projects_repository.get_all(user_id)
 
@@ -128,6 +176,9 @@ class ProjectsService:
         return self.image_repository.save_image(image_id, image)
 
     def delete_project(self, user_id: str, project_id: str):
+        if self.model_cache is not None:
+            self.model_cache.invalidate((user_id, project_id))
+
         try:
             self.projects_repository.delete(user_id, project_id)
         except DomainException:
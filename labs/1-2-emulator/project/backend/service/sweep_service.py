@@ -0,0 +1,78 @@
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+from exceptions import ArgumentException
+from log import logger
+from models.sweep import SweepRunParams, SweepRunResult, SweepSearch, SweepSpace
+
+
+class SweepService:
+
+    def build_runs(
+        self,
+        space: SweepSpace,
+        search: SweepSearch,
+        max_runs: int,
+        seed: Optional[int] = None,
+    ) -> List[SweepRunParams]:
+        """
+        Список запусков перебора.
+
+        Сочетание номер i раскладывается по основаниям длин списков ``space`` (как число
+        в смешанной системе счисления), поэтому декартово произведение не строится целиком:
+        GRID берёт все номера (их должно быть не больше ``max_runs``),
+        RANDOM — ``max_runs`` различных случайных номеров.
+        """
+        dimensions: List[Sequence[Any]] = [
+            space.hidden_layers_architectures,
+            space.activation_types,
+            space.loss_types,
+            space.softmax_use,
+            space.learning_rates,
+            space.epochs,
+        ]
+        total = 1
+        for values in dimensions:
+            total *= len(values)
+
+        if search == SweepSearch.GRID:
+            if total > max_runs:
+                e_str = f"grid search has {total} runs, but at most {max_runs} are allowed"
+                logger.error(e_str)
+                raise ArgumentException(e_str, is_public=True)
+            indices: List[int] = list(range(total))
+        else:
+            indices = random.Random(seed).sample(range(total), min(max_runs, total))
+
+        runs: List[SweepRunParams] = []
+        for index in indices:
+            choice: List[Any] = []
+            for values in dimensions:
+                index, position = divmod(index, len(values))
+                choice.append(values[position])
+            runs.append(SweepRunParams(
+                hidden_layers_architecture=choice[0],
+                activation_type=choice[1],
+                loss_type=choice[2],
+                softmax_use=choice[3],
+                learning_rate=choice[4],
+                epochs=choice[5],
+            ))
+        return runs
+
+    def pick_best(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Лучший запуск: наибольшая точность на обучающей выборке, при равенстве — меньший loss.
+
+        Точность сравнима между запусками с разными функциями потерь, а loss — нет.
+        """
+        if not results:
+            e_str = "sweep has no results"
+            logger.error(e_str)
+            raise ArgumentException(e_str)
+
+        return min(results, key=lambda r: (-r["accuracy"], r["loss"]))
+
+    def strip_weights(self, result: Dict[str, Any]) -> SweepRunResult:
+        """Результат запуска без весов — для отправки клиенту."""
+        return SweepRunResult.model_validate({k: v for k, v in result.items() if k != "weights"})
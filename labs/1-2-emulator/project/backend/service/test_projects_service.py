@@ -0,0 +1,65 @@
+import tempfile
+from typing import Any, List
+
+from exceptions import ArgumentException
+from exceptions.not_found import NotFoundException
+from exceptions.test_exception import TestException
+from lib.utils.sized_lru_cache import SizedLRUCache
+from log import logger
+from models.progect_nn import NNData, Project, ProjectType, ProjectWithData
+from repository.weights_disk_repository import WeightsDiskRepository
+from service.projects_service import ProjectsService
+
+
+class _Compiled:
+    nbytes = 8
+
+    def __init__(self, project_type: ProjectType):
+        self.project_type = project_type
+
+
+class _ProjectsRepository:
+    def get_by_id(self, user_id: str, id: str) -> Project:
+        return Project(id=id, project_type=ProjectType.PERCEPTRON, user_id=user_id, created_at=0, csv_file_id="csv")
+
+
+def _compiler(project_type: ProjectType):
+    def compile(project: ProjectWithData) -> _Compiled:
+        if project.project_type != project_type:
+            raise ArgumentException(f"project {project.id} is not {project_type}", is_public=True)
+        return _Compiled(project_type)
+    return compile
+
+
+def test_compiled_model_cache_checks_compiler():
+    """
+    Модель в кэше выдаётся только тому же ``compile``: другой проверяет тип проекта заново.
+    Без файла весов — NotFoundException с id проекта в сообщении.
+    """
+    errors: List[Any] = list()
+    with tempfile.TemporaryDirectory() as directory:
+        weights_repository = WeightsDiskRepository(directory)
+        weights_repository.create("p", NNData(weights=[[[0.0]]], input_size=1, mins=[0.0], maxs=[1.0], classes=["a"]))
+        service = ProjectsService(None, weights_repository, _ProjectsRepository(), SizedLRUCache(1024))  # type: ignore[arg-type]
+        compile_perceptron, compile_kohonen = _compiler(ProjectType.PERCEPTRON), _compiler(ProjectType.KOHONEN)
+
+        first = service.get_compiled_model("u", "p", compile_perceptron)
+        if service.get_compiled_model("u", "p", compile_perceptron) is not first:
+            errors.append(("same compiler missed the cache", service.get_model_cache_stats()))
+
+        try:
+            model = service.get_compiled_model("u", "p", compile_kohonen)
+            errors.append(("cached perceptron returned to another compiler", model.project_type))
+        except ArgumentException:
+            pass
+
+        try:
+            service.get_compiled_model("u", "missing", compile_perceptron)
+            errors.append(("missing weights", "no exception"))
+        except NotFoundException as e:
+            if "missing" not in str(e):
+                errors.append(("missing weights message", str(e)))
+
+    if errors:
+        raise TestException(f" errors: {errors}")
+    logger.info("test_compiled_model_cache_checks_compiler complete!")
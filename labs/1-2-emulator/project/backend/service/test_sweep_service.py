@@ -0,0 +1,100 @@
+import itertools
+from typing import Any, List
+
+from exceptions import ArgumentException
+from exceptions.test_exception import TestException
+from lib.perceptrone.loss import LossType
+from lib.perceptrone.models.activation import ActivationType
+from log import logger
+from models.sweep import SweepSearch, SweepSpace
+from service.sweep_service import SweepService
+
+
+def _space() -> SweepSpace:
+    return SweepSpace(
+        hidden_layers_architectures=[[2], [3, 2]],
+        activation_types=[ActivationType.SIGMOID, ActivationType.RELLU],
+        loss_types=[LossType.MSE],
+        softmax_use=[False, True],
+        learning_rates=[0.1, 0.01, 0.001],
+        epochs=[5],
+    )
+
+
+def _key(run) -> tuple:
+    return (
+        tuple(run.hidden_layers_architecture), run.activation_type, run.loss_type,
+        run.softmax_use, run.learning_rate, run.epochs,
+    )
+
+
+def test_sweep_build_runs():
+    """
+    GRID перебирает то же, что и ``itertools.product`` (первое измерение меняется быстрее всех),
+    и отказывает при числе сочетаний больше ``max_runs``; RANDOM воспроизводим по ``seed``
+    и не повторяет сочетания.
+    """
+    service = SweepService()
+    space = _space()
+    dimensions = [
+        [tuple(a) for a in space.hidden_layers_architectures], space.activation_types,
+        space.loss_types, space.softmax_use, space.learning_rates, space.epochs,
+    ]
+    total = 2 * 2 * 1 * 2 * 3 * 1
+
+    errors: List[Any] = list()
+
+    grid = [_key(run) for run in service.build_runs(space, SweepSearch.GRID, max_runs=total)]
+    expected = [tuple(reversed(c)) for c in itertools.product(*reversed(dimensions))]
+    if grid != expected:
+        errors.append(("grid order", grid, expected))
+
+    try:
+        service.build_runs(space, SweepSearch.GRID, max_runs=total - 1)
+        errors.append(("grid max_runs", "no exception"))
+    except ArgumentException:
+        pass
+
+    first = [_key(run) for run in service.build_runs(space, SweepSearch.RANDOM, max_runs=5, seed=42)]
+    second = [_key(run) for run in service.build_runs(space, SweepSearch.RANDOM, max_runs=5, seed=42)]
+    if first != second:
+        errors.append(("random seed", first, second))
+    if len(first) != 5 or len(set(first)) != 5:
+        errors.append(("random distinct", first))
+    if not set(first) <= set(expected):
+        errors.append(("random outside space", first))
+
+    capped = service.build_runs(space, SweepSearch.RANDOM, max_runs=total + 10, seed=1)
+    if sorted(map(_key, capped)) != sorted(expected):
+        errors.append(("random capped", len(capped)))
+
+    if errors:
+        raise TestException(f" errors: {errors}")
+    logger.info("test_sweep_build_runs complete!")
+
+
+def test_sweep_pick_best():
+    """Наибольшая точность; при равной точности — меньший loss; пустой список — ошибка."""
+    service = SweepService()
+    results = [
+        {"run_index": 0, "accuracy": 0.8, "loss": 0.1},
+        {"run_index": 1, "accuracy": 0.9, "loss": 0.5},
+        {"run_index": 2, "accuracy": 0.9, "loss": 0.3},
+        {"run_index": 3, "accuracy": 0.7, "loss": 0.01},
+    ]
+
+    errors: List[Any] = list()
+
+    best = service.pick_best(results)
+    if best["run_index"] != 2:
+        errors.append(("best", best))
+
+    try:
+        service.pick_best([])
+        errors.append(("empty", "no exception"))
+    except ArgumentException:
+        pass
+
+    if errors:
+        raise TestException(f" errors: {errors}")
+    logger.info("test_sweep_pick_best complete!")
@@ -1,10 +1,59 @@
-from lib.perceptrone.training.test_backpropagation import test_bp_iteration, test_apply_adjustiments
-from lib.perceptrone.mathh.test_normalization import test_min_max_function, test_min_max_samples_normalize, test_min_max_signs_normalize
+from lib.perceptrone.training.test_backpropagation import test_bp_iteration, test_vectorized_bp_iteration, test_vectorized_bp_batch_average, test_inplace_gradients_match_adjustments, test_collected_batch_losses, test_apply_adjustiments
+from lib.perceptrone.mathh.test_normalization import test_min_max_function, test_min_max_samples_normalize, test_min_max_signs_normalize, test_min_max_matrix_normalize, test_min_max_matrix_normalize_constant_column
+from lib.perceptrone.training.activation.test_activation import test_vector_activations_match_scalar, test_softmax_large_logits
+from lib.perceptrone.forwrdpropagation.test_vectorized_forward_propagation import test_vectorized_forward_matches_scalar
+from lib.perceptrone.training.test_parallel_training import test_parallel_training, test_parallel_workers_limits, test_parallel_worker_crash
+from lib.perceptrone.learning_rate.test_schedules import test_learning_rate_schedules
+from lib.perceptrone.training.optimizer.test_optimizer import test_optimizers_match_reference
+from lib.perceptrone.training.test_early_stopping import test_early_stopping
+from lib.perceptrone.loss.test_loss import test_loss_perform_batch_matches_scalar
+from lib.perceptrone.loss.test_softmax_cross_entropy import test_softmax_cross_entropy_matches_separate
+from lib.perceptrone.mathh.models.test_compact_perceptron import test_compact_perceptron_views_and_copy
+from lib.perceptrone.mathh.models.test_compiled_perceptron import test_compiled_perceptron_matches_normalized_forward
+from lib.utils.test_sized_lru_cache import test_sized_lru_cache
+from lib.kohonen.decreasing.test_schedule import test_decreasing_schedules
+from lib.kohonen.weights_updator.test_weights_updator import test_update_weights_in_window, test_batch_update_weights
+from lib.kohonen.models.test_compiled_kohonen import test_compiled_kohonen_matches_normalized_distances, test_compiled_kohonen_exact_match
+from service.test_sweep_service import test_sweep_build_runs, test_sweep_pick_best
+from service.test_projects_service import test_compiled_model_cache_checks_compiler
+from repository.test_csv_disk_repository import test_csv_parse_columns, test_csv_sidecars
+from models.test_csv_file import test_csv_columns_stats
 
 
 if __name__ == "__main__":
     test_bp_iteration()
+    test_vectorized_bp_iteration()
+    test_vectorized_bp_batch_average()
+    test_inplace_gradients_match_adjustments()
+    test_collected_batch_losses()
     test_apply_adjustiments()
     test_min_max_signs_normalize()
     test_min_max_function()
-    test_min_max_samples_normalize()
\ No newline at end of file
+    test_min_max_samples_normalize()
+    test_min_max_matrix_normalize()
+    test_min_max_matrix_normalize_constant_column()
+    test_vector_activations_match_scalar()
+    test_softmax_large_logits()
+    test_vectorized_forward_matches_scalar()
+    test_loss_perform_batch_matches_scalar()
+    test_softmax_cross_entropy_matches_separate()
+    test_compact_perceptron_views_and_copy()
+    test_compiled_perceptron_matches_normalized_forward()
+    test_early_stopping()
+    test_optimizers_match_reference()
+    test_learning_rate_schedules()
+    test_parallel_training()
+    test_parallel_workers_limits()
+    test_parallel_worker_crash()
+    test_sized_lru_cache()
+    test_decreasing_schedules()
+    test_update_weights_in_window()
+    test_batch_update_weights()
+    test_compiled_kohonen_matches_normalized_distances()
+    test_compiled_kohonen_exact_match()
+    test_sweep_build_runs()
+    test_sweep_pick_best()
+    test_csv_parse_columns()
+    test_csv_sidecars()
+    test_csv_columns_stats()
+    test_compiled_model_cache_checks_compiler()